@@ -0,0 +1,2 @@
+from .ss7_synthetic import *
+from .benchmark import *
@@ -0,0 +1,28 @@
+"""合成モデルによるベンチマーク
+
+Example:
+    python -m <package>.ss7_benchmark --scales 1 10 100 --output result.json --baseline baseline.json
+"""
+import sys
+import argparse
+from .benchmark import SCALES, run, compare, save, load, print_result
+
+
+parser: argparse.ArgumentParser = argparse.ArgumentParser(description="SS7の合成モデルで読み込み・部材の組み立て・検定の所要時間とメモリを計測する")
+parser.add_argument("--scales", type=int, nargs="+", default=SCALES, help="既定のモデルに対する倍率")
+parser.add_argument("--output", help="結果を書き出すJSONパス")
+parser.add_argument("--baseline", help="比較するJSONパス。悪化があれば終了コード1で終わる")
+parser.add_argument("--tolerance", type=float, default=0.2, help="許容する増加率")
+parser.add_argument("--no-memory", action="store_true", help="tracemallocによるメモリ計測を行わない")
+parser.add_argument("--directory", help="生成したCSVの書き出し先")
+args: argparse.Namespace = parser.parse_args()
+
+result: dict = run(args.scales, not args.no_memory, args.directory)
+print_result(result)
+if args.output is not None:
+    save(result, args.output)
+if args.baseline is not None:
+    regressions: list[dict] = compare(result, load(args.baseline), args.tolerance)
+    for r in regressions:
+        print(f'悪化: {r["scale"]}倍\t{r["stage"]}\t{r["metric"]}\t{r["baseline"]} -> {r["current"]}')
+    sys.exit(1 if len(regressions) > 0 else 0)
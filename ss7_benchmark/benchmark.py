@@ -0,0 +1,172 @@
+import os
+import json
+import time
+import platform
+import tempfile
+import tracemalloc
+from typing import Any, Callable
+from .ss7_synthetic import SS7_Synthetic
+from .. import ss7_io
+from .. import ss7_tool
+
+
+SCALES: list[int] = [1, 10, 100]
+
+
+def measure(func: Callable, memory: bool = True) -> tuple[Any, dict]:
+    """funcを実行し、(戻り値, {"seconds", "peak_bytes", "count"})を返す
+
+    例外が起きた場合は戻り値をNoneとし、"error"に例外を記録する。
+    """
+    record: dict = {}
+    result: Any = None
+    if memory:
+        tracemalloc.start()
+    start: float = time.perf_counter()
+    try:
+        result = func()
+    except Exception as e:
+        record["error"] = repr(e)
+    record["seconds"] = time.perf_counter() - start
+    if memory:
+        record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if isinstance(result, list):
+        record["count"] = len(result)
+    return result, record
+
+
+def wall_strengths(walls: list) -> list[float]:
+    """全ての耐震壁の正負両方向の終局せん断強度(靭性指針式)を計算する"""
+    result: list[float] = []
+    for wall in walls:
+        result += wall.over_loads(wall.jinsei_ultimate_strength).tolist()
+    return result
+
+
+def lazy_pushdown(walls: list) -> list[int]:
+    """ない載荷ケースの検定値を引いても、未結合の表を結合しないことを確かめる。結合した場合はRuntimeError
+
+    Returns:
+        [前後の未結合の表の数]
+    """
+    store: ss7_tool.Member_Store = type(walls[0])._store
+    pending: int = len(store.pending)
+    walls[0].has_test("hinge_rotation", "G+P")
+    hasattr(walls[0], "test_gpp_undeclared")
+    if len(store.pending) != pending:
+        raise RuntimeError(f"lazy_pushdown: 未結合の表が{pending}から{len(store.pending)}に減りました")
+    return [pending, len(store.pending)]
+
+
+def run_scale(scale: int, directory: str, memory: bool = True, **kwargs) -> dict:
+    """scale倍のモデルを生成し、読み込み・部材の組み立て・耐震壁の検定の各段階を計測する"""
+    model: SS7_Synthetic = SS7_Synthetic.scaled(scale, **kwargs)
+    input: str = os.path.join(directory, f"input_{scale}.csv")
+    output: str = os.path.join(directory, f"output_{scale}.csv")
+    model.write(input, output)
+
+    stages: dict[str, dict] = {}
+    with ss7_tool.profiling():
+        io: ss7_io.SS7_IO
+        io, stages["SS7_Reader"] = measure(lambda: ss7_io.SS7_IO(input, output), memory)
+        walls: list = []
+        if io is not None:
+            walls, stages["SS7_IO.walls"] = measure(io.walls, memory)
+            _, stages["SS7_IO.rc_columns"] = measure(io.rc_columns, memory)
+            _, stages["SS7_IO.multi_span_shear_walls"] = measure(io.multi_span_shear_walls, memory)
+        if walls is not None and len(walls) > 0:
+            _, stages["lazy_pushdown"] = measure(lambda: lazy_pushdown(walls), memory)
+            _, stages["wall_strengths"] = measure(lambda: wall_strengths(walls), memory)
+        profile: dict = ss7_tool.stats()
+    return {
+        "scale": scale,
+        "size": model.size() | {"bytes": os.path.getsize(input) + os.path.getsize(output)},
+        "stages": stages,
+        "profile": profile,
+    }
+
+
+def run(scales: list[int] = SCALES, memory: bool = True, directory: str | None = None, **kwargs) -> dict:
+    """各倍率のモデルでベンチマークを実行し、結果を辞書で返す
+
+    Args:
+        - scales: 既定のモデルに対する倍率
+        - memory: tracemallocでピークメモリも計測する(計測中は実行が遅くなる)
+        - directory: 生成したCSVの書き出し先。省略すると一時ディレクトリ
+        - kwargs: SS7_Syntheticに渡す引数(x_spans, floors, walls, openings, loads, seed)
+    """
+    with tempfile.TemporaryDirectory() as temp:
+        return {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "memory": memory,
+            "results": [
+                run_scale(scale, directory if directory is not None else temp, memory, **kwargs)
+                for scale in scales
+            ],
+        }
+
+
+def compare(result: dict, baseline: dict, tolerance: float = 0.2, minimum_seconds: float = 0.01) -> list[dict]:
+    """resultをbaselineと比べ、悪化した段階の一覧を返す
+
+    Args:
+        - tolerance: 許容する増加率。0.2なら1.2倍を超えたものを悪化とする
+        - minimum_seconds: これより短い所要時間はばらつきとみなして比べない
+
+    - 所要時間(seconds)とピークメモリ(peak_bytes)を比べる
+    - baselineで成功していた段階が失敗した場合も悪化とする
+    """
+    regressions: list[dict] = []
+    baselines: dict[int, dict] = {r["scale"]: r for r in baseline["results"]}
+    for current in result["results"]:
+        if current["scale"] not in baselines:
+            continue
+        for stage, record in current["stages"].items():
+            base: dict = baselines[current["scale"]]["stages"].get(stage)
+            if base is None:
+                continue
+            if "error" in record and "error" not in base:
+                regressions.append({
+                    "scale": current["scale"], "stage": stage, "metric": "error",
+                    "baseline": None, "current": record["error"], "ratio": None,
+                })
+                continue
+            for metric in ["seconds", "peak_bytes"]:
+                if metric not in record or metric not in base:
+                    continue
+                if metric == "seconds" and max(record[metric], base[metric]) < minimum_seconds:
+                    continue
+                ratio: float = record[metric] / base[metric] if base[metric] > 0 else float("inf")
+                if ratio > 1 + tolerance:
+                    regressions.append({
+                        "scale": current["scale"], "stage": stage, "metric": metric,
+                        "baseline": base[metric], "current": record[metric], "ratio": ratio,
+                    })
+    return regressions
+
+
+def save(result: dict, filename: str) -> None:
+    with open(filename, "w", encoding="utf-8") as fp:
+        json.dump(result, fp, ensure_ascii=False, indent=2)
+
+
+def load(filename: str) -> dict:
+    with open(filename, "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def print_result(result: dict) -> None:
+    """段階ごとの所要時間とピークメモリを表形式で出力する"""
+    print("\t".join(["scale", "stage", "seconds", "peak_MiB", "count", "error"]))
+    for current in result["results"]:
+        for stage, record in current["stages"].items():
+            print("\t".join([
+                str(current["scale"]),
+                stage,
+                f'{record["seconds"]:.3f}',
+                f'{record["peak_bytes"] / 2 ** 20:.1f}' if "peak_bytes" in record else "",
+                str(record.get("count", "")),
+                record.get("error", ""),
+            ]))
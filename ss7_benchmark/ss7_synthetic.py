@@ -0,0 +1,330 @@
+import random
+
+
+def axis_names(count: int, numeric: bool) -> list[str]:
+    """通り芯名を返す。numericなら"1", "2", ...、そうでなければ"A", "B", ..., "AA", ..."""
+    if numeric:
+        return [str(i + 1) for i in range(count)]
+    names: list[str] = []
+    for i in range(count):
+        name: str = ""
+        i += 1
+        while i > 0:
+            i, r = divmod(i - 1, 26)
+            name = chr(ord("A") + r) + name
+        names.append(name)
+    return names
+
+
+class SS7_Synthetic:
+    """構造的に正しい架空のSS7入出力CSVを生成するクラス
+    """
+    x_spans: int
+    y_spans: int
+    floors: int
+    walls: int
+    openings: int
+    loads: list[str]
+    seed: int
+
+    def __init__(
+        self,
+        x_spans: int = 4,
+        y_spans: int = 2,
+        floors: int = 5,
+        walls: int = 2,
+        openings: int = 2,
+        loads: list[str] = ("DSX+", "DSX-", "DSY+", "DSY-"),
+        seed: int = 0,
+    ) -> None:
+        """
+        Args:
+            - x_spans: X方向スパン数
+            - y_spans: Y方向スパン数
+            - floors: 階数
+            - walls: 各Y通り(X方向フレーム)の左端から連続して配置する耐震壁のスパン数
+            - openings: 耐震壁1枚あたりの開口数
+            - loads: 二次設計の載荷ケース
+            - seed: 乱数の種
+        """
+        self.x_spans = x_spans
+        self.y_spans = y_spans
+        self.floors = floors
+        self.walls = min(walls, x_spans)
+        self.openings = openings
+        self.loads = list(loads)
+        self.seed = seed
+
+    @classmethod
+    def scaled(cls, scale: int, **kwargs) -> "SS7_Synthetic":
+        """既定のモデル(3フレーム×5階)のフレーム数をscale倍したモデル
+
+        節点・耐震壁・応力表の行数がscale倍になる。
+        """
+        return cls(y_spans=3 * scale - 1, **kwargs)
+
+    def size(self) -> dict[str, int]:
+        """モデルの規模(節点数, 耐震壁数, 開口数, 梁数, 載荷ケース数)"""
+        return {
+            "nodes": len(self.nodes()),
+            "walls": len(self.wall_spans()),
+            "openings": len(self.wall_spans()) * self.openings,
+            "beams": len(self.beam_spans()),
+            "loads": len(self.loads),
+        }
+
+    def frames(self) -> list[str]:
+        """X方向のフレーム(Y通り)"""
+        return axis_names(self.y_spans + 1, numeric=False)
+
+    def axes(self) -> list[str]:
+        """X方向の通り芯(X通り)"""
+        return axis_names(self.x_spans + 1, numeric=True)
+
+    def floor_names(self) -> list[str]:
+        """上階から順に並べた階名"""
+        return [str(i) for i in range(self.floors, 0, -1)]
+
+    def nodes(self) -> list[tuple[str, str, str]]:
+        return [(f, x, y) for f in self.floor_names() for x in self.axes() for y in self.frames()]
+
+    def wall_spans(self) -> list[tuple[str, str, str, str]]:
+        axes: list[str] = self.axes()
+        return [
+            (f, frame, axes[i], axes[i + 1])
+            for f in self.floor_names() for frame in self.frames() for i in range(self.walls)
+        ]
+
+    def multi_span_walls(self) -> list[tuple[str, str, str, str]]:
+        axes: list[str] = self.axes()
+        return [
+            (f, frame, axes[0], axes[self.walls])
+            for f in self.floor_names() for frame in self.frames()
+        ] if self.walls > 1 else []
+
+    def beam_spans(self) -> list[tuple[str, str, str, str]]:
+        axes: list[str] = self.axes()
+        return [
+            (f, frame, axes[i], axes[i + 1])
+            for f in self.floor_names() for frame in self.frames() for i in range(self.walls, self.x_spans)
+        ]
+
+    @staticmethod
+    def section(name: list[str], header: list[list[str]], rows: list[list]) -> str:
+        """1セクション分のCSV文字列を返す。rowsの各要素は1レコード(複数行可)
+
+        レコードがなければセクション自体を出力しない。
+        """
+        if len(rows) == 0:
+            return ""
+        lines: list[str] = [f"name={','.join(name)}"]
+        lines += [",".join(row) for row in header]
+        lines.append("<data>")
+        for record in rows:
+            record_lines: list[str] = [",".join(str(col) for col in line) for line in record]
+            record_lines[-1] += ",<RE>"
+            lines += record_lines
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def key_value(name: list[str], rows: list[list[str]]) -> str:
+        lines: list[str] = [f"name={','.join(name)}", "項目,値", "<data>"]
+        lines += [",".join(row) for row in rows]
+        return "\n".join(lines) + "\n"
+
+    def input_text(self) -> str:
+        frames: list[str] = self.frames()
+        axes: list[str] = self.axes()
+        rng: random.Random = random.Random(self.seed)
+        texts: list[str] = ["ApName=SS7,synthetic\n"]
+        texts.append(self.key_value(["基本事項"], [
+            ["建物概要", "X方向スパン数", str(self.x_spans)],
+            ["建物概要", "Y方向スパン数", str(self.y_spans)],
+        ]))
+        texts.append(self.section(["軸名"], [["軸名"]], [[[a]] for a in frames + axes]))
+        texts.append(self.section(["基準スパン長"], [["軸-軸", "スパン長"]], [
+            [[f"{names[i]} - {names[i + 1]}", 6000 if names is axes else 7000]]
+            for names in [frames, axes] for i in range(len(names) - 1)
+        ]))
+        texts.append(self.section(["標準階高"], [["階名", "階高"]], [
+            [[f, 3500]] for f in self.floor_names()
+        ]))
+        texts.append(self.key_value(["剛性計算条件", "RC・SRC耐震壁・床版"], [
+            ["複数開口の扱い", "1"],
+            ["床版の剛性", "0"],
+        ]))
+        texts.append(self.section(["耐震壁の指定"], [["階", "フレーム-軸-軸", "複数開口の扱い"]], [
+            [[f"{f}F", f"{frame} - {l} - {r}", ""]] for f, frame, l, r in self.wall_spans()
+        ]))
+        texts.append(self.section(
+            ["壁開口"],
+            [
+                ["階", "フレーム-軸-軸", "押えタイプ", "開口の寸法と位置", "", "", ""],
+                ["", "", "", "L1", "L2", "H1", "H2"],
+            ],
+            [
+                [[
+                    f"{f}F",
+                    f"{frame} - {l} - {r}",
+                    "11",
+                    rng.choice([600, 800, 1000, 1200]),
+                    500 + 1500 * i,
+                    rng.choice([600, 800, 1000]),
+                    400 + 1200 * (i % 2),
+                ]]
+                for f, frame, l, r in self.wall_spans() for i in range(self.openings)
+            ],
+        ))
+        return "".join(texts)
+
+    def output_text(self) -> str:
+        rng: random.Random = random.Random(self.seed + 1)
+
+        def value(scale: float = 1000) -> str:
+            return f"{rng.uniform(-scale, scale):.1f}"
+
+        def positive(low: float, high: float) -> str:
+            return f"{rng.uniform(low, high):.3f}"
+
+        wall_keys: list[str] = ["階", "ﾌﾚｰﾑ", "左軸", "右軸"]
+        node_keys: list[str] = ["階", "X軸", "Y軸"]
+        texts: list[str] = ["ApName=SS7,synthetic\n"]
+
+        column_header: list[str] = [
+            "階", "X軸", "Y軸", "符号", "ｺﾝｸﾘｰﾄDx×Dy", "ｺﾝｸﾘｰﾄ材料",
+            "柱頭鉄骨形状X", "柱頭鉄骨材料X(flange)", "柱頭鉄骨材料X(web)",
+            "柱頭鉄骨形状Y", "柱頭鉄骨材料Y(flange)", "柱頭鉄骨材料Y(web)",
+            "柱頭鉄骨形状XY", "柱頭鉄骨材料XY",
+            "柱頭主筋本数-径X", "柱頭主筋本数-径Y", "柱頭主筋材料X", "柱頭主筋材料Y",
+            "柱頭1段目dtXmm", "柱頭1段目dtYmm",
+            "柱頭帯筋本数-径@ピッチX", "柱頭帯筋本数-径@ピッチY", "柱頭帯筋材料X", "柱頭帯筋材料Y",
+            "柱脚鉄骨形状X", "柱脚鉄骨材料X(flange)", "柱脚鉄骨材料X(web)",
+            "柱脚鉄骨形状Y", "柱脚鉄骨材料Y(flange)", "柱脚鉄骨材料Y(web)",
+            "柱脚鉄骨形状XY", "柱脚鉄骨材料XY",
+            "柱脚主筋本数-径X", "柱脚主筋本数-径Y", "柱脚主筋材料X", "柱脚主筋材料Y",
+            "柱脚1段目dtXmm", "柱脚1段目dtYmm",
+            "柱脚帯筋本数-径@ピッチX", "柱脚帯筋本数-径@ピッチY", "柱脚帯筋材料X", "柱脚帯筋材料Y",
+        ]
+
+        def column_row(f: str, x: str, y: str) -> list[str]:
+            if x == self.axes()[-1] and self.walls < self.x_spans:
+                steel: list[str] = ["□-400x400x19", "BCR295", "BCR295"]
+                return [f"{f}F", x, y, "SC1", "", ""] + steel * 2 + ["", ""] + [""] * 10 + steel * 2 + ["", ""] + [""] * 10
+            rc: list[str] = [
+                "10-D25", "10-D25", "SD345", "SD345", "60", "60",
+                "4-D13@100", "4-D13@100", "SD295", "SD295",
+            ]
+            return [f"{f}F", x, y, "C1", "800×800", "Fc36"] + [""] * 8 + rc + [""] * 8 + rc
+
+        texts.append(self.section(["柱部材断面情報"], [column_header], [
+            [column_row(f, x, y)] for f, x, y in self.nodes()
+        ]))
+        texts.append(self.section(
+            ["耐震壁部材断面情報"],
+            [wall_keys + ["符号", "コンクリートt", "コンクリート材料", "壁筋径@ピッチ縦", "壁筋材料縦", "壁筋径@ピッチ横", "壁筋材料横", "壁筋かぶり厚mm"]],
+            [[[f"{f}F", frame, l, r, "W25", 250, "Fc36", "D13@200", "SD295", "D13@200", "SD295", 40]] for f, frame, l, r in self.wall_spans()],
+        ))
+        for name in ["RC耐震壁断面算定表", "SRC耐震壁断面算定表"]:
+            texts.append(self.section([name], [["断面算定"]], [
+                [
+                    ["[W25]"],
+                    [f"[{f}F", "", frame, l, "-", f"{r}]"],
+                    ["内法", 5200, "", "", 2700, "階高", 3500],
+                    ["r", positive(0.6, 1.0), "r1", positive(0.6, 1.0), "r2", positive(0.6, 1.0), "r3", positive(0.6, 1.0)],
+                    ["QC", positive(50, 300), positive(50, 300), "QE", value(), "QW", positive(100, 2000)],
+                    ["Q1", positive(10, 500), "Q2", positive(10, 500), "QDL", value(), "QAL", positive(500, 3000)],
+                    ["QDS", value(), "QAS", positive(1000, 5000)],
+                ] for f, frame, l, r in self.wall_spans() if (frame == self.frames()[-1]) == name.startswith("SRC")
+            ]))
+        for load in ["G+P"] + self.loads:
+            order: str = "一次" if load == "G+P" else "二次"
+            for prefix, spans in [("", self.wall_spans()), ("連スパン", self.multi_span_walls())]:
+                texts.append(self.section(
+                    [f"{prefix}壁応力表({order})", load],
+                    [wall_keys + ["壁頭MkNm", "壁頭QkN", "壁頭NkN", "壁脚MkNm", "壁脚QkN", "壁脚NkN"]],
+                    [[[f"{f}F", frame, l, r, value(), positive(100, 1000), value(), value(), positive(100, 1000), value()]] for f, frame, l, r in spans],
+                ))
+        for load in self.loads:
+            for prefix, spans in [("", self.wall_spans()), ("連スパン", self.multi_span_walls())]:
+                texts.append(self.section(
+                    [f"{prefix}壁応力表(危険断面位置)", load],
+                    [wall_keys + ["MkNm", "QkN", "NkN"]],
+                    [[[f"{f}F", frame, l, r, value(), positive(100, 1000), value()]] for f, frame, l, r in spans],
+                ))
+            texts.append(self.section(
+                ["RC耐震壁保証設計(靭性指針式)", load],
+                [wall_keys + ["NkN", "QMkN", "VukN"]],
+                [[[f"{f}F", frame, l, r, value(), positive(100, 1000), positive(1000, 5000)]] for f, frame, l, r in self.wall_spans()],
+            ))
+            texts.append(self.section(
+                ["RC耐震壁保証設計(靭性指針式の諸係数)", load],
+                [wall_keys + [
+                    "Rurad", "bemm", "Δlwamm", "Δlwbmm", "lwamm", "lwbmm", "tanθ", "ν", "β",
+                    "VakN", "VtkN", "VackN", "VtckN", "圧縮側柱", "twmm", "lwmm", "Dcxmm", "Dcymm", "柱σBN/mm2",
+                ]],
+                [[[
+                    f"{f}F", frame, l, r,
+                    positive(0.001, 0.01), positive(0, 300), positive(0, 400), positive(0, 400),
+                    positive(5000, 7000), positive(5000, 7000), positive(0.3, 0.9), positive(0.4, 0.6), positive(0, 0.3),
+                    positive(500, 3000), positive(500, 3000), positive(0, 500), positive(0, 500),
+                    rng.choice(["左", "右"]), 250, 6000, 800, 800, 36,
+                ]] for f, frame, l, r in self.wall_spans()],
+            ))
+            texts.append(self.section(
+                ["SRC耐震壁保証設計(SRC規準)", load],
+                [["階", "ﾌﾚｰﾑ", "軸", "twmm", "開口γ", "NkN", "QMkN", "pte%", "M/QD", "pwh%", "QukN"]],
+                [
+                    [
+                        [f"{f}F", frame, r, 0, positive(0.6, 1.0), value(), positive(100, 1000), positive(0.1, 1.0), positive(1, 3), positive(0.2, 1.0), positive(1000, 9000)],
+                        ["", "", l, positive(250, 300), "", "", "", "", "", "", ""],
+                    ] for f, frame, l, r in self.multi_span_walls()
+                ],
+            ))
+        for load in ["G+P"] + self.loads:
+            order = "一次" if load == "G+P" else "二次"
+            texts.append(self.section(
+                [f"柱応力表({order})", load],
+                [node_keys + [
+                    "X方向柱頭MkNm", "X方向柱頭QkN", "Y方向柱頭MkNm", "Y方向柱頭QkN",
+                    "X方向柱脚MkNm", "X方向柱脚QkN", "Y方向柱脚MkNm", "Y方向柱脚QkN",
+                    "X方向中央MkNm", "Y方向中央MkNm", "柱頭NkN", "柱脚NkN",
+                ]],
+                [[[f"{f}F", x, y] + [value() for _ in range(12)]] for f, x, y in self.nodes()],
+            ))
+        for load in self.loads:
+            texts.append(self.section(
+                ["柱初期応力表", load],
+                [node_keys + [
+                    "X方向柱頭MkNm", "X方向柱頭QkN", "Y方向柱頭MkNm", "Y方向柱頭QkN",
+                    "X方向柱脚MkNm", "X方向柱脚QkN", "Y方向柱脚MkNm", "Y方向柱脚QkN",
+                    "X方向中央MkNm", "Y方向中央MkNm", "柱頭NkN", "柱脚NkN",
+                ]],
+                [[[f"{f}F", x, y] + [value() for _ in range(12)]] for f, x, y in self.nodes()],
+            ))
+            texts.append(self.section(
+                ["柱応力表(危険断面位置)", load],
+                [node_keys + [
+                    "X方向柱頭MkNm", "X方向柱頭QkN", "Y方向柱頭MkNm", "Y方向柱頭QkN",
+                    "X方向柱脚MkNm", "X方向柱脚QkN", "Y方向柱脚MkNm", "Y方向柱脚QkN",
+                    "柱頭NkN", "柱脚NkN",
+                ]],
+                [[[f"{f}F", x, y] + [value() for _ in range(10)]] for f, x, y in self.nodes()],
+            ))
+        beam_keys: list[str] = ["層", "ﾌﾚｰﾑ", "左軸", "右軸", "符号"]
+        texts.append(self.section(
+            ["梁部材断面情報"],
+            [beam_keys + ["鉄骨形状左端", "鉄骨形状中央", "鉄骨形状右端", "鉄骨材料左端", "鉄骨材料中央", "鉄骨材料右端"]],
+            [[[f"{f}FL", frame, l, r, "G1"] + ["H-600x200x11x17"] * 3 + ["SN490B"] * 3] for f, frame, l, r in self.beam_spans()],
+        ))
+        texts.append(self.section(
+            ["梁剛性表", "鉛直時"],
+            [beam_keys + ["部材長mm"]],
+            [[[f"{f}FL", frame, l, r, "G1", 6000]] for f, frame, l, r in self.beam_spans()],
+        ))
+        return "".join(texts)
+
+    def write(self, input_filename: str, output_filename: str) -> None:
+        """入力CSVと出力CSVをcp932で書き出す"""
+        for filename, text in [(input_filename, self.input_text()), (output_filename, self.output_text())]:
+            with open(filename, "w", encoding="cp932") as fp:
+                fp.write(text)
@@ -3,3 +3,8 @@ from .ss7_reader import *
 from .ss7_input import *
 from .ss7_output import *
 from .ss7_sekisan import *
+from .ss7_export import *
+from .ss7_database import *
+from .ss7_envelope import *
+from .ss7_diff import *
+from .ss7_watch import *
@@ -0,0 +1,113 @@
+import sqlite3
+import numpy as np
+from .ss7_output import SS7_Output
+from .ss7_export import read_columns, families
+
+
+class SS7_Database:
+    """SS7_Outputのセクションを系列ごとのテーブルに読み込んだSQLiteデータベース
+
+    載荷ケース違いのセクションは1つのテーブルにまとめ、"load"列で区別する。
+
+    Example:
+        >>> db = SS7_Database(output)
+        >>> db.load("柱応力表(危険断面位置)")
+        >>> db.query(
+        ...     'SELECT max(abs(n_c_bottom)) AS n FROM "柱応力表(危険断面位置)" '
+        ...     "WHERE load = ? AND CAST(floor AS INTEGER) BETWEEN ? AND ?",
+        ...     "DSY-", 3, 10,
+        ... )
+        [{'n': ...}]
+    """
+    KEY_COLUMNS: list[str] = ["load", "floor", "frame", "l_axis", "r_axis", "x_axis", "y_axis"]
+
+    output: SS7_Output
+    connection: sqlite3.Connection
+    loaded: set[str]
+
+    def __init__(self, output: SS7_Output, filename: str = ":memory:") -> None:
+        """
+        Args:
+            - output: 読み込むSS7_Output
+            - filename: SQLiteのファイルパス。省略するとメモリ上に作る
+        """
+        self.output = output
+        self.connection = sqlite3.connect(filename)
+        self.loaded = set()
+
+    def tables(self) -> list[str]:
+        """作成済みのテーブル名を返す"""
+        return [row[0] for row in self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )]
+
+    def columns(self, table: str) -> list[str]:
+        """テーブルの列名を返す"""
+        return [row[1] for row in self.connection.execute(f"PRAGMA table_info({quote(table)})")]
+
+    def load(self, *keys: str) -> list[str]:
+        """keyを名前に含むセクションを読み込み、読み込んだテーブル名を返す
+
+        読み込み済みのセクションは読み直さない。
+        """
+        names: list[str] = [name for key in keys for name in self.output.keys(key) if name not in self.loaded]
+        tables: list[str] = []
+        with self.connection:
+            for table, names_in_family in families(self.output, names).items():
+                for name in names_in_family:
+                    columns: dict[str, np.ndarray] | None = read_columns(self.output, name)
+                    self.loaded.add(name)
+                    if columns is None:
+                        continue
+                    self.insert(table, columns)
+                    if table not in tables:
+                        tables.append(table)
+            for table in tables:
+                self.create_index(table)
+        return tables
+
+    def insert(self, table: str, columns: dict[str, np.ndarray]) -> None:
+        """列の辞書をtableに一括で挿入する。足りない列は追加する"""
+        if table not in self.tables():
+            definitions: list[str] = [f"{quote(key)} {sql_type(column)}" for key, column in columns.items()]
+            self.connection.execute(f"CREATE TABLE {quote(table)} ({', '.join(definitions)})")
+        existing: list[str] = self.columns(table)
+        for key, column in columns.items():
+            if key not in existing:
+                self.connection.execute(f"ALTER TABLE {quote(table)} ADD COLUMN {quote(key)} {sql_type(column)}")
+        keys: list[str] = list(columns.keys())
+        self.connection.executemany(
+            f"INSERT INTO {quote(table)} ({', '.join([quote(key) for key in keys])}) VALUES ({', '.join(['?'] * len(keys))})",
+            zip(*[[None if v != v else v for v in columns[key].tolist()] for key in keys]),
+        )
+
+    def create_index(self, table: str) -> None:
+        """載荷ケース・階・フレーム・軸の列に索引を作る"""
+        keys: list[str] = [key for key in self.KEY_COLUMNS if key in self.columns(table)]
+        if len(keys) > 0:
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {quote(f'{table}_key')} ON {quote(table)} ({', '.join([quote(key) for key in keys])})"
+            )
+
+    def query(self, sql: str, *parameters) -> list[dict]:
+        """SQLを実行し、結果を辞書の配列で返す"""
+        cursor: sqlite3.Cursor = self.connection.execute(sql, parameters)
+        keys: list[str] = [d[0] for d in cursor.description or []]
+        return [dict(zip(keys, row)) for row in cursor]
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def quote(name: str) -> str:
+    """SQLの識別子として引用する"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def sql_type(column: np.ndarray) -> str:
+    """np.ndarrayのdtypeに対応するSQLiteの型を返す"""
+    return (
+        "INTEGER" if column.dtype.kind in "bi" else
+        "REAL" if column.dtype.kind == "f" else
+        "TEXT"
+    )
@@ -0,0 +1,144 @@
+import numpy as np
+from .ss7_output import SS7_Output
+from .ss7_export import read_columns
+
+
+class SS7_Diff:
+    """2つのSS7_Output(再計算の前後)を、セクションごとに部材のキーで突き合わせて比べる
+
+    - 部材のキーは階・フレーム・軸の列で、ハッシュ結合で行を対応づける
+    - 両方にある数値の列について、相対差|new - old| / max(|old|, |new|)を配列で求める
+
+    Example:
+        >>> diff = SS7_Diff(SS7_Output("old.csv"), SS7_Output("new.csv"), tolerance=0.01)
+        >>> diff.changed(["柱応力表(危険断面位置)"])[:3]
+        [{'section': '柱応力表(危険断面位置) DSX+', 'key': ('3', '2', 'B'), 'column': 'n_c_bottom', ...}, ...]
+    """
+    KEY_COLUMNS: list[str] = ["floor", "frame", "l_axis", "r_axis", "x_axis", "y_axis"]
+
+    old: SS7_Output
+    new: SS7_Output
+    tolerance: float
+
+    def __init__(self, old: SS7_Output, new: SS7_Output, tolerance: float = 1e-3) -> None:
+        """
+        Args:
+            - old: 比較元
+            - new: 比較先
+            - tolerance: これを超える相対差を変更とみなす
+        """
+        self.old = old
+        self.new = new
+        self.tolerance = tolerance
+
+    def sections(self, keys: list[str] | None = None) -> list[str]:
+        """両方にあるセクション名。keysを与えると、そのいずれかを名前に含むものに限る"""
+        names: set[str] = set(self.old.keys())
+        return [
+            name for name in self.new.keys()
+            if name in names and name != "info" and (keys is None or any([key in name for key in keys]))
+        ]
+
+    def compare(self, name: str) -> dict:
+        """nameのセクションを比べ、配列の辞書で返す
+
+        Returns:
+            - keys: 両方にある部材のキー(タプル)の配列
+            - columns: 比べた数値の列名
+            - old, new: (部材, 列)の値
+            - difference: (部材, 列)の相対差。両方nanなら0、片方だけnanならinf
+            - added, removed: 片方にしかない部材のキー
+        """
+        old: dict[str, np.ndarray] | None = read_columns(self.old, name)
+        new: dict[str, np.ndarray] | None = read_columns(self.new, name)
+        if old is None or new is None:
+            return {"keys": [], "columns": [], "old": np.empty((0, 0)), "new": np.empty((0, 0)), "difference": np.empty((0, 0)), "added": [], "removed": []}
+        key_columns: list[str] = [key for key in self.KEY_COLUMNS if key in old and key in new]
+        old_keys: list[tuple] = member_keys(old, key_columns)
+        new_keys: list[tuple] = member_keys(new, key_columns)
+
+        # ハッシュ結合: 比較元のキーから行番号を引く
+        rows: dict[tuple, int] = {}
+        for i, key in enumerate(old_keys):
+            rows.setdefault(key, i)
+        matched: list[tuple[int, int]] = [(rows[key], j) for j, key in enumerate(new_keys) if key in rows]
+        old_index: np.ndarray = np.array([i for i, _ in matched], dtype=np.int64)
+        new_index: np.ndarray = np.array([j for _, j in matched], dtype=np.int64)
+        new_set: set[tuple] = set(new_keys)
+
+        columns: list[str] = [
+            key for key, column in new.items()
+            if key not in key_columns and key in old
+            and column.dtype.kind in "fi" and old[key].dtype.kind in "fi"
+        ]
+        old_values: np.ndarray = np.column_stack([old[c][old_index].astype(np.float64) for c in columns]) if len(columns) > 0 else np.empty((len(matched), 0))
+        new_values: np.ndarray = np.column_stack([new[c][new_index].astype(np.float64) for c in columns]) if len(columns) > 0 else np.empty((len(matched), 0))
+        return {
+            "keys": [new_keys[j] for j in new_index.tolist()],
+            "columns": columns,
+            "old": old_values,
+            "new": new_values,
+            "difference": relative_difference(old_values, new_values),
+            "added": [key for key in dict.fromkeys(new_keys) if key not in rows],
+            "removed": [key for key in dict.fromkeys(old_keys) if key not in new_set],
+        }
+
+    def changed(self, keys: list[str] | None = None, limit: int | None = None) -> list[dict]:
+        """相対差がtoleranceを超えた(部材, 列)を、相対差の大きい順に返す
+
+        Args:
+            - keys: 比べるセクション(部分一致)。省略すると両方にある全てのセクション
+            - limit: 返す最大の件数
+
+        各行は{"section", "key", "column", "old", "new", "difference"}。
+        """
+        result: list[dict] = []
+        for name in self.sections(keys):
+            compared: dict = self.compare(name)
+            difference: np.ndarray = compared["difference"]
+            i: np.ndarray
+            j: np.ndarray
+            i, j = np.nonzero(difference > self.tolerance)
+            result += [
+                {
+                    "section": name,
+                    "key": compared["keys"][a],
+                    "column": compared["columns"][b],
+                    "old": compared["old"][a, b].item(),
+                    "new": compared["new"][a, b].item(),
+                    "difference": difference[a, b].item(),
+                } for a, b in zip(i.tolist(), j.tolist())
+            ]
+        result.sort(key=lambda d: -d["difference"])
+        return result if limit is None else result[:limit]
+
+    def members(self, keys: list[str] | None = None, limit: int | None = None) -> list[dict]:
+        """changedを部材ごとにまとめ、最大の相対差の大きい順に返す
+
+        各行は{"section", "key", "difference", "columns": 変更のあった列名}。
+        """
+        result: dict[tuple[str, tuple], dict] = {}
+        for d in self.changed(keys):
+            member: tuple[str, tuple] = (d["section"], d["key"])
+            if member not in result:
+                result[member] = {"section": d["section"], "key": d["key"], "difference": d["difference"], "columns": []}
+            result[member]["columns"].append(d["column"])
+        return list(result.values()) if limit is None else list(result.values())[:limit]
+
+
+def member_keys(columns: dict[str, np.ndarray], key_columns: list[str]) -> list[tuple]:
+    """key_columnsの値を並べたタプルの配列。キーの列がなければ行番号を使う"""
+    if len(key_columns) == 0:
+        return [(i,) for i in range(len(next(iter(columns.values()))))]
+    return list(zip(*[columns[key].tolist() for key in key_columns]))
+
+
+def relative_difference(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """|new - old| / max(|old|, |new|)。両方0もしくは両方nanなら0、片方だけnanならinf"""
+    scale: np.ndarray = np.maximum(np.abs(old), np.abs(new))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result: np.ndarray = np.abs(new - old) / scale
+    result[scale == 0] = 0
+    result[np.isnan(old) & np.isnan(new)] = 0
+    result[np.isnan(old) ^ np.isnan(new)] = np.inf
+    return result
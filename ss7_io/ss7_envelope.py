@@ -0,0 +1,140 @@
+import numpy as np
+from .ss7_output import SS7_Output
+from .. import ss7_tool
+
+
+def member_key(d: dict) -> str:
+    """応力表の1行から、部材のkey()と同じ形式のキーを返す
+
+        - 柱: 5F_1-A
+        - 壁・梁: A_5F_1-2
+    """
+    if "x_axis" in d:
+        return f'{d["floor"]}F_{d["x_axis"]}-{d["y_axis"]}'
+    return f'{d["frame"]}_{d["floor"]}F_{d["l_axis"]}-{d["r_axis"]}'
+
+
+class SS7_Envelope:
+    """載荷ケースごとの応力表を(部材, 載荷ケース, 成分)の配列にまとめ、最大・最小とその載荷ケースを求める
+
+    Example:
+        >>> envelope = SS7_Envelope.from_output(output, "柱応力表(危険断面位置)")
+        >>> envelope.maximum("n_c_bottom")[envelope.index(column.key())]
+        >>> envelope.governing("n_c_bottom", "max")[envelope.index(column.key())]
+        'DSY-'
+    """
+    LOADS: list[str] = ss7_tool.LOAD_CASES
+
+    keys: list[str]
+    rows: dict[str, int]
+    loads: list[str]
+    components: list[str]
+    values: np.ndarray
+
+    def __init__(self, tables: dict[str, list[dict]], components: list[str] | None = None) -> None:
+        """
+        Args:
+            - tables: 載荷ケースをキー、SS7_Output.read_by_loadの結果を値とする辞書
+            - components: 対象とする成分(n_c_bottom等)。省略すると全ての載荷ケースにある数値の成分
+        """
+        self.loads = list(tables.keys())
+        self.keys = list(dict.fromkeys(member_key(d) for rows in tables.values() for d in rows))
+        self.components = components if components is not None else self.common_components(tables)
+        self.rows = {key: i for i, key in enumerate(self.keys)}
+        self.values = np.full((len(self.keys), len(self.loads), len(self.components)), np.nan)
+        for j, rows in enumerate(tables.values()):
+            if len(rows) == 0:
+                continue
+            self.values[[self.rows[member_key(d)] for d in rows], j, :] = np.array(
+                [[d.get(c, np.nan) for c in self.components] for d in rows], dtype=np.float64
+            )
+
+    @staticmethod
+    def common_components(tables: dict[str, list[dict]]) -> list[str]:
+        """全ての載荷ケースの表にある、数値の成分名を返す"""
+        firsts: list[dict] = [rows[0] for rows in tables.values() if len(rows) > 0]
+        if len(firsts) == 0:
+            return []
+        return [
+            key for key, value in firsts[0].items()
+            if type(value) is float and all([key in d for d in firsts])
+        ]
+
+    @classmethod
+    def from_output(cls, output: SS7_Output, family: str, loads: list[str] | None = None, components: list[str] | None = None) -> "SS7_Envelope":
+        """outputの"<family> <load>"のセクションから作る。出力にない載荷ケースは除く
+
+        Args:
+            - family: 柱応力表(危険断面位置), 壁応力表(二次)等
+            - loads: 載荷ケース。省略するとLOADSのうち出力にあるもの
+        """
+        names: list[str] = output.keys(family)
+        return cls({
+            load: output.read_by_load(f"{family} {load}")
+            for load in (cls.LOADS if loads is None else loads) if f"{family} {load}" in names
+        }, components)
+
+    def index(self, key: str) -> int:
+        """部材のkey()に対応する行番号を返す"""
+        return self.rows[key]
+
+    def component(self, component: str) -> np.ndarray:
+        """(部材, 載荷ケース)の配列を返す"""
+        return self.values[:, :, self.components.index(component)]
+
+    def by_load_case(self, component: str) -> np.ndarray:
+        """(部材, LoadCaseの添字)の配列を返す。表にない載荷ケースはnan"""
+        result: np.ndarray = np.full((len(self.keys), ss7_tool.LoadCase.size()), np.nan)
+        result[:, [ss7_tool.LoadCase.index(load) for load in self.loads]] = self.component(component)
+        return result
+
+    def maximum(self, component: str | None = None) -> np.ndarray:
+        """載荷ケースについての最大値。componentを省略すると(部材, 成分)の配列"""
+        return self.reduce("max", component)[0]
+
+    def minimum(self, component: str | None = None) -> np.ndarray:
+        """載荷ケースについての最小値。componentを省略すると(部材, 成分)の配列"""
+        return self.reduce("min", component)[0]
+
+    def absolute_maximum(self, component: str | None = None) -> np.ndarray:
+        """載荷ケースについての絶対値の最大値。componentを省略すると(部材, 成分)の配列"""
+        return self.reduce("abs", component)[0]
+
+    def governing(self, component: str | None = None, kind: str = "max") -> np.ndarray:
+        """kind(max, min, abs)を与える載荷ケース名の配列。値がなければ空文字列"""
+        return self.reduce(kind, component)[1]
+
+    def reduce(self, kind: str, component: str | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """載荷ケースの軸について最大・最小をとり、(値, 載荷ケース名)の配列を返す"""
+        values: np.ndarray = self.values if component is None else self.component(component)[:, :, np.newaxis]
+        if len(self.loads) == 0:
+            shape: tuple[int, int] = (values.shape[0], values.shape[2])
+            result: np.ndarray = np.full(shape, np.nan)
+            loads: np.ndarray = np.full(shape, "")
+        else:
+            missing: np.ndarray = np.isnan(values)
+            score: np.ndarray = np.where(
+                missing,
+                -np.inf,
+                np.abs(values) if kind == "abs" else -values if kind == "min" else values,
+            )
+            idx: np.ndarray = np.argmax(score, axis=1)
+            empty: np.ndarray = np.all(missing, axis=1)
+            result = np.where(empty, np.nan, np.take_along_axis(values, idx[:, np.newaxis, :], axis=1)[:, 0, :])
+            loads = np.where(empty, "", np.array(self.loads)[idx])
+        if component is not None:
+            return (result[:, 0], loads[:, 0])
+        return (result, loads)
+
+    def table(self, kind: str = "max") -> list[dict]:
+        """部材ごとに、各成分の値と載荷ケース(<成分>_load)を並べた辞書の配列を返す"""
+        result: np.ndarray
+        loads: np.ndarray
+        result, loads = self.reduce(kind)
+        return [
+            {"key": key} | {
+                c: result[i, j].item() for j, c in enumerate(self.components)
+            } | {
+                f"{c}_load": str(loads[i, j]) for j, c in enumerate(self.components)
+            } for i, key in enumerate(self.keys)
+        ]
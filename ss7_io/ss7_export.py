@@ -0,0 +1,132 @@
+import os
+import re
+import numpy as np
+from .ss7_reader import SS7_Reader
+from .ss7_output import SS7_Output
+from .. import ss7_tool
+
+
+def file_name(name: str) -> str:
+    """セクション名をファイル名に使える文字列に直す"""
+    return re.sub('[\\\\/:*?"<>| ]', "_", name)
+
+
+def read_columns(reader: SS7_Reader, name: str) -> dict[str, np.ndarray] | None:
+    """nameで指定されたセクションを型付きの列で返す。表形式で読めなければNoneを返す
+
+    読み取り結果はreaderにキャッシュしない。
+    書式の合わないセクション(KeyError, IndexError, ValueError)は読み飛ばし、それ以外の例外はそのまま送出する。
+    """
+    cached: bool = name in reader.gotten_dict
+    try:
+        data: list = (
+            reader.read_by_load(name) if isinstance(reader, SS7_Output) else
+            reader.read(name)
+        )
+    except (KeyError, IndexError, ValueError) as e:
+        print(f"{name}は読み取れません: {e!r}")
+        data = None
+    finally:
+        if not cached:
+            reader.gotten_dict.pop(name, None)
+    if type(data) is not list or len(data) == 0 or not all([type(d) is dict for d in data]):
+        return None
+    return ss7_tool.to_columns(data)
+
+
+def families(reader: SS7_Reader, keys: list[str] | None = None) -> dict[str, list[str]]:
+    """セクション名を系列ごとにまとめる。SS7_Output以外は1セクション1系列"""
+    result: dict[str, list[str]] = {}
+    for name in (reader.keys() if keys is None else keys):
+        if name == "info":
+            continue
+        family: str = reader.split_load(name)[0] if isinstance(reader, SS7_Output) else name
+        result.setdefault(family, [])
+        if name not in result[family]:
+            result[family].append(name)
+    return result
+
+
+def export_sections(
+    reader: SS7_Reader,
+    directory: str,
+    format: str = "arrow",
+    keys: list[str] | None = None,
+) -> list[str]:
+    """readerの各セクションを型付きの列形式でdirectoryに書き出し、書き出したパスを返す
+
+    セクションは1つずつ読み取って書き出すため、メモリ使用量はセクション1つ分で済む。
+    SS7_Outputでは載荷ケース違いのセクションを1系列にまとめ、"load"列で区別する。
+
+    Args:
+        - reader: SS7_Output, SS7_Input
+        - directory: 書き出し先のディレクトリ
+        - format:
+            - arrow: Arrow IPCファイル(系列ごとに1ファイル、セクションごとに1レコードバッチ)
+            - parquet: Parquetファイル(系列ごとに1ファイル、セクションごとに1行グループ)
+            - npy: .npyファイル(セクションごとに1ディレクトリ、列ごとに1ファイル)
+        - keys: 書き出すセクション名。省略すると全セクション
+
+    arrow, parquetはpyarrowを要する。arrow, npyはメモリマップで読める。
+        - pyarrow.ipc.open_file(pyarrow.memory_map(path))
+        - np.load(path, mmap_mode="r")
+    """
+    os.makedirs(directory, exist_ok=True)
+    written: list[str] = []
+    for family, names in families(reader, keys).items():
+        if format == "npy":
+            for name in names:
+                columns: dict[str, np.ndarray] | None = read_columns(reader, name)
+                if columns is None:
+                    continue
+                path: str = os.path.join(directory, file_name(name))
+                os.makedirs(path, exist_ok=True)
+                for key, column in columns.items():
+                    np.save(os.path.join(path, f"{file_name(key)}.npy"), column)
+                written.append(path)
+        elif format in ["arrow", "parquet"]:
+            written += write_arrow(reader, directory, family, names, format)
+        else:
+            raise ValueError(f"export_sections: {format}")
+    return written
+
+
+def write_arrow(reader: SS7_Reader, directory: str, family: str, names: list[str], format: str) -> list[str]:
+    """1系列のセクションをArrow IPCもしくはParquetのファイルに書き出す
+
+    先頭のセクションとスキーマが合わないセクションは、セクション名のファイルに書き出す。
+    """
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    def open_writer(path: str, schema: pyarrow.Schema):
+        return (
+            pyarrow.ipc.new_file(path, schema) if format == "arrow" else
+            pyarrow.parquet.ParquetWriter(path, schema)
+        )
+
+    extension: str = "arrow" if format == "arrow" else "parquet"
+    writers: dict[str, object] = {}
+    schemas: dict[str, pyarrow.Schema] = {}
+    written: list[str] = []
+    try:
+        for name in names:
+            columns: dict[str, np.ndarray] | None = read_columns(reader, name)
+            if columns is None:
+                continue
+            table: pyarrow.Table = pyarrow.table({
+                key: column.tolist() if column.dtype.kind == "U" else column for key, column in columns.items()
+            })
+            path: str = os.path.join(directory, f"{file_name(family)}.{extension}")
+            if path in schemas and not schemas[path].equals(table.schema):
+                path = os.path.join(directory, f"{file_name(name)}.{extension}")
+            if path not in writers:
+                writers[path] = open_writer(path, table.schema)
+                schemas[path] = table.schema
+                written.append(path)
+            writers[path].write_table(table)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return written
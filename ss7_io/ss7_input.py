@@ -1,5 +1,6 @@
 from .ss7_reader import SS7_Reader
 from ..ss7_member import SS7_Axis_and_Floor
+from .. import ss7_tool
 import numpy as np
 
 
@@ -12,8 +13,8 @@ class SS7_Input(SS7_Reader):
     """
     axis_and_floor: SS7_Axis_and_Floor
 
-    def __init__(self, filename: str) -> None:
-        super().__init__(filename)
+    def __init__(self, filename: str, *args, **kwargs) -> None:
+        super().__init__(filename, *args, **kwargs)
         self.axis_and_floor = SS7_Axis_and_Floor(
             self.get("軸名"),
             self.axis_location(),
@@ -21,6 +22,11 @@ class SS7_Input(SS7_Reader):
             self.floor_height(),
             int(self.get("基本事項")["建物概要Y方向スパン数"]),
         )
+        # 階・軸のコードはSS7_Axis_and_Floorの添字と同じにする
+        self.categories = ss7_tool.Categories({
+            "floor": self.axis_and_floor.floor_key,
+            "axis": self.axis_and_floor.axis_key,
+        })
 
     def get_without_cache(self, key: str):
         return super().get_without_cache(key).read_self()
@@ -113,4 +119,4 @@ class SS7_Input(SS7_Reader):
         else:
             def temp(d: dict[str, str]) -> dict[str, str]:
                 return d
-        return [temp(d) for d in self.get(key)]
+        return self.intern_keys([temp(d) for d in self.get(key)])
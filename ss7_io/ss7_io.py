@@ -1,9 +1,12 @@
 from typing import TypeVar, Callable
 from .ss7_input import SS7_Input
 from .ss7_output import SS7_Output
+from .ss7_reader import SS7_Reader
 from .. import ss7_member
 from .. import ss7_tool
 from functools import wraps
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+import threading
 
 
 T = TypeVar("T")
@@ -16,28 +19,233 @@ class List(list[T]):
 
 def wrap_list(func) -> Callable:
     @wraps(func)
+    @ss7_tool.stage(f"SS7_IO.{func.__name__}")
     def wrapper(*args) -> List[T]:
         return List(func(*args))
     return wrapper
 
 
+def read_reader(reader_class: type, filename: str, sections: list[str] | None) -> SS7_Reader:
+    """別プロセスでSS7_Reader(の派生クラス)を読む"""
+    return reader_class(filename, sections=sections)
+
+
+def read_readers(
+    files: list[tuple[type, str, list[str] | None]],
+    concurrency: str | None = None,
+    progress: Callable[[str, int, int], None] | None = None,
+    cancel: threading.Event | None = None,
+) -> list[SS7_Reader]:
+    """(SS7_Readerの派生クラス, パス, 読むセクション)の各ファイルを読み、同じ順に返す
+
+    Args:
+        - concurrency:
+            - None: 順に読む
+            - "thread": スレッドで同時に読む。progressは各スレッドからセクションごとに呼ばれる
+            - "process": プロセスで同時に読む。progressはファイルを読み終えるごとに(filename, 1, 1)で呼ばれる
+        - progress: progress(filename, 読んだバイト数, ファイルのバイト数)
+        - cancel: setされたら読み込みをやめ、CancelledErrorを送出する。
+            "process"では実行中のプロセスを待たずに戻る
+    """
+    if concurrency is None or len(files) == 0:
+        return [reader_class(filename, progress, cancel, sections) for reader_class, filename, sections in files]
+    executor: Executor
+    futures: list[Future]
+    if concurrency == "thread":
+        executor = ThreadPoolExecutor(len(files))
+        futures = [executor.submit(reader_class, filename, progress, cancel, sections) for reader_class, filename, sections in files]
+    elif concurrency == "process":
+        executor = ProcessPoolExecutor(len(files))
+        futures = [executor.submit(read_reader, reader_class, filename, sections) for reader_class, filename, sections in files]
+    else:
+        raise ValueError(f"concurrency: {concurrency}")
+    try:
+        pending: set[Future] = set(futures)
+        while len(pending) > 0:
+            if cancel is not None and cancel.is_set():
+                raise CancelledError()
+            done: set[Future]
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+                if concurrency == "process" and progress is not None:
+                    progress(files[futures.index(future)][1], 1, 1)
+        return [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 class SS7_IO:
     """SS7の入力ファイルと出力ファイルを合わせたクラス
     """
+    # 各メソッドが読むセクション(部分一致)と、組み立てに使う他のメソッド
+    MANIFEST: dict[str, dict[str, list[str]]] = {
+        "axis_and_floor": {
+            "input": ["軸名", "基準スパン長", "標準階高", "基本事項"],
+            "output": [],
+            "uses": [],
+        },
+        "openings": {
+            "input": ["壁開口"],
+            "output": [],
+            "uses": [],
+        },
+        "walls": {
+            "input": ["耐震壁の指定", "剛性計算条件 RC・SRC耐震壁・床版"],
+            "output": [
+                "耐震壁部材断面情報",
+                "RC耐震壁断面算定表",
+                "SRC耐震壁断面算定表",
+                "壁応力表(一次)",
+                "壁応力表(二次)",
+                "壁応力表(危険断面位置)",
+                "RC耐震壁保証設計(靭性指針式)",
+                "RC耐震壁保証設計(靭性指針式の諸係数)",
+            ],
+            "uses": ["rc_columns", "openings"],
+        },
+        "rc_columns": {
+            "input": [],
+            "output": ["柱部材断面情報", "柱応力表(一次)", "柱応力表(二次)", "柱初期応力表", "柱応力表(危険断面位置)"],
+            "uses": [],
+        },
+        "s_columns": {
+            "input": [],
+            "output": ["柱部材断面情報"],
+            "uses": [],
+        },
+        "s_beams": {
+            "input": [],
+            "output": ["梁部材断面情報", "梁剛性表 鉛直時"],
+            "uses": [],
+        },
+        "multi_span_shear_walls": {
+            "input": [],
+            "output": [
+                "連スパン壁応力表(一次)",
+                "連スパン壁応力表(二次)",
+                "連スパン壁応力表(危険断面位置)",
+                "SRC耐震壁保証設計(SRC規準)",
+            ],
+            "uses": ["walls", "rc_columns"],
+        },
+    }
+
     input: SS7_Input
     output: SS7_Output
+    categories: ss7_tool.Categories
+    methods: list[str] | None
 
-    def __init__(self, input: str, output: str) -> None:
+    @classmethod
+    def manifest(cls, *methods: str) -> dict[str, list[str]]:
+        """methodsの各メソッドが読むセクションを、使う他のメソッドの分も含めて{"input": [...], "output": [...]}で返す
+
+        Example:
+            >>> SS7_IO.manifest("walls")["output"]
+            ['耐震壁部材断面情報', ..., '柱部材断面情報', ...]
+        """
+        result: dict[str, list[str]] = {"input": [], "output": []}
+        visited: list[str] = []
+        stack: list[str] = ["axis_and_floor"] + list(methods)
+        while len(stack) > 0:
+            method: str = stack.pop(0)
+            if method in visited:
+                continue
+            visited.append(method)
+            for kind in result:
+                result[kind] += [key for key in cls.MANIFEST[method][kind] if key not in result[kind]]
+            stack += cls.MANIFEST[method]["uses"]
+        return result
+
+    def __init__(
+        self,
+        input: str,
+        output: str,
+        concurrency: str | None = None,
+        progress: Callable[[str, int, int], None] | None = None,
+        cancel: threading.Event | None = None,
+        methods: list[str] | None = None,
+    ) -> None:
         """SS7の入力ファイルと出力ファイルを合わせたクラス
 
         Args:
             - input: SS7の入力CSVパス
             - output: SS7の出力CSVパス
+            - concurrency: 入力・出力ファイルを同時に読む方法(None, "thread", "process")。read_readersを参照
+            - progress: 読み込みの進捗を受け取るprogress(filename, 読んだバイト数, ファイルのバイト数)
+            - cancel: setされたら読み込みをやめ、CancelledErrorを送出する
+            - methods: 使うメソッド(walls等)。与えるとMANIFESTにあるセクションだけを読み、他は読み飛ばす
+
+        Example:
+            >>> cancel = threading.Event()
+            >>> io = SS7_IO("input.csv", "output.csv", "thread", lambda f, i, n: print(f, i, n), cancel)
+            >>> io = SS7_IO("input.csv", "output.csv", methods=["walls"])
         """
-        if input is not None:
-            self.input = SS7_Input(input)
+        self.methods = methods
+        manifest: dict[str, list[str]] | None = self.manifest(*methods) if methods is not None else None
+        files: list[tuple[type, str, list[str] | None]] = [
+            (reader_class, filename, manifest[kind] if manifest is not None else None)
+            for reader_class, filename, kind in [(SS7_Input, input, "input"), (SS7_Output, output, "output")]
+            if filename is not None
+        ]
+        for reader in read_readers(files, concurrency, progress, cancel):
+            if isinstance(reader, SS7_Input):
+                self.input = reader
+            else:
+                self.output = reader
+        # 入力・出力ファイルの表で、階・軸のコードと文字列を共有する
+        self.categories = self.input.categories if input is not None else ss7_tool.Categories()
         if output is not None:
-            self.output = SS7_Output(output)
+            self.output.categories = self.categories
+
+    def reload(
+        self,
+        progress: Callable[[str, int, int], None] | None = None,
+        cancel: threading.Event | None = None,
+    ) -> dict[str, set[str]]:
+        """入力・出力ファイルを読み直し、内容の変わったセクションの名前を{"input": {...}, "output": {...}}で返す
+
+        - テキストの変わらないセクションは、前回解析したSectionを使い回す
+        - getのキャッシュは、変わったセクションに当たらないものを引き継ぐ
+        """
+        manifest: dict[str, list[str]] | None = self.manifest(*self.methods) if self.methods is not None else None
+        changed: dict[str, set[str]] = {}
+        for kind in ["input", "output"]:
+            previous: SS7_Reader | None = getattr(self, kind, None)
+            if previous is None:
+                continue
+            reader: SS7_Reader = type(previous)(
+                previous.filename,
+                progress,
+                cancel,
+                manifest[kind] if manifest is not None else None,
+                previous.parsed(),
+            )
+            changed[kind] = reader.changed_sections(previous)
+            reader.inherit_cache(previous, changed[kind])
+            setattr(self, kind, reader)
+        if "input" in changed:
+            self.categories = self.input.categories
+        if "output" in changed:
+            self.output.categories = self.categories
+        return changed
+
+    def lazy_fields(self, store: ss7_tool.Member_Store, member_class: type) -> ss7_tool.Member_Store:
+        """member_class.FIELDSの系列の表を、出力ファイルにある全ての載荷ケースについてstoreに遅延結合として登録する
+
+        表はフィールドを最初に読むときに読むので、使わない載荷ケースの表は読まない。
+        """
+        output: SS7_Output = self.output
+        for name in output.keys():
+            family: str
+            load: str
+            family, load = output.split_load(name)
+            if family in member_class.FIELDS:
+                store.lazy(
+                    [field.format(load=output.load_key(load)) for field in member_class.FIELDS[family]],
+                    lambda name=name: output.read(name),
+                )
+        return store
 
     @wrap_list
     def openings(self, member_class: ss7_member.SS7_Opening = ss7_member.SS7_Opening) -> list[ss7_member.SS7_Opening]:
@@ -55,33 +263,15 @@ class SS7_IO:
         Args:
             member_class: RC・SRC耐震壁クラス
         """
-        walls: list[ss7_member.SS7_RC_Wall] = [
-            member_class(d, self.input.axis_and_floor) for d in ss7_tool.merge_list_of_dict([
+        key_lambda: Callable = lambda d: self.categories.pack(d["floor"], d["frame"], d["l_axis"], d["r_axis"])
+        walls: list[ss7_member.SS7_RC_Wall] = self.lazy_fields(ss7_tool.Member_Store(
+            ss7_tool.merge_list_of_dict([
                 self.output.read("耐震壁部材断面情報"),
                 self.output.read("RC耐震壁断面算定表") + self.output.read("SRC耐震壁断面算定表"),
                 self.input.read("耐震壁の指定"),
-            ] + [
-                self.output.read(key) for key in [
-                    # "壁応力表(一次) G+P",
-                    "壁応力表(二次) DSX+",
-                    "壁応力表(二次) DSX-",
-                    "壁応力表(二次) DSY+",
-                    "壁応力表(二次) DSY-",
-                    "壁応力表(危険断面位置) DSX+",
-                    "壁応力表(危険断面位置) DSX-",
-                    "壁応力表(危険断面位置) DSY+",
-                    "壁応力表(危険断面位置) DSY-",
-                    "RC耐震壁保証設計(靭性指針式) DSX+",
-                    "RC耐震壁保証設計(靭性指針式) DSX-",
-                    "RC耐震壁保証設計(靭性指針式) DSY+",
-                    "RC耐震壁保証設計(靭性指針式) DSY-",
-                    "RC耐震壁保証設計(靭性指針式の諸係数) DSX+",
-                    "RC耐震壁保証設計(靭性指針式の諸係数) DSX-",
-                    "RC耐震壁保証設計(靭性指針式の諸係数) DSY+",
-                    "RC耐震壁保証設計(靭性指針式の諸係数) DSY-",
-                ]
-            ], lambda d: f'{d["floor"]}_{d["frame"]}_{d["l_axis"]}-{d["r_axis"]}')
-        ]
+            ], key_lambda),
+            key_lambda,
+        ), member_class).members(member_class, self.input.axis_and_floor)
         columns: list = self.rc_columns(member_class.rc_column_class)
         openings: list = self.openings(member_class.opening_class)
         data: dict = self.input.get("剛性計算条件 RC・SRC耐震壁・床版")
@@ -90,10 +280,12 @@ class SS7_IO:
             "2": "等面積",
             "3": "投影矩形",
         }[data["複数開口の扱い"]] if "複数開口の扱い" in data else "包絡開口"
+        column_of: dict[str, ss7_member.SS7_RC_Column] = {column.key(): column for column in columns}
+        opening_index: ss7_member.SS7_Span_Index = ss7_member.SS7_Span_Index(openings, self.input.axis_and_floor)
         for wall in walls:
-            wall.get_column(columns)
+            wall.get_column(column_of)
             if hasattr(wall, "l_column") and hasattr(wall, "r_column"):
-                wall.get_openings(openings)
+                wall.get_openings(opening_index)
             if wall.multi_openings is None:
                 wall.multi_openings = multi_openings
         return walls
@@ -105,38 +297,14 @@ class SS7_IO:
         Args:
             member_class: RC・SRC柱クラス
         """
-        return [member_class(d, self.input.axis_and_floor) for d in filter(
-            lambda d: "concrete" in d and d["dy"] > 0,
-            ss7_tool.merge_list_of_dict(
-                [
-                    #     ss7_tool.merge_list_of_dict(
-                    #         [
-                    #             self.output.read("RC柱断面情報"),
-                    #             self.input.read("RC柱断面"),
-                    #         ],
-                    #         lambda d: f'{d["floor"]}_{d["name"]}',
-                    #     ) + self.output.read("柱部材断面情報")
-                    # ] + [
-                    self.output.read(key) for key in [
-                        "柱部材断面情報",
-                        # "柱応力表(一次) G+P",
-                        # "柱応力表(二次) DSX+",
-                        # "柱応力表(二次) DSX-",
-                        # "柱応力表(二次) DSY+",
-                        # "柱応力表(二次) DSY-",
-                        "柱初期応力表 DSX+",
-                        "柱初期応力表 DSX-",
-                        "柱初期応力表 DSY+",
-                        "柱初期応力表 DSY-",
-                        "柱応力表(危険断面位置) DSX+",
-                        "柱応力表(危険断面位置) DSX-",
-                        "柱応力表(危険断面位置) DSY+",
-                        "柱応力表(危険断面位置) DSY-",
-                    ]
-                ],
-                lambda d: f'{d["floor"]}_{d["x_axis"]}-{d["y_axis"]}',
-            ),
-        )]
+        key_lambda: Callable = lambda d: self.categories.pack(d["floor"], d["x_axis"], d["y_axis"])
+        return self.lazy_fields(ss7_tool.Member_Store(
+            [d for d in filter(
+                lambda d: "concrete" in d and d["dy"] > 0,
+                self.output.read("柱部材断面情報"),
+            )],
+            key_lambda,
+        ), member_class).members(member_class, self.input.axis_and_floor)
 
     @wrap_list
     def s_columns(self, member_class: ss7_member.SS7_S_Column = ss7_member.SS7_S_Column) -> list[ss7_member.SS7_S_Column]:
@@ -157,15 +325,15 @@ class SS7_IO:
         Args:
             member_class: S柱クラス
         """
-        return [member_class(d, self.input.axis_and_floor) for d in filter(
+        return ss7_tool.Member_Store([d for d in filter(
             lambda d: d["steel_shape_left"] != "",
             ss7_tool.merge_list_of_dict([
                 self.output.read(key) for key in [
                     "梁部材断面情報",
                     "梁剛性表 鉛直時",
                 ]
-            ], lambda d: f'{d["floor"]}_{d["frame"]}_{d["l_axis"]}-{d["r_axis"]}')
-        )]
+            ], lambda d: self.categories.pack(d["floor"], d["frame"], d["l_axis"], d["r_axis"]))
+        )]).members(member_class, self.input.axis_and_floor)
 
     @wrap_list
     def multi_span_shear_walls(self, member_class: ss7_member.SS7_MultiSpanShearWall = ss7_member.SS7_MultiSpanShearWall) -> list[ss7_member.SS7_MultiSpanShearWall]:
@@ -174,26 +342,17 @@ class SS7_IO:
         Args:
             member_class: 連スパン耐震壁クラス
         """
-        ms_walls: list[ss7_member.SS7_MultiSpanShearWall] = [member_class(d, self.input.axis_and_floor) for d in ss7_tool.merge_list_of_dict([
-            self.output.read(key) for key in [
-                # "連スパン壁応力表(一次) G+P",
-                "連スパン壁応力表(二次) DSX+",
-                # "連スパン壁応力表(二次) DSX-",
-                # "連スパン壁応力表(二次) DSY+",
-                # "連スパン壁応力表(二次) DSY-",
-                "連スパン壁応力表(危険断面位置) DSX+",
-                "連スパン壁応力表(危険断面位置) DSX-",
-                "連スパン壁応力表(危険断面位置) DSY+",
-                "連スパン壁応力表(危険断面位置) DSY-",
-                "SRC耐震壁保証設計(SRC規準) DSX+",
-                "SRC耐震壁保証設計(SRC規準) DSX-",
-                "SRC耐震壁保証設計(SRC規準) DSY+",
-                "SRC耐震壁保証設計(SRC規準) DSY-",
-            ]
-        ], lambda d: f'{d["floor"]}_{d["frame"]}_{d["l_axis"]}-{d["r_axis"]}')]
+        # 連スパン耐震壁は連スパン壁応力表(二次) DSX+にある壁とし、他の表はフィールドを読むときに結合する
+        key_lambda: Callable = lambda d: self.categories.pack(d["floor"], d["frame"], d["l_axis"], d["r_axis"])
+        ms_walls: list[ss7_member.SS7_MultiSpanShearWall] = self.lazy_fields(ss7_tool.Member_Store(
+            self.output.read("連スパン壁応力表(二次) DSX+"),
+            key_lambda,
+        ), member_class).members(member_class, self.input.axis_and_floor)
         walls: list = self.walls(member_class.rc_wall_class)
         columns: list = self.rc_columns(member_class.rc_column_class)
+        column_of: dict[str, ss7_member.SS7_RC_Column] = {column.key(): column for column in columns}
+        wall_index: ss7_member.SS7_Span_Index = ss7_member.SS7_Span_Index(walls, self.input.axis_and_floor)
         for ms_wall in ms_walls:
-            ms_wall.get_wall(walls)
-            ms_wall.get_column(columns)
+            ms_wall.get_wall(wall_index)
+            ms_wall.get_column(column_of)
         return ms_walls
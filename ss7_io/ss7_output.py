@@ -1,5 +1,6 @@
 from .ss7_reader import SS7_Reader, Section
 from .. import ss7_tool
+import re
 
 
 def story_formatter(story: str) -> str:
@@ -31,17 +32,12 @@ class SS7_Output(SS7_Reader):
         elif data.name in ["崩壊メカニズム"]:
             return data.read_as_list_of_line()
         elif "SRC耐震壁保証設計(SRC規準)" in data.name:
-            def paragraph2dict(p: ss7_tool.String) -> dict[str, str]:
-                result: list[dict[str, str]] = Section(
-                    data.name,
-                    data.keys,
-                    p,
-                ).read_as_list_of_dict()
+            def record2dict(result: list[dict[str, str]]) -> dict[str, str]:
                 result[0]["右軸"] = result[0].pop("軸")
                 result[0]["左軸"] = result[-1].pop("軸")
                 result[0]["twmm"] = result[-1].pop("twmm")
                 return result[0]
-            return [paragraph2dict(p) for p in data.stripsplit(",<RE>\n")]
+            return [record2dict(record) for record in data.read_records()]
         elif any([
             key in data.name for key in [
                 "RC耐震壁保証設計(靭性指針式)",
@@ -65,12 +61,49 @@ class SS7_Output(SS7_Reader):
                 - DSX-  -> dsxm
                 - QUX+低減 -> quxp_reduced
         """
-        return ss7_tool.String(load).multiple_replace(
-            "+", "p",
-            "-", "m",
-            "低減", "_reduced",
-        ).lower()
+        if load in ss7_tool.LoadCase.indices:
+            return ss7_tool.LoadCase.key(load)
+        return ss7_tool.load_key(load)
 
+    def split_load(self, name: str) -> tuple[str, str]:
+        """セクション名を、載荷ケースを除いた系列名と載荷ケースに分ける
+
+        Args:
+            - name:
+                - 柱応力表(危険断面位置) DSX+  -> (柱応力表(危険断面位置), DSX+)
+                - 柱部材断面情報              -> (柱部材断面情報, )
+        """
+        family: str
+        _: str
+        load: str
+        family, _, load = name.rpartition(" ")
+        if family != "" and re.fullmatch("G\\+P|[A-Z]+[+-](低減)?", load):
+            return (family, load)
+        return (name, "")
+
+    def read_by_load(self, key: str) -> list[dict]:
+        """keyで指定されたセクションを読み取り、フィールド名の載荷ケース(dsxp_等)を"load"に移す
+
+        同じ系列の各載荷ケースのセクションが同じフィールド名になる。
+            - 柱応力表(危険断面位置) DSX+: dsxp_n_c_bottom -> n_c_bottom, load: DSX+
+        """
+        load: str = self.split_load(key)[1]
+        if load == "":
+            return self.read(key)
+        load_key: str = self.load_key(load)
+
+        # quxp_reduced等の"_"を含むキーも、1つの語の並びとして取り除く
+        pattern: re.Pattern = re.compile(rf"(^|_){re.escape(load_key)}(_|$)")
+
+        def temp(d: dict) -> dict:
+            result: dict = {
+                pattern.sub(lambda m: "_" if m.group(1) and m.group(2) else "", k, count=1): v
+                for k, v in d.items()
+            }
+            return result | {"load": load}
+        return [temp(d) for d in self.read(key)]
+
+    @ss7_tool.stage("SS7_Output.read")
     def read(self, key: str) -> list[dict]:
         """keyで指定されたセクションをここで定義された形式で読み取る
 
@@ -458,4 +491,4 @@ class SS7_Output(SS7_Reader):
             def temp(d: dict[str, str]) -> dict[str, str]:
                 return d
 
-        return [temp(d) for d in self.get(key)]
+        return self.intern_keys([temp(d) for d in self.get(key)])
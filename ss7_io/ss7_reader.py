@@ -3,19 +3,24 @@ ToDo:
     出力・建物情報のパースがうまく行っていない（辞書でも配列でもないため）
 """
 from .. import ss7_tool
+import io
 import re
-from typing import Any
+import csv
+import hashlib
+import threading
+from concurrent.futures import CancelledError
+from typing import Any, Callable
 
 
 class Section_Temp(ss7_tool.String):
     def name(self) -> str:
-        """セクション固有の名前を返す。
+        """セクション固有の名前を返す。名前は1行目にあるので、1行目だけを読む
         """
         return " ".join([
             (
                 col.split("=")[1] if "=" in col else
                 col
-            ) for col in self.read_as_table()[0]
+            ) for col in ss7_tool.String(self.split("\n", 1)[0]).read_as_table()[0]
         ]).strip(" ") if "name=" in self else "info"
 
     def key_string(self) -> ss7_tool.String:
@@ -47,6 +52,7 @@ class Section_Temp(ss7_tool.String):
             keys[idx + 1] = ""
         return keys
 
+    @ss7_tool.stage("Section_Temp.section")
     def section(self) -> "Section":
         return Section(
             re.sub(
@@ -63,8 +69,23 @@ class Section_Temp(ss7_tool.String):
 
 
 class Section(ss7_tool.String):
+    """1つのセクションの<data>以降のテキスト
+
+    read_selfで判定した形(shape)をインスタンスに覚える。判定のために解析した段落ごとの表(tables)は、
+    続くread_selfに1度だけ渡して手放すので、テキストと表を二重に持ち続けず、呼び出し側が表を変えても次の読み取りに響かない。
+    """
+    # read_selfが判定するセクションの形
+    SHAPES: list[str] = [
+        "key_value",    # <RE>のない、項目名と値の縦の表
+        "list",         # 各段落が1列
+        "records",      # 各段落が1行。列見出し(keys)の辞書の配列にする
+        "paragraphs",   # それ以外。段落ごとの表の配列
+    ]
+
     name: str
     keys: list[str]
+    shape: str | None = None
+    tables: list[ss7_tool.Table] | None = None
 
     def __new__(cls, content, name: str, keys: list[ss7_tool.String]) -> "Section":
         ret: "Section" = super().__new__(cls, content)
@@ -72,66 +93,214 @@ class Section(ss7_tool.String):
         ret.keys = keys
         return ret
 
+    def __reduce__(self) -> tuple:
+        return (Section, (str(self), self.name, self.keys), {"shape": self.shape})
+
+    def classify(self) -> str:
+        """セクションの形(SHAPESのいずれか)を判定してshapeに記録する。表の解析はtablesに残し、続くread_selfで使う"""
+        if self.shape is None:
+            if "<RE>" not in self and self.count("\n") > 1:
+                self.shape = "key_value"
+            else:
+                single_column: bool = True
+                single_row: bool = True
+                self.tables = self.read_as_list_of_table()
+                for table in self.tables:
+                    single_column = single_column and len(table[0]) == 1
+                    single_row = single_row and len(table) == 1
+                self.shape = "list" if single_column else "records" if single_row else "paragraphs"
+        return self.shape
+
     def read_self(self) -> Any:
-        if "<RE>" not in self and self.count("\n") > 1:
-            keys: list[ss7_tool.String] = ss7_tool.Table(
-                self.read_as_table().transposed()[:-1]
-            ).filled_from_left().accumulated()
-            values: list[ss7_tool.String] = self.read_as_table().transposed()[-1]
+        shape: str = self.classify()
+        if shape == "key_value":
+            table: ss7_tool.Table = self.read_as_table().transposed()
+            keys: list[ss7_tool.String] = ss7_tool.Table(table[:-1]).filled_from_left().accumulated()
+            values: list[ss7_tool.String] = table[-1]
             return ss7_tool.String(f'{",".join(keys)}\n{",".join(values)}').read_as_dict()[0]
-        elif all([len(table[0]) == 1 for table in self.read_as_list_of_table()]):
+        elif shape == "list":
             return [table[0][0] for table in self.read_as_list_of_table()]
-        elif all([len(table) == 1 for table in self.read_as_list_of_table()]):
-            return self.read_as_list_of_dict()
+        elif shape == "records":
+            return self.read_tables_as_list_of_dict()
         else:
             return self.read_as_list_of_table()
 
     def read_as_list_of_dict(self, *float_keys: list[str]) -> list[dict[str, str]]:
         return ss7_tool.String(f'{",".join(self.keys)}\n{self.replace(",<RE>", "")}').read_as_dict(*float_keys)
 
+    def fields(self) -> list[str]:
+        """read_as_list_of_dictの辞書のキー(列見出しをcsvの1行として読んだもの)"""
+        return next(csv.reader([",".join(self.keys)]), [])
+
+    @staticmethod
+    def record(fields: list[str], row: list[str]) -> dict:
+        """1行を辞書にする。csv.DictReaderと同じく、余る値はNoneのキーに、足りない値はNoneにし、値の前後の空白を除く"""
+        d: dict = dict(zip(fields, [ss7_tool.String(value.strip()) for value in row]))
+        if len(fields) < len(row):
+            d[None] = row[len(fields):]
+        else:
+            for field in fields[len(row):]:
+                d[field] = None
+        return d
+
+    def read_tables_as_list_of_dict(self) -> list[dict[str, str]]:
+        """read_as_list_of_dict()と同じ辞書の配列を、解析済みのtablesから作る"""
+        fields: list[str] = self.fields()
+        result: list[dict] = []
+        for table in self.read_as_list_of_table():
+            for row in table:
+                if len(row) == 0:
+                    continue
+                if len(row) > 1 and row[-1] == "<RE>":
+                    # 最後の段落は末尾の改行がなく、",<RE>"が残る
+                    row = row[:-1]
+                result.append(self.record(fields, row))
+        return result
+
+    def read_records(self) -> list[list[dict[str, str]]]:
+        """<RE>で終わる複数行のレコードごとに、各行を辞書にした配列を返す
+
+        セクションをcsv.readerで1回だけ読み、",<RE>"で終わる行をレコードの終わりとする。
+        段落ごとにSectionを作ってread_as_list_of_dictを呼ぶのと同じ結果になる。
+        """
+        fields: list[str] = self.fields()
+        result: list[list[dict]] = []
+        current: list[dict] = []
+        with io.StringIO(self) as fp:
+            for row in csv.reader(fp):
+                if len(row) == 0:
+                    continue
+                end: bool = len(row) > 1 and row[-1] == "<RE>"
+                current.append(self.record(fields, row[:-1] if end else row))
+                if end:
+                    result.append(current)
+                    current = []
+        if len(current) > 0:
+            result.append(current)
+        return result
+
     def read_as_list_of_table(self) -> list[ss7_tool.Table]:
-        return [p.read_as_table() for p in filter(lambda p: len(p[0]) > 0, self.stripsplit(",<RE>\n"))]
+        """段落ごとの表。classifyの解析が残っていればそれを渡してtablesを空にし、なければ解析し直す"""
+        tables: list[ss7_tool.Table] | None = self.tables
+        self.tables = None
+        if tables is None:
+            tables = [p.read_as_table() for p in filter(lambda p: len(p[0]) > 0, self.stripsplit(",<RE>\n"))]
+        return tables
 
     def read_as_list_of_line(self) -> list[list[ss7_tool.String]]:
         return [p[0] for p in self.read_as_list_of_table()]
 
     def read_first_line_as_list_of_dict(self) -> list[dict[str, str]]:
-        return Section(
-            ss7_tool.Table(self.read_as_list_of_line()).to_text(),
-            self.name,
-            self.keys,
-        ).read_as_list_of_dict()
+        """各段落の1行目を辞書にした配列
+
+        1行目を最も長い行に合わせて""で埋め、",<RE>"を除いてから辞書にする(表をcsvの文字列に戻して読み直すのと同じ結果)。
+        """
+        lines: list[list[ss7_tool.String]] = self.read_as_list_of_line()
+        width: int = max([len(row) for row in lines] + [0])
+        fields: list[str] = self.fields()
+        return [self.record(fields, row) for row in [
+            [col for j, col in enumerate(row + [""] * (width - len(row))) if j == 0 or col != "<RE>"]
+            for row in lines
+        ] if len(row) > 0]
+
+
+def section_digest(text: str) -> bytes:
+    """セクションのテキストのハッシュ。読み直したときに内容が変わったかを調べるのに使う"""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
 
 
 class SS7_Reader(list[Section]):
     """SS7_InputとSS7_Outputの親クラス
     """
+    # 階・フレーム・軸のフィールドと、Categoriesでの種類
+    KEY_KINDS: dict[str, str] = {
+        "floor": "floor",
+        "frame": "axis",
+        "l_axis": "axis",
+        "r_axis": "axis",
+        "x_axis": "axis",
+        "y_axis": "axis",
+    }
+
     filename: str
     gotten_dict: dict
+    categories: ss7_tool.Categories
+    digests: list[bytes]
 
-    def __init__(self, filename: str) -> None:
+    def __init__(
+        self,
+        filename: str,
+        progress: Callable[[str, int, int], None] | None = None,
+        cancel: threading.Event | None = None,
+        sections: list[str] | None = None,
+        reuse: dict[bytes, Section] | None = None,
+    ) -> None:
         """
         Args:
             filename: SS7の入出力CSVパス
+            progress: セクションを1つ読むごとにprogress(filename, 読んだバイト数, ファイルのバイト数)を呼ぶ
+            cancel: setされたら読み込みをやめ、CancelledErrorを送出する
+            sections: 読むセクションの名前(get()と同じく部分一致)。省略すると全てのセクションを読む。
+                名前の合わないセクションは表の解析を行わずに読み飛ばす
+            reuse: 前回読んだ{section_digest: Section}。テキストの変わらないセクションは解析せずにこれを使う
+
+        ファイルはチャンクごとに復号し、セクションごとに読むため、ファイル全体の文字列は作らない。
+        ただし各セクション(Section)はテキストを持ち続けるので、読み込み後のメモリはファイルの大きさに比例する。
         """
 
         self.filename = filename
         self.gotten_dict = {}
-        super().__init__([Section_Temp(
-            s if "ApName" in s else f'name={s}'
-        ).section() for s in ss7_tool.read_text(
-            filename
-        ).multiple_replace(
-            "－", "-",
-            "靱", "靭",
-        ).stripsplit(
-            "name="
-        )])
+        self.categories = ss7_tool.Categories()
+        self.digests = []
+        found: list[Section] = []
+        s: ss7_tool.String
+        position: int
+        total: int
+        for s, position, total in ss7_tool.read_sections(filename, "name=", [("－", "-"), ("靱", "靭")]):
+            if cancel is not None and cancel.is_set():
+                raise CancelledError(filename)
+            temp: Section_Temp = Section_Temp(s if "ApName" in s else f'name={s}')
+            name: str = temp.name()
+            if sections is None or name == "info" or any([key in name for key in sections]):
+                digest: bytes = section_digest(temp)
+                found.append(reuse[digest] if reuse is not None and digest in reuse else temp.section())
+                self.digests.append(digest)
+            if progress is not None:
+                progress(filename, position, total)
+        super().__init__(found)
+
+    def intern_keys(self, rows: list) -> list:
+        """辞書の各行の階・フレーム・軸の文字列を、categoriesで共有の文字列に置き換える。辞書でない行(文字列・表)はそのまま"""
+        kinds: dict[str, str] = self.KEY_KINDS
+        for d in rows:
+            if not isinstance(d, dict):
+                continue
+            for field in kinds.keys() & d.keys():
+                d[field] = self.categories.intern(kinds[field], d[field])
+        return rows
+
+    def parsed(self) -> dict[bytes, Section]:
+        """{section_digest: Section}。読み直すときにreuseとして渡す"""
+        return dict(zip(self.digests, self))
+
+    def changed_sections(self, previous: "SS7_Reader") -> set[str]:
+        """previousと比べて、内容が変わった・増えた・なくなったセクションの名前"""
+        return {name for name, _ in set(zip(self.keys(), self.digests)) ^ set(zip(previous.keys(), previous.digests))}
+
+    def inherit_cache(self, previous: "SS7_Reader", changed: set[str]) -> None:
+        """previousのgetのキャッシュのうち、changedのセクションに当たらないものを引き継ぐ"""
+        for key, value in previous.gotten_dict.items():
+            if key not in self.gotten_dict and not any([key in name for name in changed]):
+                self.gotten_dict[key] = value
 
     def search(self, keyword: str) -> list[Section]:
         """keywordを含むデータ[辞書配列]を全て返す"""
         return [d for d in filter(lambda d: keyword in d.name, self)]
 
+    def shapes(self) -> dict[str, str]:
+        """read_selfで判定済みのセクションの形{名前: Section.SHAPESのいずれか}"""
+        return {d.name: d.shape for d in self if d.shape is not None}
+
     def keys(self, keyword: str = "") -> list[str]:
         """keywordを含むkeyを全て返す"""
         return [d.name for d in self.search(keyword)]
@@ -140,6 +309,7 @@ class SS7_Reader(list[Section]):
         """keyによって指定される事項のデータ[配列]を1つ返す
         """
         found_dict: list[Section] = self.search(key)
+        found_dict = [d for d in found_dict if d.name == key] or found_dict
         if len(found_dict) < 1:
             if key not in self.gotten_dict:
                 print(f"{key}に該当するデータはありません。")
@@ -151,5 +321,8 @@ class SS7_Reader(list[Section]):
 
     def get(self, key: str) -> Section:
         if key not in self.gotten_dict:
+            ss7_tool.count("SS7_Reader.get", "misses")
             self.gotten_dict[key] = self.get_without_cache(key)
+        else:
+            ss7_tool.count("SS7_Reader.get", "hits")
         return self.gotten_dict[key]
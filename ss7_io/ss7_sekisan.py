@@ -1,8 +1,22 @@
 from .ss7_reader import SS7_Reader, Section
+from concurrent.futures import ProcessPoolExecutor
+import os
 import numpy as np
 
 
+def to_float(value: str) -> float:
+    """数値に直せない値(空欄・見出し)はnanにする"""
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+
 class SS7_Sekisan(SS7_Reader):
+    steel_cache: dict[str, np.ndarray]
+    pivot_cache: list[dict]
+    brace_cache: list[dict]
+
     def get_without_cache(self, key: str):
         data: Section = super().get_without_cache(key)
         if data.name in [
@@ -21,52 +35,103 @@ class SS7_Sekisan(SS7_Reader):
     def brace_section(self) -> list[dict[str, str]]:
         return self.get("部位別集計表")[self.get_index("", "ブレース長さ・本数"):]
 
+    def steel_columns(self) -> dict[str, np.ndarray]:
+        """部位別集計表の鋼材部分を一度だけ読み、"材料"と各部位の列に直す
+
+        部位の列はfloat64で、空欄はnanとする。
+        """
+        if not hasattr(self, "steel_cache"):
+            rows: list[dict[str, str]] = self.steel_section()
+            members: list[str] = [key for key in (rows[0].keys() if len(rows) > 0 else []) if key not in ["", "種類", "材料"]]
+            self.steel_cache = {"材料": np.array([row["材料"] for row in rows], dtype=str)} | {
+                member: np.array([to_float(row[member]) for row in rows], dtype=np.float64) for member in members
+            }
+        return self.steel_cache
+
+    def members(self) -> list[str]:
+        """部位別集計表の部位(柱, 大梁, ...)"""
+        return [key for key in self.steel_columns() if key != "材料"]
+
+    def pivot(self) -> list[dict]:
+        """材料×部位の鋼材量の表を返す
+
+        各行は{"材料": 材料, <部位>: 鋼材量, ...}で、その部位にその材料がなければ鋼材量はnanとする。
+        """
+        if not hasattr(self, "pivot_cache"):
+            columns: dict[str, np.ndarray] = self.steel_columns()
+            materials: np.ndarray
+            inverse: np.ndarray
+            materials, inverse = np.unique(columns["材料"], return_inverse=True)
+            sums: dict[str, np.ndarray] = {}
+            for member in self.members():
+                found: np.ndarray = ~np.isnan(columns[member])
+                total: np.ndarray = np.bincount(inverse[found], weights=columns[member][found], minlength=len(materials))
+                count: np.ndarray = np.bincount(inverse[found], minlength=len(materials))
+                sums[member] = np.where(count > 0, total, np.nan)
+            self.pivot_cache = [
+                {"材料": str(material)} | {member: sums[member][i].item() for member in sums}
+                for i, material in enumerate(materials)
+            ]
+        return self.pivot_cache
+
+    def brace_table(self) -> list[dict]:
+        """ブレースの材料ごとの平均長さと本数の表を返す
+
+        各行は{"材料": 材料, "長さ": 本数で重みづけした平均長さ, "本数": 本数}。
+        ブレース長さ・本数の欄で、長さ(大梁の列)と本数(小梁の列)が数値でない行は除く。
+        """
+        if not hasattr(self, "brace_cache"):
+            rows: list[dict[str, str]] = [row for row in self.brace_section() if not any([
+                np.isnan(to_float(row[key])) for key in ["大梁", "小梁"]
+            ])]
+            materials: np.ndarray
+            inverse: np.ndarray
+            materials, inverse = np.unique(np.array([row["材料"] for row in rows], dtype=str), return_inverse=True)
+            length: np.ndarray = np.array([to_float(row["大梁"]) for row in rows], dtype=np.float64)
+            counts: np.ndarray = np.array([to_float(row["小梁"]) for row in rows], dtype=np.float64)
+            total: np.ndarray = np.bincount(inverse, weights=length * counts, minlength=len(materials))
+            count: np.ndarray = np.bincount(inverse, weights=counts, minlength=len(materials))
+            self.brace_cache = [
+                {"材料": str(material), "長さ": (total[i] / count[i]).item(), "本数": int(count[i])}
+                for i, material in enumerate(materials)
+            ]
+        return self.brace_cache
+
+    def pivot_of(self, member: str) -> dict[str, float]:
+        """memberの材料ごとの鋼材量。"大梁・片持梁"のように・でつないだ部位は合算する"""
+        members: list[str] = [member] if member in self.members() else member.split("・")
+        result: dict[str, float] = {}
+        for row in self.pivot():
+            values: list[float] = [row[m] for m in members if m in row and not np.isnan(row[m])]
+            if len(values) > 0:
+                result[row["材料"]] = sum(values)
+        return result
+
     def get_materials(self, member: str) -> set[str]:
-        return set([row["材料"] for row in filter(
-            lambda row: row[member] != "",
-            self.steel_section(),
-        )])
+        return set(self.pivot_of(member).keys())
 
     def get_braces(self) -> set[str]:
-        return set([row["材料"] for row in self.brace_section()])
+        return set([row["材料"] for row in self.brace_table()])
 
     def sum_steel(self, member: str, material: str) -> float:
-        return sum(
-            [
-                0 if row[member] == "" else float(row[member]) for row in filter(
-                    lambda row: row["材料"] == material,
-                    self.steel_section()
-                )
-            ]
-        )
+        return self.pivot_of(member).get(material, 0)
 
     def sum_of_member(self, member: str) -> float:
-        return sum([
-            self.sum_steel(
-                member,
-                material
-            ) for material in self.get_materials(member)
-        ])
+        return sum(self.pivot_of(member).values())
 
     def print_sum_steel(self, member: str) -> None:
-        if member == "大梁・片持梁":
-            for material in (self.get_materials("大梁") | self.get_materials("片持梁")):
-                print(f'\t{member}\t{material}\t{self.sum_steel("大梁", material) + self.sum_steel("片持梁", material):.2f}')
-        else:
-            for material in self.get_materials(member):
-                print(f'\t{member}\t{material}\t{self.sum_steel(member, material):.2f}')
+        for material, value in self.pivot_of(member).items():
+            print(f'\t{member}\t{material}\t{value:.2f}')
 
     def sum_brace(self, material: str) -> tuple[float, int]:
-        length: np.ndarray = np.array([row["大梁"] for row in filter(lambda row: row["材料"].startswith(material), self.get("部位別集計表"))], dtype=np.float64)
-        counts: np.ndarray = np.array([row["小梁"] for row in filter(lambda row: row["材料"].startswith(material), self.get("部位別集計表"))], dtype=np.int64)
-        return (
-            sum(length * counts) / sum(counts),
-            sum(counts),
-        )
+        for row in self.brace_table():
+            if row["材料"] == material:
+                return (row["長さ"], row["本数"])
+        return (np.nan, 0)
 
     def print_sum_brace(self) -> None:
-        for brace in self.get_braces():
-            print(f"\t{brace}\t{self.sum_brace(brace)[0]:.2f}\t{self.sum_brace(brace)[1]}")
+        for row in self.brace_table():
+            print(f'\t{row["材料"]}\t{row["長さ"]:.2f}\t{row["本数"]}')
 
 
 def sekisan(filename: str) -> None:
@@ -76,3 +141,87 @@ def sekisan(filename: str) -> None:
         print("")
 
     sekisan.print_sum_brace()
+
+
+def read_pivot(filename: str) -> list[dict]:
+    """filenameの積算CSVの材料×部位の表を返す(並列読み込み用)"""
+    return SS7_Sekisan(filename).pivot()
+
+
+def revision_labels(paths: list[str]) -> dict[str, str]:
+    """版のパスから{版名: パス}を作る。版名は、パスに共通のディレクトリからの相対パス(拡張子を除く)
+
+    Example:
+        >>> revision_labels(["a/rev01/積算.csv", "a/rev02/積算.csv"])
+        {'rev01/積算': 'a/rev01/積算.csv', 'rev02/積算': 'a/rev02/積算.csv'}
+    """
+    if len(paths) == 0:
+        return {}
+    common: str = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+    return {
+        os.path.splitext(os.path.relpath(os.path.abspath(path), common))[0].replace(os.sep, "/"): path
+        for path in paths
+    }
+
+
+def sekisan_batch(
+    filenames: list[str] | dict[str, list[str] | dict[str, str]],
+    processes: int | None = None,
+) -> list[dict]:
+    """複数の積算CSVを並列に読み、プロジェクト×版×部位×材料の鋼材量と、直前の版からの差分の表を返す
+
+    Args:
+        - filenames: 版の順に並べた積算CSVのパス。複数のプロジェクトは{プロジェクト名: [パス, ...]}で渡す。
+            版名を指定する場合は、パスの配列の代わりに{版名: パス}を版の順に渡す
+        - processes: 並列に読むプロセス数。1なら並列にしない。省略するとCPU数。ファイルが1つなら並列にしない
+
+    各行は{"project", "revision", "部位", "材料", "鋼材量", "差分"}。
+    版名を指定しない場合、版はrevision_labels(共通のディレクトリからの相対パス)とする。
+    ある版にない部位・材料の鋼材量は0、最初の版の差分はnanとする。
+    """
+    projects: dict[str, dict[str, str]] = {
+        project: revisions if type(revisions) is dict else revision_labels(list(revisions))
+        for project, revisions in (filenames if type(filenames) is dict else {"": filenames}).items()
+    }
+    paths: list[str] = list(dict.fromkeys([path for revisions in projects.values() for path in revisions.values()]))
+    if processes == 1 or len(paths) <= 1:
+        pivots: list[list[dict]] = [read_pivot(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            pivots = list(executor.map(read_pivot, paths))
+    pivot_of: dict[str, list[dict]] = dict(zip(paths, pivots))
+
+    table: list[dict] = []
+    for project, revisions in projects.items():
+        rows: list[list[dict]] = [pivot_of[path] for path in revisions.values()]
+        materials: list[str] = sorted(set([row["材料"] for pivot in rows for row in pivot]))
+        members: list[str] = list(dict.fromkeys([key for pivot in rows for row in pivot for key in row if key != "材料"]))
+        material_index: dict[str, int] = {material: k for k, material in enumerate(materials)}
+        values: np.ndarray = np.zeros((len(revisions), len(members), len(materials)))
+        for i, pivot in enumerate(rows):
+            for row in pivot:
+                for j, member in enumerate(members):
+                    values[i, j, material_index[row["材料"]]] = np.nan_to_num(row.get(member, 0))
+        deltas: np.ndarray = np.concatenate([np.full((1,) + values.shape[1:], np.nan), np.diff(values, axis=0)]) if len(revisions) > 0 else values
+        used: np.ndarray = np.any(values != 0, axis=0)
+        table += [
+            {
+                "project": project,
+                "revision": revision,
+                "部位": member,
+                "材料": material,
+                "鋼材量": values[i, j, k].item(),
+                "差分": deltas[i, j, k].item(),
+            }
+            for i, revision in enumerate(revisions)
+            for j, member in enumerate(members)
+            for k, material in enumerate(materials) if used[j, k]
+        ]
+    return table
+
+
+def sekisan_compare(filenames: list[str] | dict[str, list[str] | dict[str, str]], processes: int | None = None) -> None:
+    """sekisan_batchの結果をタブ区切りで出力する"""
+    print("\t".join(["project", "revision", "部位", "材料", "鋼材量", "差分"]))
+    for row in sekisan_batch(filenames, processes):
+        print(f'{row["project"]}\t{row["revision"]}\t{row["部位"]}\t{row["材料"]}\t{row["鋼材量"]:.2f}\t{row["差分"]:.2f}')
@@ -0,0 +1,154 @@
+import os
+import time
+import threading
+from typing import Any, Callable
+from .ss7_io import SS7_IO
+
+
+def print_check(name: str, result: Any, changed: dict[str, set[str]]) -> None:
+    """SS7_Watchの既定の出力先。検定の名前と結果を1行で出力する"""
+    print(f'[{time.strftime("%H:%M:%S")}] {name}: {result!r}')
+
+
+class SS7_Watch:
+    """SS7の入力・出力CSVを監視し、書き込みが終わるたびに読み直して、関係する検定だけを実行し直す
+
+    - inotify等は使わず、interval秒ごとに更新時刻とサイズを調べる
+    - 更新時刻とサイズがsettle秒変わらなければ、書き込みが終わったとみなす
+    - 読み直しはSS7_IO.reloadで行い、テキストの変わらないセクションは解析し直さない
+    - 検定は読むセクション(もしくはSS7_IOのメソッド名)と合わせて登録し、そのセクションが変わったときだけ実行する
+
+    Example:
+        >>> watch = SS7_Watch("input.csv", "output.csv")
+        >>> watch.register("耐震壁", lambda io: [w.over_loads(w.jinsei_ultimate_strength) for w in io.walls()], methods=["walls"])
+        >>> watch.run()
+    """
+    input: str
+    output: str
+    interval: float
+    settle: float
+    emit: Callable[[str, Any, dict[str, set[str]]], None]
+    io: SS7_IO | None
+    checks: dict[str, dict]
+    pending: tuple | None
+    since: float
+    loaded: tuple | None
+
+    def __init__(
+        self,
+        input: str,
+        output: str,
+        interval: float = 1.0,
+        settle: float = 2.0,
+        emit: Callable[[str, Any, dict[str, set[str]]], None] = print_check,
+    ) -> None:
+        """
+        Args:
+            - input: SS7の入力CSVパス
+            - output: SS7の出力CSVパス
+            - interval: ファイルを調べる間隔[秒]
+            - settle: 更新時刻とサイズがこの秒数変わらなければ、書き込みが終わったとみなす
+            - emit: 検定を実行するごとにemit(名前, 結果, 変わったセクション)を呼ぶ。例外が起きた場合は結果を例外とする
+        """
+        self.input = input
+        self.output = output
+        self.interval = interval
+        self.settle = settle
+        self.emit = emit
+        self.io = None
+        self.checks = {}
+        self.pending = None
+        self.since = 0
+        self.loaded = None
+
+    def register(
+        self,
+        name: str,
+        check: Callable[[SS7_IO], Any],
+        sections: list[str] | None = None,
+        methods: list[str] | None = None,
+    ) -> None:
+        """検定を登録する
+
+        Args:
+            - name: 検定の名前
+            - check: check(SS7_IO)を実行し、その戻り値を結果とする
+            - sections: checkが読むセクション(部分一致)。入力・出力のどちらのファイルでも当てる
+            - methods: checkが使うSS7_IOのメソッド(walls等)。読むセクションはSS7_IO.manifestで求める
+
+        sectionsもmethodsも省略すると、読み直すたびに実行する。
+        """
+        keys: dict[str, list[str]] | None = None
+        if sections is not None or methods is not None:
+            keys = SS7_IO.manifest(*methods) if methods is not None else {"input": [], "output": []}
+            for kind in keys:
+                keys[kind] += sections or []
+        self.checks[name] = {"check": check, "sections": keys}
+
+    def affected(self, name: str, changed: dict[str, set[str]]) -> bool:
+        """nameの検定が読むセクションが、changedに含まれるか"""
+        keys: dict[str, list[str]] | None = self.checks[name]["sections"]
+        if keys is None:
+            return True
+        return any([
+            key in section
+            for kind, names in changed.items()
+            for key in keys[kind]
+            for section in names
+        ])
+
+    def signature(self) -> tuple | None:
+        """入力・出力ファイルの(更新時刻, サイズ)。どちらかがなければNone"""
+        try:
+            return tuple([
+                (stat.st_mtime_ns, stat.st_size)
+                for stat in [os.stat(self.input), os.stat(self.output)]
+            ])
+        except FileNotFoundError:
+            return None
+
+    def update(self) -> dict[str, Any]:
+        """ファイルを読み直し、変わったセクションに関係する検定を実行して{名前: 結果}を返す"""
+        changed: dict[str, set[str]]
+        if self.io is None:
+            self.io = SS7_IO(self.input, self.output)
+            changed = {"input": set(self.io.input.keys()), "output": set(self.io.output.keys())}
+        else:
+            changed = self.io.reload()
+        results: dict[str, Any] = {}
+        for name in self.checks:
+            if not self.affected(name, changed):
+                continue
+            try:
+                results[name] = self.checks[name]["check"](self.io)
+            except Exception as e:
+                results[name] = e
+            self.emit(name, results[name], changed)
+        return results
+
+    def poll(self) -> dict[str, Any] | None:
+        """ファイルを1回調べる。書き込みの終わった変更があれば、updateの結果を返す。なければNone"""
+        signature: tuple | None = self.signature()
+        now: float = time.monotonic()
+        if signature != self.pending:
+            self.pending = signature
+            self.since = now
+        if signature is None or signature == self.loaded or now - self.since < self.settle:
+            return None
+        # 読んでいる間に書き込まれた場合は、次の変更として読み直す
+        self.loaded = signature
+        try:
+            return self.update()
+        except Exception as e:
+            print(f"{self.input}, {self.output}を読めませんでした: {e!r}")
+            return None
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        """stopがsetされるか、Ctrl+Cが押されるまで監視を続ける"""
+        stop = stop or threading.Event()
+        try:
+            while not stop.is_set():
+                self.poll()
+                stop.wait(self.interval)
+        except KeyboardInterrupt:
+            pass
@@ -62,6 +62,7 @@ class Steel_Section(str):
         matched: re.Match
         matched = re.match("S*H-(\\d+)x(\\d+)x(\\d+)x(\\d+)x*(\\d*)", steel_shape)
         if matched is not None:
+            self.shape = "H"
             self.depth = int(matched.group(1))
             self.width = int(matched.group(2))
             self.web_thick = int(matched.group(3))
@@ -5,3 +5,8 @@ from .ss7_s_beam import SS7_S_Beam
 from .ss7_multi_span_shear_wall import SS7_MultiSpanShearWall
 from .ss7_opening import SS7_Opening
 from .ss7_axis_and_floor import SS7_Axis_and_Floor
+from .ss7_span_index import SS7_Span_Index
+from .ss7_opening_sweep import sweep_openings
+from .ss7_opening_check import check_openings, openings_markdown, write_openings_markdown
+from .ss7_elevation import export_elevations
+from .ss7_joint_check import check_joints, governing_joints
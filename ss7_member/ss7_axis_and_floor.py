@@ -1,4 +1,7 @@
+import numpy as np
 import matplotlib.pyplot as plt
+from types import MappingProxyType
+from typing import Iterable, Mapping
 
 
 class SS7_Axis_and_Floor:
@@ -7,6 +10,12 @@ class SS7_Axis_and_Floor:
     floor_key: list[str]
     floor_height: list[float]
     x_axis_num: int
+    axis_index: Mapping[str, int]
+    axis_position: Mapping[str, float]
+    axis_direction: Mapping[str, str]
+    floor_index: Mapping[str, int]
+    floor_position: Mapping[str, float]
+    tick_cache: dict[bool, tuple[list[float], list[str], list[float], list[str]]]
 
     def __init__(
         self,
@@ -21,6 +30,23 @@ class SS7_Axis_and_Floor:
         self.floor_key = floor_key
         self.floor_height = floor_height
         self.x_axis_num = x_axis_num + 1
+        self.tick_cache = {}
+        # 同名の軸・階はlist.indexと同じく最初のものを採る
+        self.axis_index = MappingProxyType({
+            key: i for i, key in reversed(list(enumerate(axis_key)))
+        })
+        self.axis_position = MappingProxyType({key: axis_location[i] for key, i in self.axis_index.items()})
+        self.axis_direction = MappingProxyType({
+            key: "x" if i < self.x_axis_num else "y" for key, i in self.axis_index.items()
+        })
+        self.floor_index = MappingProxyType({
+            key: i for i, key in reversed(list(enumerate(floor_key)))
+        })
+        self.floor_position = MappingProxyType({key: floor_height[i] for key, i in self.floor_index.items()})
+
+    def __reduce__(self) -> tuple:
+        # MappingProxyTypeはpickleできないため、元の配列から作り直す
+        return (SS7_Axis_and_Floor, (self.axis_key, self.axis_location, self.floor_key, self.floor_height, self.x_axis_num - 1))
 
     def x_axis(self) -> list[str]:
         return self.axis_key[0:self.x_axis_num]
@@ -29,11 +55,13 @@ class SS7_Axis_and_Floor:
         return self.axis_key[self.x_axis_num:]
 
     def direction(self, frame: str) -> str:
-        return "x" if frame in self.x_axis() else "y"
+        return self.axis_direction.get(frame, "y")
 
     def get_axis_index(self, axis: str) -> int:
         """軸名に対応するインデックスを返す"""
-        return self.axis_key.index(axis)
+        if axis not in self.axis_index:
+            raise ValueError(f"{axis} is not in axis_key")
+        return self.axis_index[axis]
 
     def is_a_in_b(self, a: tuple[str, str, str, str], b: tuple[str, str, str, str]) -> bool:
         """階・通り・左右の通りによって規定されるaがbの中に納まっているかの真偽値を返す"""
@@ -56,11 +84,61 @@ class SS7_Axis_and_Floor:
 
     def get_axis_location(self, axis: str) -> float:
         """軸の絶対位置を返す"""
-        return self.axis_location[self.get_axis_index(axis)]
+        if axis not in self.axis_position:
+            raise ValueError(f"{axis} is not in axis_key")
+        return self.axis_position[axis]
 
     def get_floor_location(self, floor: str) -> float:
         """階の絶対位置を返す"""
-        return self.floor_height[self.floor_key.index(floor)]
+        if floor not in self.floor_position:
+            raise ValueError(f"{floor} is not in floor_key")
+        return self.floor_position[floor]
+
+    @staticmethod
+    def lookup(mapping: Mapping, keys: Iterable[str], dtype: type, kind: str) -> np.ndarray:
+        """keysの重複を除いてmappingを引き、keysと同じ形の配列にして返す"""
+        names: np.ndarray
+        inverse: np.ndarray
+        names, inverse = np.unique(np.asarray(keys, dtype=str), return_inverse=True)
+        missing: list[str] = [str(name) for name in names if name not in mapping]
+        if len(missing) > 0:
+            raise ValueError(f"{' '.join(missing)} is not in {kind}")
+        return np.array([mapping[name] for name in names.tolist()], dtype=dtype)[inverse].reshape(np.shape(keys))
+
+    def get_axis_indices(self, axes: Iterable[str]) -> np.ndarray:
+        """軸名の配列に対応するインデックスの配列を返す"""
+        return self.lookup(self.axis_index, axes, np.int64, "axis_key")
+
+    def get_axis_locations(self, axes: Iterable[str]) -> np.ndarray:
+        """軸名の配列に対応する絶対位置の配列を返す"""
+        return self.lookup(self.axis_position, axes, np.float64, "axis_key")
+
+    def get_floor_locations(self, floors: Iterable[str]) -> np.ndarray:
+        """階名の配列に対応する絶対位置の配列を返す"""
+        return self.lookup(self.floor_position, floors, np.float64, "floor_key")
+
+    def directions(self, frames: Iterable[str]) -> np.ndarray:
+        """フレーム名の配列に対応する方向("x", "y")の配列を返す"""
+        names: np.ndarray
+        inverse: np.ndarray
+        names, inverse = np.unique(np.asarray(frames, dtype=str), return_inverse=True)
+        return np.array([self.direction(name) for name in names.tolist()])[inverse].reshape(np.shape(frames))
+
+    def elevation_ticks(self, frame: str) -> tuple[list[float], list[str], list[float], list[str]]:
+        """frameの立面図の(X目盛, X目盛ラベル, Y目盛, Y目盛ラベル)を返す
+
+        frameと直交する通り芯の目盛は、frameの名前が数字で始まるかどうかだけで決まるため、その別ごとに一度だけ求める。
+        """
+        kind: bool = frame[0].isdecimal()
+        if kind not in self.tick_cache:
+            xticklabel: list[str] = [key for key in filter(lambda x: "_" not in x and x[0].isdecimal() != kind, self.axis_key)]
+            self.tick_cache[kind] = (
+                [self.get_axis_location(key) for key in xticklabel],
+                ["" if "_" in key else key for key in xticklabel],
+                self.floor_height,
+                self.floor_key,
+            )
+        return self.tick_cache[kind]
 
     def axis_in_elevation(self, frame: str) -> None:
         """Matplotlibにおいて、立面図の軸等を設定する"""
@@ -70,13 +148,14 @@ class SS7_Axis_and_Floor:
         ymax: float
         xmin, xmax = plt.xlim()
         ymin, ymax = plt.ylim()
-        xticklabel: list[str] = [key for key in filter(lambda x: "_" not in x and x[0].isdecimal() != frame[0].isdecimal(), self.axis_key)]
-        xtick: list[float] = [self.get_axis_location(key) for key in xticklabel]
-        yticklabel: list[str] = self.floor_key
-        ytick: list[float] = self.floor_height
+        xtick: list[float]
+        xticklabel: list[str]
+        ytick: list[float]
+        yticklabel: list[str]
+        xtick, xticklabel, ytick, yticklabel = self.elevation_ticks(frame)
         plt.vlines(x=xtick, ymin=ymin, ymax=ymax, color="black", linestyles="dashdot", lw=0.5)
         plt.hlines(y=ytick, xmin=xmin, xmax=xmax, color="black", linestyles="dashdot", lw=0.5)
-        plt.xticks(xtick, ["" if "_" in key else key for key in xticklabel])
+        plt.xticks(xtick, xticklabel)
         plt.yticks(ytick, yticklabel)
         plt.xlim(xmin, xmax)
         plt.ylim(ymin, ymax)
@@ -0,0 +1,87 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from .ss7_rc_wall import SS7_RC_Wall
+
+
+Outline = tuple[list[float], str, str]
+Ticks = tuple[list[float], list[str], list[float], list[str]]
+
+
+def frame_outlines(walls: list[SS7_RC_Wall]) -> dict[str, list[Outline]]:
+    """開口を割り付けた壁の矩形を、フレームごとにまとめて返す"""
+    result: dict[str, list[Outline]] = {}
+    for wall in walls:
+        if hasattr(wall, "openings"):
+            result.setdefault(wall.frame, [])
+            result[wall.frame] += wall.outlines()
+    return result
+
+
+def draw_elevation(filename: str, title: str, outlines: list[Outline], ticks: Ticks) -> str:
+    """1フレームの全ての壁・開口を1つのLineCollectionで描き、filenameに書き出す
+
+    pyplotを使わないため、画面のない環境や別プロセスでも描ける。
+    """
+    xtick: list[float]
+    xticklabel: list[str]
+    ytick: list[float]
+    yticklabel: list[str]
+    xtick, xticklabel, ytick, yticklabel = ticks
+    fig: Figure = Figure()
+    ax = fig.add_subplot()
+    ax.add_collection(LineCollection(
+        [[(l, b), (r, b), (r, t), (l, t), (l, b)] for (l, r, b, t), _, _ in outlines],
+        colors=[color for _, color, _ in outlines],
+        linestyles=[linestyle for _, _, linestyle in outlines],
+        linewidths=[0.8 if linestyle == "dotted" else 1.5 for _, _, linestyle in outlines],
+    ))
+    ax.autoscale_view()
+    xmin: float
+    xmax: float
+    ymin: float
+    ymax: float
+    xmin, xmax = ax.get_xlim()
+    ymin, ymax = ax.get_ylim()
+    ax.vlines(x=xtick, ymin=ymin, ymax=ymax, color="black", linestyles="dashdot", lw=0.5)
+    ax.hlines(y=ytick, xmin=xmin, xmax=xmax, color="black", linestyles="dashdot", lw=0.5)
+    ax.set_xticks(xtick, xticklabel)
+    ax.set_yticks(ytick, yticklabel)
+    ax.set_xlim(xmin, xmax)
+    ax.set_ylim(ymin, ymax)
+    ax.set_aspect("equal")
+    ax.set_title(title)
+    fig.savefig(filename)
+    return filename
+
+
+def export_elevations(
+    walls: list[SS7_RC_Wall],
+    directory: str,
+    format: str = "png",
+    processes: int | None = None,
+) -> list[str]:
+    """全フレームの壁・開口の立面図をdirectoryに書き出し、書き出したパスを返す
+
+    Args:
+        - walls: SS7_IO.wallsの結果
+        - directory: 書き出し先のディレクトリ
+        - format: png, pdf, svg等、Matplotlibが書き出せる形式
+        - processes: 並列に描くプロセス数。1なら並列にしない。省略するとCPU数
+
+    部材オブジェクトは渡さず、座標と目盛だけを各プロセスに渡す。
+    """
+    os.makedirs(directory, exist_ok=True)
+    outlines: dict[str, list[Outline]] = frame_outlines(walls)
+    if len(outlines) == 0:
+        return []
+    axis_and_floor = walls[0].ss7_axis_and_floor
+    args: list[tuple[str, str, list[Outline], Ticks]] = [
+        (os.path.join(directory, f"{frame}.{format}"), frame, frame_outline, axis_and_floor.elevation_ticks(frame))
+        for frame, frame_outline in outlines.items()
+    ]
+    if processes == 1:
+        return [draw_elevation(*arg) for arg in args]
+    with ProcessPoolExecutor(processes) as executor:
+        return list(executor.map(draw_elevation, *zip(*args)))
@@ -0,0 +1,221 @@
+import numpy as np
+from .ss7_s_column import SS7_S_Column
+from .ss7_s_beam import SS7_S_Beam
+from .ss7_axis_and_floor import SS7_Axis_and_Floor
+from .. import ss7_material
+
+
+# 保有耐力接合の安全率α(鋼材の引張強さ: α)。ない鋼材は1.2とする
+JOINT_ALPHA: dict[int, float] = {400: 1.3, 490: 1.2, 520: 1.2}
+
+
+def section_arrays(sections: list[ss7_material.Steel_Section]) -> dict[str, np.ndarray]:
+    """鋼材断面の寸法・強度を、断面の列の配列にして返す。同じ断面(形状, 材料)は1度だけ読む
+
+    Returns:
+        depth, width, web_thick, flange_thick, box(角形鋼管か), F(基準強度), Fu(引張強さ)。断面のない行はnan
+    """
+    names: dict[tuple[str, str], int] = {}
+    index: np.ndarray = np.array([
+        names.setdefault((str(s), str(s.steel_type)), len(names)) for s in sections
+    ], dtype=np.int64)
+    rows: list[list[float]] = []
+    for shape, steel_type in names:
+        section: ss7_material.Steel_Section = ss7_material.Steel_Section(shape, steel_type)
+        if not hasattr(section, "shape"):
+            rows.append([np.nan] * 7)
+            continue
+        rows.append([
+            section.depth,
+            section.width,
+            section.web_thick,
+            section.flange_thick,
+            section.shape == "□",
+            section.steel_type.allowable_strength(),
+            section.steel_type.standard_strength(),
+        ])
+    table: np.ndarray = np.array(rows, dtype=np.float64).reshape(-1, 7)[index]
+    return {
+        "depth": table[:, 0],
+        "width": table[:, 1],
+        "web_thick": table[:, 2],
+        "flange_thick": table[:, 3],
+        "box": table[:, 4] == 1,
+        "F": table[:, 5],
+        "Fu": table[:, 6],
+    }
+
+
+def take(values: np.ndarray, index: np.ndarray) -> np.ndarray:
+    """values[index]。添字-1の行はnan(bool配列ではFalse)とする"""
+    return np.append(values, False if values.dtype == bool else np.nan)[index]
+
+
+def plastic_moment(section: dict[str, np.ndarray]) -> np.ndarray:
+    """全塑性モーメント[kNm]。Steel_Section.plastic_designと同じ式で、角形鋼管はウェブを2枚とする"""
+    webs: np.ndarray = np.where(section["box"], 2, 1)
+    d: np.ndarray = section["depth"]
+    tf: np.ndarray = section["flange_thick"]
+    zp: np.ndarray = section["width"] * tf * (d - tf) + webs * section["web_thick"] * (d - 2 * tf) ** 2 / 4
+    return zp * section["F"] / 1e6
+
+
+def joint_strength(beam: dict[str, np.ndarray], column: dict[str, np.ndarray]) -> np.ndarray:
+    """梁端の接合部の最大曲げ耐力[kNm]。Steel_Section.strength_flange + strength_web(column)
+
+    ウェブの曲げ耐力の係数mは、角形鋼管の柱に取り付く場合のみSteel_Section.mで求め、それ以外は1とする。
+    """
+    d: np.ndarray = beam["depth"]
+    tf: np.ndarray = beam["flange_thick"]
+    flange: np.ndarray = beam["width"] * tf * (d - tf) * beam["Fu"]
+    dj: np.ndarray = d - 2 * tf
+    bj: np.ndarray = column["width"] - 2 * column["flange_thick"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m: np.ndarray = np.minimum(1, 4 * column["flange_thick"] / dj * np.sqrt(bj * column["F"] / beam["web_thick"] / beam["F"]))
+    m = np.where(column["box"], m, 1)
+    zwpe: np.ndarray = beam["web_thick"] * (dj - 2 * ss7_material.Steel_Section.SCALLOP_SIZE) ** 2 / 4
+    return (flange + m * zwpe * beam["F"]) / 1e6
+
+
+def joint_alpha(fu: np.ndarray) -> np.ndarray:
+    """梁の引張強さの配列に対応する保有耐力接合の安全率αの配列"""
+    return np.select([fu == key for key in JOINT_ALPHA], list(JOINT_ALPHA.values()), 1.2)
+
+
+def check_joints(
+    columns: list[SS7_S_Column],
+    beams: list[SS7_S_Beam],
+    required: float = 1.5,
+) -> dict[str, np.ndarray]:
+    """全てのS柱梁接合部について、柱梁耐力比と梁端の保有耐力接合を求め、余裕の小さい順に返す
+
+    梁の両端を節点(階, X軸, Y軸)と方向で索引し、節点の上下の柱(上: その階の柱の柱脚, 下: 1つ下の階の柱の柱頭)と突き合わせる。
+    断面の寸法は断面ごとに1度だけ読み、耐力は全ての接合部について配列で一度に求める。
+
+    - 柱梁耐力比: (ΣMpc) / (ΣMpb)。軸力による柱の全塑性モーメントの低減は考慮しない
+    - 保有耐力接合: 接合部の最大曲げ耐力Mu / (α Mpb)。αはJOINT_ALPHA
+    - 余裕(margin): 柱梁耐力比 / required と保有耐力接合の比の最小値。1未満はNG(ok = False)
+
+    Args:
+        - required: 必要な柱梁耐力比
+
+    Returns:
+        (節点, 方向)を行とする列の辞書。floor, x_axis, y_axis, direction, above, below(柱のkey), left, right(梁のkey),
+        mpc_above, mpc_below, mpb_left, mpb_right, column_beam_ratio, mu_left, mu_right,
+        joint_ratio_left, joint_ratio_right, margin, ok。ない柱・梁は""で、その耐力は0(保有耐力接合の比はnan)
+
+    Example:
+        >>> table = check_joints(io.s_columns(), io.s_beams())
+        >>> table["column_beam_ratio"][:3], table["ok"][:3]
+    """
+    if len(columns) == 0 or len(beams) == 0:
+        beams = []
+    axis_and_floor: SS7_Axis_and_Floor | None = beams[0].ss7_axis_and_floor if len(beams) > 0 else None
+    floors: list[str] = sorted(axis_and_floor.floor_key, key=axis_and_floor.get_floor_location) if axis_and_floor is not None else []
+    below_floor: dict[str, str] = {floors[i + 1]: floors[i] for i in range(len(floors) - 1)}
+    column_of: dict[tuple[str, str, str], int] = {}
+    for i, column in enumerate(columns):
+        column_of.setdefault((column.floor, column.x_axis, column.y_axis), i)
+
+    # 節点: (階, X軸, Y軸, 方向) -> 行。梁の左端は節点の右側の梁、右端は左側の梁
+    directions: np.ndarray = axis_and_floor.directions([b.frame for b in beams]) if len(beams) > 0 else np.empty(0, dtype=str)
+    rows: dict[tuple[str, str, str, str], int] = {}
+    left: list[int] = []
+    right: list[int] = []
+    for i, (beam, direction) in enumerate(zip(beams, directions.tolist())):
+        for axis, side in [(beam.l_axis, right), (beam.r_axis, left)]:
+            node: tuple[str, str, str, str] = (
+                beam.floor,
+                axis if direction == "x" else beam.frame,
+                axis if direction == "y" else beam.frame,
+                direction,
+            )
+            if node not in rows:
+                rows[node] = len(rows)
+                left.append(-1)
+                right.append(-1)
+            side[rows[node]] = i
+    nodes: list[tuple[str, str, str, str]] = list(rows)
+    above: np.ndarray = np.array([column_of.get(node[:3], -1) for node in nodes], dtype=np.int64)
+    below: np.ndarray = np.array([
+        column_of.get((below_floor.get(node[0], ""), node[1], node[2]), -1) for node in nodes
+    ], dtype=np.int64)
+    # 柱のない節点は接合部ではない
+    found: np.ndarray = (above >= 0) | (below >= 0)
+    nodes = [node for node, f in zip(nodes, found.tolist()) if f]
+    above = above[found]
+    below = below[found]
+    left_index: np.ndarray = np.array(left, dtype=np.int64)[found]
+    right_index: np.ndarray = np.array(right, dtype=np.int64)[found]
+    x: np.ndarray = np.array([node[3] == "x" for node in nodes], dtype=bool)
+
+    # 断面は部材ごとに1度だけ配列にし、節点の行へは添字で集める
+    column_ends: dict[str, dict[str, np.ndarray]] = {
+        key: section_arrays([ss7_material.Steel_Section(*getattr(c, key)) for c in columns])
+        for key in ["sx_top", "sy_top", "sx_bottom", "sy_bottom"]
+    }
+    beam_ends: dict[str, dict[str, np.ndarray]] = {
+        end: section_arrays([getattr(b, f"steel_{end}") for b in beams]) for end in ["left", "right"]
+    }
+    column_above: dict[str, np.ndarray] = {
+        key: np.where(x, take(column_ends["sx_bottom"][key], above), take(column_ends["sy_bottom"][key], above))
+        for key in column_ends["sx_bottom"]
+    }
+    column_below: dict[str, np.ndarray] = {
+        key: np.where(x, take(column_ends["sx_top"][key], below), take(column_ends["sy_top"][key], below))
+        for key in column_ends["sx_top"]
+    }
+    beam_left: dict[str, np.ndarray] = {key: take(value, left_index) for key, value in beam_ends["right"].items()}
+    beam_right: dict[str, np.ndarray] = {key: take(value, right_index) for key, value in beam_ends["left"].items()}
+    # 梁が取り付く柱: 下の柱の柱頭、なければ上の柱の柱脚
+    panel: dict[str, np.ndarray] = {
+        key: np.where(below >= 0, column_below[key], column_above[key]) for key in column_below
+    }
+
+    mpc_above: np.ndarray = np.nan_to_num(plastic_moment(column_above))
+    mpc_below: np.ndarray = np.nan_to_num(plastic_moment(column_below))
+    mpb_left: np.ndarray = np.nan_to_num(plastic_moment(beam_left))
+    mpb_right: np.ndarray = np.nan_to_num(plastic_moment(beam_right))
+    mu_left: np.ndarray = joint_strength(beam_left, panel)
+    mu_right: np.ndarray = joint_strength(beam_right, panel)
+    alpha_left: np.ndarray = joint_alpha(beam_left["Fu"])
+    alpha_right: np.ndarray = joint_alpha(beam_right["Fu"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        column_beam_ratio: np.ndarray = (mpc_above + mpc_below) / (mpb_left + mpb_right)
+        joint_ratio_left: np.ndarray = mu_left / (alpha_left * mpb_left)
+        joint_ratio_right: np.ndarray = mu_right / (alpha_right * mpb_right)
+    margin: np.ndarray = np.fmin(column_beam_ratio / required, np.fmin(joint_ratio_left, joint_ratio_right))
+
+    order: np.ndarray = np.argsort(margin, kind="stable")
+    column_keys: np.ndarray = np.array([c.key() for c in columns] + [""], dtype=object)
+    beam_keys: np.ndarray = np.array([b.key() for b in beams] + [""], dtype=object)
+    return {
+        "floor": np.array([node[0] for node in nodes], dtype=object)[order],
+        "x_axis": np.array([node[1] for node in nodes], dtype=object)[order],
+        "y_axis": np.array([node[2] for node in nodes], dtype=object)[order],
+        "direction": np.array([node[3] for node in nodes], dtype=object)[order],
+        "above": column_keys[above][order],
+        "below": column_keys[below][order],
+        "left": beam_keys[left_index][order],
+        "right": beam_keys[right_index][order],
+        "mpc_above": mpc_above[order],
+        "mpc_below": mpc_below[order],
+        "mpb_left": mpb_left[order],
+        "mpb_right": mpb_right[order],
+        "column_beam_ratio": column_beam_ratio[order],
+        "mu_left": mu_left[order],
+        "mu_right": mu_right[order],
+        "joint_ratio_left": joint_ratio_left[order],
+        "joint_ratio_right": joint_ratio_right[order],
+        "margin": margin[order],
+        "ok": ~(margin[order] < 1),
+    }
+
+
+def governing_joints(table: dict[str, np.ndarray], limit: int | None = None) -> list[dict]:
+    """check_jointsの結果から、NGの接合部(なければ余裕の最も小さい接合部)を1行1辞書で返す"""
+    # 行は余裕の小さい順なので、NGの接合部は先頭に並ぶ
+    count: int = int(np.count_nonzero(~table["ok"])) or min(1, len(table["ok"]))
+    if limit is not None:
+        count = min(count, limit)
+    return [{key: (column[i].item() if isinstance(column[i], np.generic) else column[i]) for key, column in table.items()} for i in range(count)]
@@ -1,3 +1,5 @@
+import numpy as np
+from typing import Any
 from .ss7_axis_and_floor import SS7_Axis_and_Floor
 from .. import ss7_tool
 
@@ -7,9 +9,50 @@ class SS7_Member_Base(ss7_tool.BaseClass):
     name: str
     ss7_axis_and_floor: SS7_Axis_and_Floor
 
+    # メソッドが使う、載荷ケースごとの表のフィールド。{出力ファイルの系列名: [フィールド名]}で、{load}は載荷ケースのキー(dsxp等)
+    # SS7_IOはこれらの表をすぐには結合せず、フィールドを最初に読むときに結合する
+    FIELDS: dict[str, list[str]] = {}
+
+    # 全ての部材に共通の属性。Member_Storeの部材では、部材ごとではなくストアに1つだけ持つ
+    SHARED: list[str] = ["ss7_axis_and_floor"]
+
     def __init__(self, dictionary: dict, axis_and_floor: SS7_Axis_and_Floor) -> None:
         super().__init__(dictionary)
         self.ss7_axis_and_floor = axis_and_floor
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # 組み立て中の部材や、キャッシュも依存する部材もない部材では、消すキャッシュがないので何もしない
+        graph: ss7_tool.Dependency_Graph = ss7_tool.dependencies
+        if len(graph.values) > 0 and (self in graph.values or self in graph.dependents):
+            graph.invalidate(self)
+
     def in_int(self, key: str) -> str:
         return f"{self.ss7_axis_and_floor.get_axis_index(key):02}"
+
+    def forces(self, component: str) -> np.ndarray:
+        """<載荷ケースのキー>_<component>の値を、LoadCaseの添字の順に並べた配列で返す。ない載荷ケースはnan
+
+        Example:
+            >>> column.forces("n_c_bottom")[ss7_tool.LoadCase.index("DSX+")]
+        """
+        if isinstance(self, ss7_tool.Store_Proxy):
+            return self._store.load_columns(component)[self._index]
+        values: list = [getattr(self, f"{key}_{component}", np.nan) for key in ss7_tool.LoadCase.keys]
+        return np.array([v if type(v) in [int, float, np.float64] else np.nan for v in values], dtype=np.float64)
+
+    def force(self, component: str, load: str | int) -> float:
+        """loadの<component>の値。ない場合はAttributeError"""
+        index: int = ss7_tool.LoadCase.index(load)
+        value: float = self.forces(component)[index]
+        if np.isnan(value):
+            return getattr(self, f"{ss7_tool.LoadCase.key(index)}_{component}")
+        return value.item()
+
+    def has_test(self, name: str, load: str | int) -> bool:
+        """loadのSS7の検定値test_<載荷ケースのキー>_<name>があるか"""
+        return hasattr(self, f"test_{ss7_tool.LoadCase.key(load)}_{name}")
+
+    def get_test(self, name: str, load: str | int) -> Any:
+        """loadのSS7の検定値test_<載荷ケースのキー>_<name>。ない場合はAttributeError"""
+        return getattr(self, f"test_{ss7_tool.LoadCase.key(load)}_{name}")
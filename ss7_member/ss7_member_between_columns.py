@@ -1,6 +1,8 @@
 from .ss7_rc_column import SS7_RC_Column
 from .ss7_member_base import SS7_Member_Base
 from .. import ss7_tool
+from typing import Callable
+import numpy as np
 
 
 class SS7_Member_Between_Columns(SS7_Member_Base):
@@ -41,9 +43,11 @@ class SS7_Member_Between_Columns(SS7_Member_Base):
     rc_column_class: SS7_RC_Column = SS7_RC_Column
     l_column: SS7_RC_Column
     r_column: SS7_RC_Column
-    towards: str = "+"
 
-    def get_column(self, columns: list[SS7_RC_Column]) -> None:
+    def get_column(self, columns: list[SS7_RC_Column] | dict[str, SS7_RC_Column]) -> None:
+        """左右の柱を割り付ける。多数の部材に割り付ける場合は{key(): 柱}の辞書を渡す"""
+        if type(columns) is dict:
+            columns = [columns[key] for key in [self.l_column_key(), self.r_column_key()] if key in columns]
         for column in columns:
             if column.key() == self.l_column_key():
                 self.l_column = column
@@ -51,25 +55,37 @@ class SS7_Member_Between_Columns(SS7_Member_Base):
             elif column.key() == self.r_column_key():
                 self.r_column = column
                 self.r_column.direction = self.direction()
+            else:
+                continue
+            ss7_tool.dependencies.depend(self, column)
 
     def compare(self, title: str, a: float, b: float, digit: int = 3) -> None:
         if not ss7_tool.a_equals_to_b(a, b, digit):
             print(f"{self.key()}\t{title}\t{a:.{digit}g}\t{b:.{digit}g}")
 
-    def load_key(self) -> str:
-        if self.direction() == "x" and self.towards == "+":
-            return "dsxp"
-        elif self.direction() == "x" and self.towards == "-":
-            return "dsxm"
-        elif self.direction() == "y" and self.towards == "+":
-            return "dsyp"
-        elif self.direction() == "y" and self.towards == "-":
-            return "dsym"
-        else:
-            raise ValueError(f"load_key: {self.direction()}{self.towards}")
-
-    def l_column_axial_force(self) -> float:
-        return getattr(self.l_column, f"{self.load_key()}_n_c_bottom") / (2 if self.has_left_wall else 1)
-
-    def r_column_axial_force(self) -> float:
-        return getattr(self.r_column, f"{self.load_key()}_n_c_bottom") / (2 if self.has_right_wall else 1)
+    def design_loads(self) -> list[int]:
+        """部材の方向の二次設計用の載荷ケース(正, 負)の添字"""
+        return [ss7_tool.LoadCase.design(self.direction(), towards) for towards in ["+", "-"]]
+
+    def design_load(self, load: str | int | None = None) -> int:
+        """loadをLoadCaseの添字にする。省略すると正方向、"+"・"-"は部材の方向のその向きの二次設計用の載荷ケース"""
+        if load is None or load in ["+", "-"]:
+            return ss7_tool.LoadCase.design(self.direction(), load or "+")
+        return ss7_tool.LoadCase.index(load)
+
+    def over_loads(self, func: Callable[[int], float], loads: list[str | int] | None = None) -> np.ndarray:
+        """loads(省略するとdesign_loads)の各載荷ケースの添字をfuncに渡して計算した配列を返す
+
+        Example:
+            >>> wall.over_loads(wall.jinsei_ultimate_strength)
+            array([6610.0, 4338.8])
+        """
+        return np.array([
+            func(ss7_tool.LoadCase.index(load)) for load in (self.design_loads() if loads is None else loads)
+        ], dtype=np.float64)
+
+    def l_column_axial_force(self, load: int) -> float:
+        return self.l_column.force("n_c_bottom", load) / (2 if self.has_left_wall else 1)
+
+    def r_column_axial_force(self, load: int) -> float:
+        return self.r_column.force("n_c_bottom", load) / (2 if self.has_right_wall else 1)
@@ -1,6 +1,7 @@
 import numpy as np
 from .ss7_member_between_columns import SS7_Member_Between_Columns
 from .ss7_rc_wall import SS7_RC_Wall
+from .ss7_span_index import SS7_Span_Index
 from .ss7_rc_column import SS7_RC_Column
 from .ss7_axis_and_floor import SS7_Axis_and_Floor
 from .. import ss7_tool
@@ -18,6 +19,25 @@ class SS7_MultiSpanShearWall(SS7_Member_Between_Columns):
     gpp_n_bottom: float
     gpp_q_bottom: float
 
+    FIELDS: dict[str, list[str]] = {
+        "連スパン壁応力表(一次)": [
+            "{load}_m_top", "{load}_q_top", "{load}_n_top",
+            "{load}_m_bottom", "{load}_q_bottom", "{load}_n_bottom",
+        ],
+        "連スパン壁応力表(二次)": [
+            "{load}_m_top", "{load}_q_top", "{load}_n_top",
+            "{load}_m_bottom", "{load}_q_bottom", "{load}_n_bottom",
+        ],
+        "連スパン壁応力表(危険断面位置)": [
+            "{load}_m_critical", "{load}_q_critical", "{load}_n_critical",
+        ],
+        "SRC耐震壁保証設計(SRC規準)": [
+            "test_{load}_effective_thickness", "test_{load}_reduction_ratio", "test_{load}_axial_force",
+            "test_{load}_shear_force", "test_{load}_tensile_steel_ratio", "test_{load}_shear_span_ratio",
+            "test_{load}_minimum_reinforcement_ratio", "test_{load}_src_ultimate_strength",
+        ],
+    }
+
     rc_wall_class: SS7_RC_Wall = SS7_RC_Wall
     rc_column_class: SS7_RC_Column = SS7_RC_Column
     walls: list[SS7_RC_Wall]
@@ -27,9 +47,10 @@ class SS7_MultiSpanShearWall(SS7_Member_Between_Columns):
     def __init__(self, dictionary: dict, axis_and_floor: SS7_Axis_and_Floor) -> None:
         super().__init__(dictionary, axis_and_floor)
 
-    def get_wall(self, walls: list[SS7_RC_Wall]) -> None:
+    def get_wall(self, walls: list[SS7_RC_Wall] | SS7_Span_Index[SS7_RC_Wall]) -> None:
+        """連スパンに納まる耐震壁を割り付ける。多数の連スパン耐震壁に割り付ける場合はSS7_Span_Indexを渡す"""
         self.walls = sorted(
-            filter(
+            walls.inside(self) if isinstance(walls, SS7_Span_Index) else filter(
                 lambda wall: self.includes(wall),
                 walls
             ),
@@ -38,7 +59,9 @@ class SS7_MultiSpanShearWall(SS7_Member_Between_Columns):
         for i in range(len(self.walls)):
             self.walls[i].has_left_wall = (i > 0)
             self.walls[i].has_right_wall = (i < len(self.walls) - 1)
+        ss7_tool.dependencies.depend(self, *self.walls)
 
+    @ss7_tool.derived
     def reduction_ratio(self) -> float:
         """各耐震壁の重みづけ平均を行った開口低減率
         """
@@ -62,34 +85,34 @@ class SS7_MultiSpanShearWall(SS7_Member_Between_Columns):
     def effective_thickness(self) -> float:
         return self.whole_area() / self.whole_length()
 
-    def effective_length(self) -> float:
+    def effective_length(self, load: int) -> float:
         d: str = self.direction()
-        return self.whole_length() - self.compression_column().depth(d) / 2
+        return self.whole_length() - self.compression_column(load).depth(d) / 2
 
-    def lever_arm_length(self) -> float:
-        return 7 / 8 * self.effective_length()
+    def lever_arm_length(self, load: int) -> float:
+        return 7 / 8 * self.effective_length(load)
 
-    def tensile_steel_ratio(self) -> float:
-        return 100 * self.tensile_column().whole_steel_area() / self.effective_thickness() / self.effective_length()
+    def tensile_steel_ratio(self, load: int) -> float:
+        return 100 * self.tensile_column(load).whole_steel_area() / self.effective_thickness() / self.effective_length(load)
 
-    def axial_force(self) -> float:
-        return getattr(self, f"{self.load_key()}_n_critical")
+    def axial_force(self, load: int) -> float:
+        return self.force("n_critical", load)
 
-    def moment(self) -> float:
-        return getattr(self, f"{self.load_key()}_m_critical")
+    def moment(self, load: int) -> float:
+        return self.force("m_critical", load)
 
-    def shear_force(self) -> float:
-        return getattr(self, f"{self.load_key()}_q_critical")
+    def shear_force(self, load: int) -> float:
+        return self.force("q_critical", load)
 
-    def axial_stress(self) -> float:
-        return self.axial_force() / self.whole_area() * 1e3
+    def axial_stress(self, load: int) -> float:
+        return self.axial_force(load) / self.whole_area() * 1e3
 
     def minimum_concrete_strength(self) -> float:
         return min([w.concrete.fc for w in self.walls])
 
     @ss7_tool.clip_decorator(1, 3)
-    def shear_span_ratio(self) -> float:
-        return abs(self.moment() / self.shear_force()) / self.whole_length() * 1e3
+    def shear_span_ratio(self, load: int) -> float:
+        return abs(self.moment(load) / self.shear_force(load)) / self.whole_length() * 1e3
 
     def minimum_reinforcement_index(self) -> int:
         return np.argmin([w.horizontal.ratio_by_strength(w.wall_thickness, "終局強度") for w in self.walls])
@@ -101,20 +124,24 @@ class SS7_MultiSpanShearWall(SS7_Member_Between_Columns):
     def minimum_reinforcement_ratio(self) -> float:
         return self.walls[self.minimum_reinforcement_index()].horizontal.ratio(self.effective_thickness())
 
-    def src_ultimate_strength(self, towards: str = None) -> float:
-        if towards is not None:
-            self.towards = towards
-        return self.reduction_ratio() * self.effective_thickness() * self.lever_arm_length() * sum([
-            0.068 * self.tensile_steel_ratio() ** 0.23 * (self.minimum_concrete_strength() + 18) / np.sqrt(0.12 + self.shear_span_ratio()),
+    @ss7_tool.derived
+    @ss7_tool.stage("SS7_MultiSpanShearWall.src_ultimate_strength")
+    def src_ultimate_strength(self, load: str | int | None = None) -> float:
+        """SRC規準による終局せん断耐力。loadはdesign_loadを参照"""
+        load = self.design_load(load)
+        return self.reduction_ratio() * self.effective_thickness() * self.lever_arm_length(load) * sum([
+            0.068 * self.tensile_steel_ratio(load) ** 0.23 * (self.minimum_concrete_strength() + 18) / np.sqrt(0.12 + self.shear_span_ratio(load)),
             0.85 * np.sqrt(self.minimum_reinforcement_strength() * self.minimum_reinforcement_ratio()),
-            0.1 * self.axial_stress(),
+            0.1 * self.axial_stress(load),
         ]) / 1e3
 
-    def jinsei_ultimate_strength(self, towards: str = None) -> float:
-        if towards is not None:
-            self.towards = towards
+    @ss7_tool.derived
+    @ss7_tool.stage("SS7_MultiSpanShearWall.jinsei_ultimate_strength")
+    def jinsei_ultimate_strength(self, load: str | int | None = None) -> float:
+        """各耐震壁の靭性指針式による終局せん断強度の和。loadはdesign_loadを参照"""
+        load = self.design_load(load)
         return sum([
-            w.jinsei_ultimate_strength() for w in self.walls
+            w.jinsei_ultimate_strength(load) for w in self.walls
         ])
 
     def test(self, key: str, digit: int = 3) -> None:
@@ -127,17 +154,17 @@ class SS7_MultiSpanShearWall(SS7_Member_Between_Columns):
             "壁筋比": "minimum_reinforcement_ratio",
         }
         name: str = name_dict[key]
-        for towards in ["+", "-"]:
-            self.towards = towards
+        for load in self.design_loads():
+            args: list[int] = [] if key in ["有効壁厚さ", "開口低減率", "壁筋比"] else [load]
             self.compare(
                 key,
-                getattr(self, name)(),
-                getattr(self, f"test_{self.load_key()}_{name}"),
+                getattr(self, name)(*args),
+                self.get_test(name, load),
                 digit,
             )
 
-    def tensile_column(self) -> SS7_RC_Column:
-        return self.l_column if getattr(self, f"{self.load_key()}_m_critical") > 0 else self.r_column
+    def tensile_column(self, load: int) -> SS7_RC_Column:
+        return self.l_column if self.moment(load) > 0 else self.r_column
 
-    def compression_column(self) -> SS7_RC_Column:
-        return self.r_column if getattr(self, f"{self.load_key()}_m_critical") > 0 else self.l_column
+    def compression_column(self, load: int) -> SS7_RC_Column:
+        return self.r_column if self.moment(load) > 0 else self.l_column
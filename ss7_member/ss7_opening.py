@@ -1,6 +1,45 @@
+import numpy as np
 from .ss7_member_between_columns import SS7_Member_Between_Columns
 
 
+def sample_index(values: np.ndarray, length: float | np.ndarray, num: int) -> np.ndarray:
+    """np.searchsorted(np.linspace(0, length, num), values, "left")と同じ添字を、標本点の配列を作らずに求める
+
+    lengthはvaluesとブロードキャストできる配列でもよい。
+    """
+    step: float | np.ndarray = length / (num - 1)
+
+    def sample(k: np.ndarray) -> np.ndarray:
+        # linspaceの標本点はk * stepで、最後の点だけlengthそのもの
+        return np.where(k >= num - 1, np.where(k == num - 1, length, np.inf), k * step)
+
+    k: np.ndarray = np.clip(np.ceil(np.asarray(values, dtype=np.float64) / step), 0, num).astype(np.int64)
+    for _ in range(2):
+        k = np.where((k > 0) & (sample(k - 1) >= values), k - 1, k)
+        k = np.where((k < num) & (sample(k) < values), k + 1, k)
+    return k
+
+
+def projected_length(starts: np.ndarray, ends: np.ndarray, length: float | np.ndarray, num: int = 100000) -> np.ndarray:
+    """[starts, ends)の区間の和集合の長さ
+
+    0~lengthをnum点で標本化し、いずれかの区間に入る点の数から求める。
+    最後の軸を区間とし、それより前の軸(候補・壁など)ごとに求める。詰め物の区間はstarts = endsとする。
+    lengthには、それより前の軸の形の配列(壁ごとの長さなど)も渡せる。
+    """
+    lengths: np.ndarray = np.asarray(length, dtype=np.float64)[..., None]
+    s: np.ndarray = sample_index(starts, lengths, num)
+    e: np.ndarray = np.maximum(sample_index(ends, lengths, num), s)
+    order: np.ndarray = np.argsort(s, axis=-1, kind="stable")
+    s = np.take_along_axis(s, order, axis=-1)
+    e = np.take_along_axis(e, order, axis=-1)
+    # 始点の順に並べ、それまでの区間の終点の最大値より先の部分だけを数える
+    reach: np.ndarray = np.maximum.accumulate(e, axis=-1)
+    previous: np.ndarray = np.concatenate([np.zeros_like(reach[..., :1]), reach[..., :-1]], axis=-1)
+    covered: np.ndarray = np.clip(e - np.maximum(s, previous), 0, None).sum(axis=-1)
+    return covered / num * length
+
+
 class SS7_Opening(SS7_Member_Between_Columns):
     """壁開口
     """
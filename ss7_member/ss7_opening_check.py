@@ -0,0 +1,108 @@
+import numpy as np
+from .ss7_rc_wall import SS7_RC_Wall, opening_reinforcement_forces
+from .ss7_opening import projected_length
+
+
+def check_openings(
+    walls: list[SS7_RC_Wall],
+    reinforcement: tuple[str, str, str] | dict[str, tuple[str, str, str]],
+    nrv: int | None = None,
+    nrh: int | None = None,
+) -> dict[str, np.ndarray]:
+    """全ての壁の全ての開口について、開口補強の応力・許容応力・検定比をまとめて求める
+
+    壁ごとの諸元(opening_reinforcement_constants)と等価開口を開口の数だけ繰り返して配列にし、
+    opening_reinforcement_forcesを1回だけ呼ぶ。check_opening_reinforcmentと同じく、開口数nv, nhは壁の開口の数とする。
+
+    Args:
+        - reinforcement: 開口補強筋(縦, 横, 斜め)。壁ごとに変える場合は{壁のkey(): (縦, 横, 斜め)}
+        - nrv, nrh: 考慮する壁筋の本数。省略すると500mmに入る本数
+
+    Returns:
+        (壁, 開口)を行とする列の辞書。wall, opening(壁での添字), owner, lo, ho, lop, hop, l, h, t, q,
+        md, mb, td, md_allowable, mb_allowable, td_allowable, ratio(行, (縦, 横, 斜)), ok
+    """
+    found: list[SS7_RC_Wall] = [w for w in walls if len(w.openings) > 0]
+    counts: np.ndarray = np.array([len(w.openings) for w in found], dtype=np.int64)
+    index: np.ndarray = np.repeat(np.arange(len(found)), counts)
+    constants: list[dict[str, float]] = [w.opening_reinforcement_constants(
+        *(reinforcement[w.key()] if isinstance(reinforcement, dict) else reinforcement),
+        nrv,
+        nrh,
+    ) for w in found]
+    columns: dict[str, np.ndarray] = {
+        key: np.array([c[key] for c in constants], dtype=np.float64)[index]
+        for key in (constants[0].keys() if len(constants) > 0 else ["l", "h", "t", "q"])
+    }
+    openings: list = [o for w in found for o in w.openings]
+
+    # 等価開口: 壁ごとの開口を(壁, 開口)の配列に詰め、全ての壁をまとめて投影する。無視する開口と詰め物は長さ0の区間とする
+    lrbt: np.ndarray = np.zeros((len(found), max(counts.tolist() + [1]), 4))
+    position: np.ndarray = np.concatenate([np.arange(n) for n in counts]) if len(counts) > 0 else np.empty(0, dtype=np.int64)
+    if len(openings) > 0:
+        lrbt[index, position] = [[0, 0, 0, 0] if o.ignore else [o.left, o.right, o.bottom, o.top] for o in openings]
+    projected: np.ndarray = np.stack([
+        projected_length(lrbt[..., 0], lrbt[..., 1], np.array([w.span_center() for w in found], dtype=np.float64)),
+        projected_length(lrbt[..., 2], lrbt[..., 3], np.array([w.height_center() for w in found], dtype=np.float64)),
+    ], axis=-1)[index]
+    ho: np.ndarray = np.array([o.height for o in openings], dtype=np.float64)
+    lo: np.ndarray = np.array([o.width for o in openings], dtype=np.float64)
+    forces: dict[str, np.ndarray] = opening_reinforcement_forces(
+        columns,
+        projected[:, 0],
+        projected[:, 1],
+        ho,
+        lo,
+        counts[index],
+        counts[index],
+    ) if len(openings) > 0 else {
+        key: np.empty(0) for key in ["md_allowable", "mb_allowable", "td_allowable", "md", "mb", "td"]
+    } | {"ratio": np.empty((0, 3))}
+    return {
+        "wall": np.array([w.key() for w in found], dtype=object)[index],
+        "opening": position,
+        "owner": np.array([o.owner for o in openings], dtype=object),
+        "lo": lo,
+        "ho": ho,
+        "lop": projected[:, 0],
+        "hop": projected[:, 1],
+        "l": columns["l"],
+        "h": columns["h"],
+        "t": columns["t"],
+        "q": columns["q"],
+    } | forces | {"ok": np.all(forces["ratio"] < 1, axis=-1)}
+
+
+def openings_markdown(table: dict[str, np.ndarray]) -> str:
+    """check_openingsの結果を、1開口1行のMarkdownの表にする"""
+    lines: list[str] = [
+        "|壁|開口|所管|開口寸法|$l_{0p}$|$h_{0p}$|$M_d$ / 許容|$M_b$ / 許容|$t_d$ / 許容|検定比 縦|横|斜|判定|",
+        "|:--|--:|:--:|--:|--:|--:|--:|--:|--:|--:|--:|--:|:--:|",
+    ]
+    ratio: np.ndarray = table["ratio"]
+    for i in range(len(table["wall"])):
+        lines.append("|".join([
+            "",
+            table["wall"][i],
+            str(table["opening"][i]),
+            table["owner"][i],
+            f'{table["lo"][i]:.0f}×{table["ho"][i]:.0f}',
+            f'{table["lop"][i]:.0f}',
+            f'{table["hop"][i]:.0f}',
+            f'{table["md"][i]:.0f} / {table["md_allowable"][i]:.0f} kNm',
+            f'{table["mb"][i]:.0f} / {table["mb_allowable"][i]:.0f} kNm',
+            f'{table["td"][i]:.0f} / {table["td_allowable"][i]:.0f} kN',
+            f"{ratio[i, 0]:.2f}",
+            f"{ratio[i, 1]:.2f}",
+            f"{ratio[i, 2]:.2f}",
+            "OK" if table["ok"][i] else "NG",
+            "",
+        ]))
+    return "\n".join(lines) + "\n"
+
+
+def write_openings_markdown(table: dict[str, np.ndarray], filename: str) -> None:
+    """openings_markdownの表を、1回の書き込みでfilenameに書き出す"""
+    text: str = openings_markdown(table)
+    with open(filename, "w", encoding="utf-8") as fp:
+        fp.write(text)
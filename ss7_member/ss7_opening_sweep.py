@@ -0,0 +1,100 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from .ss7_rc_wall import SS7_RC_Wall
+from .ss7_opening import SS7_Opening, projected_length
+
+
+def evaluate_layouts(wall: SS7_RC_Wall, layouts: list[list[list]], reinforcement: tuple[str, str, str]) -> list[dict]:
+    """1つの壁について、開口の配置の候補をまとめて評価する
+
+    候補ごとの開口を(候補, 開口)の配列に詰め、等価開口と開口補強の検定比を配列で一度に計算する。
+    壁の開口(wall.openings)は変えない。
+    """
+    located: list[list[SS7_Opening]] = [[o.relative_to_absolute(
+        wall.span_inside(),
+        wall.span_center(),
+        wall.height_inside(),
+        wall.height_center(),
+    ) for o in wall.candidate_openings(*layout)] for layout in layouts]
+    shape: tuple[int, int] = (len(located), max([len(openings) for openings in located] + [1]))
+    lrbt: np.ndarray = np.zeros(shape + (4,))
+    ignore: np.ndarray = np.zeros(shape, dtype=bool)
+    valid: np.ndarray = np.zeros(shape, dtype=bool)
+    for i, openings in enumerate(located):
+        if len(openings) > 0:
+            lrbt[i, :len(openings)] = [[o.left, o.right, o.bottom, o.top] for o in openings]
+            ignore[i, :len(openings)] = [o.ignore for o in openings]
+            valid[i, :len(openings)] = True
+
+    # 無視する開口と詰め物は、長さ0の区間として投影する
+    projected: np.ndarray = np.where((valid & ~ignore)[..., None], lrbt, 0)
+    lop: np.ndarray = projected_length(projected[..., 0], projected[..., 1], wall.span_center())
+    hop: np.ndarray = projected_length(projected[..., 2], projected[..., 3], wall.height_center())
+    count: np.ndarray = valid.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio: np.ndarray = wall.opening_reinforcement(
+            lop[:, None],
+            hop[:, None],
+            lrbt[..., 3] - lrbt[..., 2],
+            lrbt[..., 1] - lrbt[..., 0],
+            count[:, None],
+            count[:, None],
+            *reinforcement,
+        )["ratio"]
+    ratio[~valid] = np.nan
+
+    result: list[dict] = []
+    for i, openings in enumerate(located):
+        ratios: np.ndarray = ratio[i, :len(openings)]
+        worst: float = float(np.max(ratios)) if len(openings) > 0 else 0.0
+        result.append({
+            "wall": wall.key(),
+            "candidate": i,
+            "projected": (lop[i].item(), hop[i].item()),
+            "ignored": ignore[i, :len(openings)].tolist(),
+            "owners": [o.owner for o in openings],
+            "ratio": ratios.tolist(),
+            "max_ratio": worst,
+            "ok": worst < 1,
+        })
+    return result
+
+
+def sweep_openings(
+    candidates: list[tuple[SS7_RC_Wall, list[list]]],
+    reinforcement: tuple[str, str, str],
+    processes: int | None = None,
+) -> list[dict]:
+    """壁ごとの開口の配置の候補を評価し、開口補強の検定比の最大値の小さい順に並べて返す
+
+    Args:
+        - candidates: (壁, 開口の配置)の配列。開口の配置はupdate_openingsと同じ[l1, h1, l2, h2, 押えタイプ(, owner)]の配列
+        - reinforcement: 開口補強筋(縦, 横, 斜め)。check_opening_reinforcmentのrv, rh, rdと同じ
+        - processes: 与えると、壁ごとの評価をprocessesのプロセスで並列に行う
+
+    各行は{"wall", "candidate"(candidatesでの添字), "projected": (l0p, h0p), "ignored", "owners",
+    "ratio": 開口ごとの(縦, 横, 斜)の検定比, "max_ratio", "ok"}。
+    開口数(nv, nh)は候補の開口の数とし、ignoreの開口も検定する。
+
+    Example:
+        >>> sweep_openings([(wall, [[1000, 1000, 500, 500, 11, "設備"]]), (wall, [])], ("2-D13", "2-D13", "1-D13"))[0]["max_ratio"]
+    """
+    groups: dict[int, tuple[SS7_RC_Wall, list[int]]] = {}
+    for i, (wall, _) in enumerate(candidates):
+        groups.setdefault(id(wall), (wall, []))[1].append(i)
+    jobs: list[tuple[SS7_RC_Wall, list[list[list]], tuple[str, str, str]]] = [
+        (wall, [candidates[i][1] for i in indices], reinforcement) for wall, indices in groups.values()
+    ]
+    evaluated: list[list[dict]]
+    if processes is None:
+        evaluated = [evaluate_layouts(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            evaluated = list(executor.map(evaluate_layouts, *zip(*jobs)))
+
+    result: list[dict] = []
+    for (_, indices), rows in zip(groups.values(), evaluated):
+        for i, row in zip(indices, rows):
+            result.append(row | {"candidate": i})
+    result.sort(key=lambda row: (row["max_ratio"], row["candidate"]))
+    return result
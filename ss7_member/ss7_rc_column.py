@@ -34,6 +34,33 @@ class SS7_RC_Column(SS7_Member_On_Column):
 
     gpp_n_bottom: float
 
+    FIELDS: dict[str, list[str]] = {
+        "柱応力表(一次)": [
+            "{load}_m_top_x", "{load}_q_top_x", "{load}_m_top_y",
+            "{load}_q_top_y", "{load}_m_bottom_x", "{load}_q_bottom_x",
+            "{load}_m_bottom_y", "{load}_q_bottom_y", "{load}_m_center_x",
+            "{load}_m_center_y", "{load}_n_top", "{load}_n_bottom",
+        ],
+        "柱応力表(二次)": [
+            "{load}_m_top_x", "{load}_q_top_x", "{load}_m_top_y",
+            "{load}_q_top_y", "{load}_m_bottom_x", "{load}_q_bottom_x",
+            "{load}_m_bottom_y", "{load}_q_bottom_y", "{load}_m_center_x",
+            "{load}_m_center_y", "{load}_n_top", "{load}_n_bottom",
+        ],
+        "柱初期応力表": [
+            "{load}_m_i_top_x", "{load}_q_i_top_x", "{load}_m_i_top_y",
+            "{load}_q_i_top_y", "{load}_m_i_bottom_x", "{load}_q_i_bottom_x",
+            "{load}_m_i_bottom_y", "{load}_q_i_bottom_y", "{load}_m_i_center_x",
+            "{load}_m_i_center_y", "{load}_n_i_top", "{load}_n_i_bottom",
+        ],
+        "柱応力表(危険断面位置)": [
+            "{load}_m_c_top_x", "{load}_q_c_top_x", "{load}_m_c_top_y",
+            "{load}_q_c_top_y", "{load}_m_c_bottom_x", "{load}_q_c_bottom_x",
+            "{load}_m_c_bottom_y", "{load}_q_c_bottom_y", "{load}_n_c_top",
+            "{load}_n_c_bottom",
+        ],
+    }
+
     def __init__(self, dictionary: dict, axis_and_floor: SS7_Axis_and_Floor) -> None:
         super().__init__(dictionary, axis_and_floor)
         self.sx_top = ss7_material.Steel_Section(*self.sx_top)
@@ -87,4 +114,4 @@ class SS7_RC_Column(SS7_Member_On_Column):
         )
 
     def axial_force(self, load: str) -> float:
-        return getattr(self, f"{load}_n_bottom")
+        return self.force("n_bottom", load)
@@ -1,13 +1,61 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from .ss7_member_between_columns import SS7_Member_Between_Columns
-from .ss7_opening import SS7_Opening
+from .ss7_opening import SS7_Opening, projected_length
+from .ss7_span_index import SS7_Span_Index
 from .ss7_axis_and_floor import SS7_Axis_and_Floor
 from .ss7_rc_column import SS7_RC_Column
 from .. import ss7_material
 from .. import ss7_tool
 
 
+def opening_reinforcement_forces(
+    constants: dict[str, float | np.ndarray],
+    lop: float | np.ndarray,
+    hop: float | np.ndarray,
+    ho: float | np.ndarray,
+    lo: float | np.ndarray,
+    nv: int | np.ndarray,
+    nh: int | np.ndarray,
+) -> dict[str, float | np.ndarray]:
+    """壁と補強筋の諸元(SS7_RC_Wall.opening_reinforcement_constants)と開口から、開口補強の応力と検定比を求める
+
+    諸元・開口のいずれにも配列を渡せ、結果はそれらをブロードキャストした形になる。
+
+    Returns:
+        - md_allowable, mb_allowable, td_allowable: 許容応力
+        - md, mb, td: 設計応力
+        - ratio: (縦, 横, 斜)の検定比を最後の軸に並べた配列
+    """
+    l: float | np.ndarray = constants["l"]
+    h: float | np.ndarray = constants["h"]
+    t: float | np.ndarray = constants["t"]
+    q: float | np.ndarray = constants["q"]
+    adft: float | np.ndarray = constants["adft"]
+    root: float = 2.0**0.5
+    td_allowable: float | np.ndarray = (adft + (constants["avft"] + constants["ahft"]) / root) / 1e3
+    md_allowable: float | np.ndarray = sum([
+        (l - lop) * (adft / root + constants["avoft"]),
+        t * (l - lop) ** 2 / 4 / (nh + 1) * constants["psvft"],
+    ]) / 1e6
+    mb_allowable: float | np.ndarray = sum([
+        (h - hop) * (adft / root + constants["ahoft"]),
+        t * (h - hop) ** 2 / 4 / nv * constants["pshft"],
+    ]) / 1e6
+    td: float | np.ndarray = (ho + lo) / 2 / root / l * q
+    md: float | np.ndarray = ho / 2 * q / 1e3
+    mb: float | np.ndarray = lo / 2 * h / l * q / 1e3
+    return {
+        "md_allowable": md_allowable,
+        "mb_allowable": mb_allowable,
+        "td_allowable": td_allowable,
+        "md": md,
+        "mb": mb,
+        "td": td,
+        "ratio": np.stack(np.broadcast_arrays(md / md_allowable, mb / mb_allowable, td / td_allowable), axis=-1),
+    }
+
+
 class SS7_RC_Wall(SS7_Member_Between_Columns):
     """RC, SRC壁
     """
@@ -22,6 +70,32 @@ class SS7_RC_Wall(SS7_Member_Between_Columns):
     gpp_n_bottom: float
     gpp_q_bottom: float
 
+    FIELDS: dict[str, list[str]] = {
+        "壁応力表(一次)": [
+            "{load}_m_top", "{load}_q_top", "{load}_n_top",
+            "{load}_m_bottom", "{load}_q_bottom", "{load}_n_bottom",
+        ],
+        "壁応力表(二次)": [
+            "{load}_m_top", "{load}_q_top", "{load}_n_top",
+            "{load}_m_bottom", "{load}_q_bottom", "{load}_n_bottom",
+        ],
+        "壁応力表(危険断面位置)": [
+            "{load}_m_critical", "{load}_q_critical", "{load}_n_critical",
+        ],
+        "RC耐震壁保証設計(靭性指針式)": [
+            "test_{load}_nl_ne", "test_{load}_shear_force", "test_{load}_jinsei_ultimate_strength",
+        ],
+        "RC耐震壁保証設計(靭性指針式の諸係数)": [
+            "test_{load}_hinge_rotation", "test_{load}_effective_column_width", "test_{load}_delta_arch",
+            "test_{load}_delta_truss", "test_{load}_arch_effective_length", "test_{load}_truss_effective_length",
+            "test_{load}_tan_theta", "test_{load}_concrete_effectiveness", "test_{load}_beta",
+            "test_{load}_arch_contribution", "test_{load}_truss_contribution", "test_{load}_required_column_contribution",
+            "test_{load}_allowable_column_contribution", "test_{load}_compression_column", "test_{load}_wall_thickness",
+            "test_{load}_span_center", "test_{load}_Dcx", "test_{load}_Dcy",
+            "test_{load}_concrete_compression_strength",
+        ],
+    }
+
     multi_openings: str = None
 
     wall_thickness: int
@@ -48,14 +122,19 @@ class SS7_RC_Wall(SS7_Member_Between_Columns):
         name: str = dictionary["name"]
         self.name = ("E" if self.reduction_ratio > 0.6 and name[0] == "W" else "") + name
 
-    def get_openings(self, openings: list[SS7_Opening]) -> None:
+    def get_openings(self, openings: list[SS7_Opening] | SS7_Span_Index[SS7_Opening]) -> None:
+        """壁に納まる開口を割り付ける。多数の壁に割り付ける場合はSS7_Span_Indexを渡す"""
+        found: list[SS7_Opening] = openings.inside(self) if isinstance(openings, SS7_Span_Index) else [
+            o for o in filter(lambda o: self.includes(o), openings)
+        ]
         result: list[SS7_Opening] = sorted([o.relative_to_absolute(
             self.span_inside(),
             self.span_center(),
             self.height_inside(),
             self.height_center(),
-        ) for o in filter(lambda o: self.includes(o), openings)], key=lambda o: o.left)
+        ) for o in found], key=lambda o: o.left)
         self.openings = result
+        ss7_tool.dependencies.depend(self, *result)
 
     def get_nodes(self) -> None:
         pass
@@ -75,30 +154,34 @@ class SS7_RC_Wall(SS7_Member_Between_Columns):
     def area(self) -> float:
         return self.wall_length * self.wall_thickness
 
-    def jinsei_ultimate_strength(self) -> float:
-        expect_delta: bool = self.can_expect_column_contribution()
-        return self.reduction_ratio * (self.truss_contribution(expect_delta) + self.arch_contribution(expect_delta))
+    @ss7_tool.derived
+    @ss7_tool.stage("SS7_RC_Wall.jinsei_ultimate_strength")
+    def jinsei_ultimate_strength(self, load: str | int | None = None) -> float:
+        """靭性指針式による終局せん断強度。loadはdesign_loadを参照"""
+        load = self.design_load(load)
+        expect_delta: bool = self.can_expect_column_contribution(load)
+        return self.reduction_ratio * (self.truss_contribution(expect_delta, load) + self.arch_contribution(expect_delta, load))
 
-    def truss_contribution(self, expect_delta: bool) -> float:
+    def truss_contribution(self, expect_delta: bool, load: int) -> float:
         return np.prod([
-            self.wall_thickness,                        # mm
-            self.truss_effective_length(expect_delta),  # mm
-            self.horizontal_ratio_by_strength(),        # N/mm^2
+            self.wall_thickness,                              # mm
+            self.truss_effective_length(expect_delta, load),  # mm
+            self.horizontal_ratio_by_strength(load),          # N/mm^2
             self.cot_phi(),
         ]) / 1e3
 
-    def horizontal_ratio_by_strength(self) -> float:
+    def horizontal_ratio_by_strength(self, load: int) -> float:
         return np.clip(
             self.horizontal.ratio_by_strength(self.wall_thickness, "終局強度"),
             -float("inf"),
-            self.effective_concrete_strength(),
+            self.effective_concrete_strength(load),
         )
 
-    def effective_concrete_strength(self) -> float:
-        return self.concrete_effectiveness() * self.concrete.compression_strength() / 2
+    def effective_concrete_strength(self, load: int) -> float:
+        return self.concrete_effectiveness(load) * self.concrete.compression_strength() / 2
 
-    def concrete_effectiveness(self) -> float:
-        ru: float = self.hinge_rotation()
+    def concrete_effectiveness(self, load: int) -> float:
+        ru: float = self.hinge_rotation(load)
         nu_0: float = 0.7 - self.concrete.compression_strength() / 200
         return (
             nu_0 if ru < 0.005 else
@@ -106,181 +189,180 @@ class SS7_RC_Wall(SS7_Member_Between_Columns):
             0.4 * nu_0
         )
 
-    def hinge_rotation(self) -> float:
-        if hasattr(self, f"test_{self.load_key()}_hinge_rotation"):
-            return getattr(self, f"test_{self.load_key()}_hinge_rotation")
+    def hinge_rotation(self, load: int) -> float:
+        if self.has_test("hinge_rotation", load):
+            return self.get_test("hinge_rotation", load)
         else:
             return 0.002
 
-    def arch_contribution(self, expect_delta: bool) -> float:
+    def arch_contribution(self, expect_delta: bool, load: int) -> float:
         return np.prod([
-            self.tan_theta(expect_delta),
-            1 - self.beta(),
+            self.tan_theta(expect_delta, load),
+            1 - self.beta(load),
             self.wall_thickness,
-            self.arch_effective_length(expect_delta),
-            self.effective_concrete_strength(),
+            self.arch_effective_length(expect_delta, load),
+            self.effective_concrete_strength(load),
         ]) / 1e3
 
-    def arch_effective_length(self, expect_delta: bool) -> float:
+    def arch_effective_length(self, expect_delta: bool, load: int) -> float:
         return sum([
             self.wall_length,
-            self.compression_column().depth(self.direction()),
-            self.delta_arch(expect_delta),
+            self.compression_column(load).depth(self.direction()),
+            self.delta_arch(expect_delta, load),
         ])
 
-    def truss_effective_length(self, expect_delta: bool) -> float:
+    def truss_effective_length(self, expect_delta: bool, load: int) -> float:
         return sum([
             self.wall_length,
-            self.compression_column().depth(self.direction()),
-            self.delta_truss(expect_delta),
+            self.compression_column(load).depth(self.direction()),
+            self.delta_truss(expect_delta, load),
         ])
 
-    def delta_arch(self, expect_delta: bool) -> float:
+    def delta_arch(self, expect_delta: bool, load: int) -> float:
         if not expect_delta:
             return 0
-        ace: float = self.effective_compression_column_area()
-        dc: float = self.compression_column().depth(self.direction())
+        ace: float = self.effective_compression_column_area(load)
+        dc: float = self.compression_column(load).depth(self.direction())
         tw: float = self.wall_thickness
         return (
             ace / tw if ace < tw * dc else
             (dc + np.sqrt(ace * dc / tw)) / 2
         )
 
-    def delta_truss(self, expect_delta: bool) -> float:
+    def delta_truss(self, expect_delta: bool, load: int) -> float:
         if not expect_delta:
             return 0
-        ace: float = self.effective_compression_column_area()
-        dc: float = self.compression_column().depth(self.direction())
+        ace: float = self.effective_compression_column_area(load)
+        dc: float = self.compression_column(load).depth(self.direction())
         tw: float = self.wall_thickness
         return (
             ace / tw if ace < tw * dc else
             dc
         )
 
-    def effective_compression_column_area(self) -> float:
+    def effective_compression_column_area(self, load: int) -> float:
+        column: SS7_RC_Column = self.compression_column(load)
         return np.clip(
-            self.compression_column().area() - self.ncc() / self.compression_column().concrete.compression_strength() * 1e3,
+            column.area() - self.ncc(load) / column.concrete.compression_strength() * 1e3,
             0,
-            3 * self.wall_thickness * self.compression_column().depth(self.direction()),
+            3 * self.wall_thickness * column.depth(self.direction()),
         )
 
-    def m(self, key: str) -> float:
-        return getattr(self, f"{self.load_key()}_m_{key}")
-
-    def q(self, key: str) -> float:
-        return getattr(self, f"{self.load_key()}_q_{key}")
+    def m(self, key: str, load: int) -> float:
+        return self.force(f"m_{key}", load)
 
-    def n(self, key: str) -> float:
-        return getattr(self, f"{self.load_key()}_n_{key}")
+    def q(self, key: str, load: int) -> float:
+        return self.force(f"q_{key}", load)
 
-    def get_test(self, key: str) -> float:
-        return getattr(self, f"test_{self.load_key()}_{key}")
+    def n(self, key: str, load: int) -> float:
+        return self.force(f"n_{key}", load)
 
-    def ln(self, key: str) -> float:
-        return getattr(self.l_column, f"{self.load_key()}_n_{key}") / (2 if self.has_left_wall else 1)
+    def ln(self, key: str, load: int) -> float:
+        return self.l_column.force(f"n_{key}", load) / (2 if self.has_left_wall else 1)
 
-    def rn(self, key: str) -> float:
-        return getattr(self.r_column, f"{self.load_key()}_n_{key}") / (2 if self.has_right_wall else 1)
+    def rn(self, key: str, load: int) -> float:
+        return self.r_column.force(f"n_{key}", load) / (2 if self.has_right_wall else 1)
 
-    def bottom_face_from_axis(self) -> float:
-        m_bottom: float = self.m("bottom")
-        m_critical: float = self.m("critical")
-        q_bottom: float = self.q("bottom")
+    def bottom_face_from_axis(self, load: int) -> float:
+        m_bottom: float = self.m("bottom", load)
+        m_critical: float = self.m("critical", load)
+        q_bottom: float = self.q("bottom", load)
         return (m_bottom - m_critical) / q_bottom
 
-    def structural_height(self) -> float:
-        m_top: float = self.m("top")
-        m_bottom: float = self.m("bottom")
-        q_bottom: float = self.q("bottom")
+    def structural_height(self, load: int) -> float:
+        m_top: float = self.m("top", load)
+        m_bottom: float = self.m("bottom", load)
+        q_bottom: float = self.q("bottom", load)
         return (m_top + m_bottom) / q_bottom
 
-    def mwt(self) -> float:
-        lni_top: float = self.ln("i_top")
-        lni_bottom: float = self.ln("i_bottom")
-        rni_top: float = self.rn("i_top")
-        rni_bottom: float = self.rn("i_bottom")
+    @ss7_tool.derived
+    def mwt(self, load: int) -> float:
+        lni_top: float = self.ln("i_top", load)
+        lni_bottom: float = self.ln("i_bottom", load)
+        rni_top: float = self.rn("i_top", load)
+        rni_bottom: float = self.rn("i_bottom", load)
         mi_top: float = (rni_top - lni_top) * self.span_center() / 2000
         mi_bottom: float = (rni_bottom - lni_bottom) * self.span_center() / 2000
-        qi: float = (mi_top + mi_bottom) / self.structural_height()
-        mc_bottom: float = mi_bottom - qi * self.bottom_face_from_axis()
-        lnc_bottom: float = self.ln("c_bottom")
-        rnc_bottom: float = self.rn("c_bottom")
+        qi: float = (mi_top + mi_bottom) / self.structural_height(load)
+        mc_bottom: float = mi_bottom - qi * self.bottom_face_from_axis(load)
+        lnc_bottom: float = self.ln("c_bottom", load)
+        rnc_bottom: float = self.rn("c_bottom", load)
         ln_bottom: float = lnc_bottom - lni_bottom
         rn_bottom: float = rnc_bottom - rni_bottom
         m_bottom: float = (rn_bottom - ln_bottom) * self.span_center() / 2000
         return - sum([
-            self.m("critical"),
+            self.m("critical", load),
             mc_bottom,
             m_bottom,
         ])
         return - sum([
-            self.m("critical"),
-            - self.ln("c_bottom") * self.span_center() / 2000,
-            + self.rn("c_bottom") * self.span_center() / 2000,
+            self.m("critical", load),
+            - self.ln("c_bottom", load) * self.span_center() / 2000,
+            + self.rn("c_bottom", load) * self.span_center() / 2000,
         ])
 
-    def tensile_column(self) -> SS7_RC_Column:
-        return self.r_column if self.mwt() > 0 else self.l_column
+    def tensile_column(self, load: int) -> SS7_RC_Column:
+        return self.r_column if self.mwt(load) > 0 else self.l_column
 
-    def compression_column(self) -> SS7_RC_Column:
-        return self.l_column if self.mwt() > 0 else self.r_column
+    def compression_column(self, load: int) -> SS7_RC_Column:
+        return self.l_column if self.mwt(load) > 0 else self.r_column
 
-    def nl_ne(self) -> float:
+    def nl_ne(self, load: int) -> float:
         return sum([
-            self.ln("c_bottom"),
-            self.rn("c_bottom"),
-            self.n("critical"),
+            self.ln("c_bottom", load),
+            self.rn("c_bottom", load),
+            self.n("critical", load),
         ])
 
-    def ncc(self) -> float:
-        return self.nl_ne() + self.mwt() / self.span_center() * 1000
-        return self.nl_ne() + abs(self.mwt()) / self.span_center() * 1000
+    def ncc(self, load: int) -> float:
+        return self.nl_ne(load) + self.mwt(load) / self.span_center() * 1000
+        return self.nl_ne(load) + abs(self.mwt(load)) / self.span_center() * 1000
 
     def cot_phi(self) -> float:
         return 1
 
-    def hw(self) -> float:
-        if hasattr(self, f"test_{self.load_key()}_tan_theta"):
-            tan: float = self.get_test("tan_theta")
-            dlwa: float = self.get_test("delta_arch")
-            return self.arch_effective_length(dlwa > 0) * (1 - tan**2) / 2 / tan
+    def hw(self, load: int) -> float:
+        if self.has_test("tan_theta", load):
+            tan: float = self.get_test("tan_theta", load)
+            dlwa: float = self.get_test("delta_arch", load)
+            return self.arch_effective_length(dlwa > 0, load) * (1 - tan**2) / 2 / tan
         else:
             return self.floor_height
 
-    def tan_theta(self, expect_delta: bool) -> float:
-        hwlwa: float = self.hw() / self.arch_effective_length(expect_delta)
+    def tan_theta(self, expect_delta: bool, load: int) -> float:
+        hwlwa: float = self.hw(load) / self.arch_effective_length(expect_delta, load)
         return np.sqrt(hwlwa**2 + 1) - hwlwa
 
-    def beta(self) -> float:
+    def beta(self, load: int) -> float:
         return np.prod([
             (1 + self.cot_phi()**2),
             self.horizontal.ratio_by_strength(self.wall_thickness, "終局強度"),
-            1 / self.effective_concrete_strength() / 2,
+            1 / self.effective_concrete_strength(load) / 2,
         ])
 
-    def can_expect_column_contribution(self) -> bool:
-        return self.required_column_contribution() <= self.allowable_column_contribution()
+    def can_expect_column_contribution(self, load: int) -> bool:
+        return self.required_column_contribution(load) <= self.allowable_column_contribution(load)
 
     @ss7_tool.clip_decorator(min=0)
-    def effective_column_width(self) -> float:
-        return self.effective_compression_column_area() / self.compression_column().depth(self.direction()) - self.beta() * self.wall_thickness
+    def effective_column_width(self, load: int) -> float:
+        return self.effective_compression_column_area(load) / self.compression_column(load).depth(self.direction()) - self.beta(load) * self.wall_thickness
 
     @ss7_tool.clip_decorator(min=0)
-    def required_column_contribution(self) -> float:
+    def required_column_contribution(self, load: int) -> float:
         return np.prod([
             2,
-            self.arch_contribution(True),
-            self.delta_arch(True) - self.compression_column().depth(self.direction()) / 2,
-            1 / self.arch_effective_length(True),
-            1 / (1 + self.tan_theta(True)**2),
+            self.arch_contribution(True, load),
+            self.delta_arch(True, load) - self.compression_column(load).depth(self.direction()) / 2,
+            1 / self.arch_effective_length(True, load),
+            1 / (1 + self.tan_theta(True, load)**2),
             2,
         ])
 
-    def allowable_column_contribution(self) -> float:
+    def allowable_column_contribution(self, load: int) -> float:
         return np.prod([
-            self.effective_column_width(),
-            self.compression_column().between_main_reinforcement(self.direction()),
-            self.compression_column().hoop_ratio_by_strength(self.direction(), key="規格降伏点"),
+            self.effective_column_width(load),
+            self.compression_column(load).between_main_reinforcement(self.direction()),
+            self.compression_column(load).hoop_ratio_by_strength(self.direction(), key="規格降伏点"),
         ]) / 1000
 
     def test(self, key: str, digit: int) -> None:
@@ -303,24 +385,25 @@ class SS7_RC_Wall(SS7_Member_Between_Columns):
             "圧縮側柱": "compression_column",
         }
         name: str = name_dict[key]
-        for towards in ["+", "-"]:
-            self.towards = towards
+        for load in self.design_loads():
+            load_key: str = ss7_tool.LoadCase.key(load)
             if key == "圧縮側柱":
-                testee: str = self.get_test("compression_column")[0]
-                tested: str = "左" if self.compression_column() is self.l_column else "右"
+                testee: str = self.get_test("compression_column", load)[0]
+                tested: str = "左" if self.compression_column(load) is self.l_column else "右"
                 if tested != testee:
-                    print(f"{self.key()}\t{key}\t{self.load_key()}\t{tested}\t{testee}")
+                    print(f"{self.key()}\t{key}\t{load_key}\t{tested}\t{testee}")
             else:
-                args: list[bool] = [] if key in ["Ru", "be", "ν", "β", "Vac", "Vtc", "N", "Vu"] else [self.can_expect_column_contribution()]    # [getattr(self, f"test_delta_arch_{self.load_key()}") > 0]
+                args: list[bool] = [] if key in ["Ru", "be", "ν", "β", "Vac", "Vtc", "N", "Vu"] else [self.can_expect_column_contribution(load)]    # [self.get_test("delta_arch", load) > 0]
                 self.compare(
-                    f"{key}\t{self.load_key()}",
-                    getattr(self, name)(*args),
-                    self.get_test(name),
+                    f"{key}\t{load_key}",
+                    getattr(self, name)(*args, load),
+                    self.get_test(name, load),
                     digit
                 )
 
-    def update_openings(self, *openings: list[list[int]]) -> None:
-        self.get_openings([SS7_Opening(
+    def candidate_openings(self, *openings: list) -> list[SS7_Opening]:
+        """[l1, h1, l2, h2, 押えタイプ(, owner)]の各行から、この壁の開口(位置は未確定)を作る"""
+        return [SS7_Opening(
             {
                 "floor": self.floor,
                 "frame": self.frame,
@@ -331,10 +414,70 @@ class SS7_RC_Wall(SS7_Member_Between_Columns):
                 "l2": l2,
                 "h1": h1,
                 "h2": h2,
-                "owner": "",
+                "owner": owner[0] if len(owner) > 0 else "",
             },
             self.ss7_axis_and_floor,
-        ) for l1, h1, l2, h2, dimension in openings])
+        ) for l1, h1, l2, h2, dimension, *owner in openings]
+
+    def update_openings(self, *openings: list[list[int]]) -> None:
+        self.get_openings(self.candidate_openings(*openings))
+
+    def opening_reinforcement_constants(
+        self,
+        rv: str,
+        rh: str,
+        rd: str,
+        nrv: int | None = None,
+        nrh: int | None = None,
+    ) -> dict[str, float]:
+        """開口補強の検定に使う、壁と補強筋の諸元(l, h, t, q, nrv, nrh, psvft, pshft, avoft, ahoft, avft, ahft, adft)"""
+        if nrv is None:
+            nrv = np.floor(500 / self.vertical.interval)
+        if nrh is None:
+            nrh = np.floor(500 / self.horizontal.interval)
+        avoft: float = ss7_material.Main_Reinforcement(rv).area_by_strength()
+        ahoft: float = ss7_material.Main_Reinforcement(rh).area_by_strength()
+        return {
+            "l": sum([
+                self.wall_length,
+                self.l_column.depth(self.direction()),
+                self.r_column.depth(self.direction()),
+            ]),
+            "h": self.height_center(),
+            "t": self.wall_thickness,
+            "q": self.qds * (4.1 if self.direction() == "x" else 4.15),
+            "nrv": nrv,
+            "nrh": nrh,
+            "psvft": self.vertical.ratio_by_strength(self.wall_thickness),
+            "pshft": self.horizontal.ratio_by_strength(self.wall_thickness),
+            "avoft": avoft,
+            "ahoft": ahoft,
+            "avft": avoft + self.vertical.area_by_strength() * nrv,
+            "ahft": ahoft + self.horizontal.area_by_strength() * nrh,
+            "adft": ss7_material.Main_Reinforcement(rd).area_by_strength(),
+        }
+
+    def opening_reinforcement(
+        self,
+        lop: float | np.ndarray,
+        hop: float | np.ndarray,
+        ho: float | np.ndarray,
+        lo: float | np.ndarray,
+        nv: int | np.ndarray,
+        nh: int | np.ndarray,
+        rv: str,
+        rh: str,
+        rd: str,
+        nrv: int | None = None,
+        nrh: int | None = None,
+    ) -> dict[str, float | np.ndarray]:
+        """開口補強の許容応力・設計応力・検定比を辞書で返す
+
+        lop, hop(等価開口), ho, lo(検討する開口), nv, nh(開口数)には配列も渡せ、結果は同じ形の配列になる。
+        諸元はopening_reinforcement_constants、応力と検定比はopening_reinforcement_forcesを参照。
+        """
+        constants: dict[str, float] = self.opening_reinforcement_constants(rv, rh, rd, nrv, nrh)
+        return constants | opening_reinforcement_forces(constants, lop, hop, ho, lo, nv, nh)
 
     def check_opening_reinforcment(
         self,
@@ -351,43 +494,24 @@ class SS7_RC_Wall(SS7_Member_Between_Columns):
             nv = len(self.openings)
         if nh is None:
             nh = len(self.openings)
-        if nrv is None:
-            nrv = np.floor(500 / self.vertical.interval)
-        if nrh is None:
-            nrh = np.floor(500 / self.horizontal.interval)
-        h: int = self.height_center()
-        l: int = sum([
-            self.wall_length,
-            self.l_column.depth(self.direction()),
-            self.r_column.depth(self.direction()),
-        ])
-        t: int = self.wall_thickness
-        q: int = self.qds * (4.1 if self.direction() == "x" else 4.15)
         lop: float
         hop: float
         lop, hop = self.projected_opening()
-        psvft: float = self.vertical.ratio_by_strength(self.wall_thickness)
-        pshft: float = self.horizontal.ratio_by_strength(self.wall_thickness)
-        avoft: float = ss7_material.Main_Reinforcement(rv).area_by_strength()
-        ahoft: float = ss7_material.Main_Reinforcement(rh).area_by_strength()
-        avft: float = avoft + self.vertical.area_by_strength() * nrv
-        ahft: float = ahoft + self.horizontal.area_by_strength() * nrh
-        adft: float = ss7_material.Main_Reinforcement(rd).area_by_strength()
-        root: float = 2.0**0.5
-        td_allowable: float = (adft + (avft + ahft) / root) / 1e3
-        md_allowable: float = sum([
-            (l - lop) * (adft / root + avoft),
-            t * (l - lop) ** 2 / 4 / (nh + 1) * psvft,
-        ]) / 1e6
-        mb_allowable: float = sum([
-            (h - hop) * (adft / root + ahoft),
-            t * (h - hop) ** 2 / 4 / nv * pshft,
-        ]) / 1e6
         ho: float = self.openings[idx].height
         lo: float = self.openings[idx].width
-        td: float = (ho + lo) / 2 / root / l * q
-        md: float = ho / 2 * q / 1e3
-        mb: float = lo / 2 * h / l * q / 1e3
+        result: dict = self.opening_reinforcement(lop, hop, ho, lo, nv, nh, rv, rh, rd, nrv, nrh)
+        l: int = result["l"]
+        h: int = result["h"]
+        t: int = result["t"]
+        q: int = result["q"]
+        nrv = result["nrv"]
+        nrh = result["nrh"]
+        md_allowable: float = result["md_allowable"]
+        mb_allowable: float = result["mb_allowable"]
+        td_allowable: float = result["td_allowable"]
+        md: float = result["md"]
+        mb: float = result["mb"]
+        td: float = result["td"]
         print(f"## {self.key()} {idx} {lo:.0f}×{ho:.0f}")
         # print(f"v {rv:>6} {md < md_allowable} {f'{md:.0f}':>5} < {f'{md_allowable:.0f}':>5} {md / md_allowable:.2f}")
         # print(f"h {rh:>6} {mb < mb_allowable} {f'{mb:.0f}':>5} < {f'{mb_allowable:.0f}':>5} {mb / mb_allowable:.2f}")
@@ -438,49 +562,55 @@ class SS7_RC_Wall(SS7_Member_Between_Columns):
         print(f'|判定||{"OK" if md < md_allowable else "NG"}||{"OK" if mb < mb_allowable else "NG"}||{"OK" if td < td_allowable else "NG"}|')
         print("")
 
+    @ss7_tool.derived
     def projected_opening(self) -> tuple[float, float]:
-        def vectorize(array: np.ndarray) -> np.ndarray:
-            return np.array([array.tolist()]).T
-
-        lrbt: np.ndarray = np.array([[o.left, o.right, o.bottom, o.top] for o in filter(lambda o: not o.ignore, self.openings)])
-        l: np.ndarray = vectorize(lrbt[:, 0])
-        r: np.ndarray = vectorize(lrbt[:, 1])
-        b: np.ndarray = vectorize(lrbt[:, 2])
-        t: np.ndarray = vectorize(lrbt[:, 3])
-        w: float = self.span_center()
-        h: float = self.height_center()
-        num: int = 100000
-        x: np.ndarray = np.linspace(0, w, num)
-        y: np.ndarray = np.linspace(0, h, num)
+        """無視しない開口を壁の長さ・高さ方向に投影した長さ(l0p, h0p)"""
+        lrbt: np.ndarray = np.array(
+            [[o.left, o.right, o.bottom, o.top] for o in filter(lambda o: not o.ignore, self.openings)],
+            dtype=np.float64,
+        ).reshape(-1, 4)
         return (
-            np.sum(np.any((l <= x) * (x < r), axis=0)) / num * w,
-            np.sum(np.any((b <= y) * (y < t), axis=0)) / num * h
+            projected_length(lrbt[:, 0], lrbt[:, 1], self.span_center()),
+            projected_length(lrbt[:, 2], lrbt[:, 3], self.height_center()),
         )
 
-    def plot_wall(self) -> None:
+    def outlines(self) -> list[tuple[list[float], str, str]]:
+        """立面図に描く壁・開口の矩形を(絶対座標の[l, r, b, t], 色, 線種)の配列で返す"""
         ox: float = self.ss7_axis_and_floor.get_axis_location(self.l_axis)
         oy: float = self.ss7_axis_and_floor.get_floor_location(self.floor)
 
-        def plot_lrbt(lrbt: list[float], color: str = "tab:blue", linestyle="solid") -> None:
+        def absolute(lrbt: list[float]) -> list[float]:
             l: float
             r: float
             b: float
             t: float
             l, r, b, t = lrbt
-            lw: float = 0.8 if linestyle == "dotted" else 1.5
-            x: np.ndarray = np.array([l, r, r, l, l])
-            y: np.ndarray = np.array([b, b, t, t, b])
-            plt.plot(ox + x, oy + y, color=color, lw=lw, linestyle=linestyle)
+            return [ox + l, ox + r, oy + b, oy + t]
 
         w: float = self.span_inside()
         h: float = self.height_inside()
         x: float = (self.span_center() - w) / 2
-        plot_lrbt([0, self.span_center(), 0, self.height_center()], "tab:blue", "dotted")
-        plot_lrbt([x, w + x, 0, h], "tab:blue")
-        for o in self.openings:
-            owners: list[str] = ["建築", "設備", "電気", "プラント"]
-            color: str = ss7_material.colors(owners.index(o.owner) + 1) if o.owner in owners else "black"
-            plot_lrbt([o.left, o.right, o.bottom, o.top], color, "dotted" if o.ignore else "solid")
+        owners: list[str] = ["建築", "設備", "電気", "プラント"]
+        return [
+            (absolute([0, self.span_center(), 0, self.height_center()]), "tab:blue", "dotted"),
+            (absolute([x, w + x, 0, h]), "tab:blue", "solid"),
+        ] + [
+            (
+                absolute([o.left, o.right, o.bottom, o.top]),
+                f"C{owners.index(o.owner) + 1}" if o.owner in owners else "black",
+                "dotted" if o.ignore else "solid",
+            ) for o in self.openings
+        ]
+
+    def plot_wall(self) -> None:
+        for lrbt, color, linestyle in self.outlines():
+            l: float
+            r: float
+            b: float
+            t: float
+            l, r, b, t = lrbt
+            lw: float = 0.8 if linestyle == "dotted" else 1.5
+            plt.plot([l, r, r, l, l], [b, b, t, t, b], color=color, lw=lw, linestyle=linestyle)
 
     def show_wall(self) -> None:
         fig: plt.Figure
@@ -0,0 +1,97 @@
+from bisect import bisect_left, bisect_right
+from typing import Generic, Iterable, TypeVar
+from .ss7_axis_and_floor import SS7_Axis_and_Floor
+
+
+T = TypeVar("T")
+
+
+class SS7_Span_Index(Generic[T]):
+    """スパン(左軸-右軸)を持つ部材を、(階, フレーム)ごとに左軸の順に並べた索引
+
+    - inside: あるスパンの中に納まる部材(壁の中の開口、連スパン耐震壁の中の耐震壁)
+    - containing: あるスパンを含む部材
+
+    を、全ての部材と比べることなく二分探索で求める。結果は与えた部材の順に並べる。
+
+    Example:
+        >>> index = SS7_Span_Index(openings, axis_and_floor)
+        >>> index.inside(wall)
+    """
+    axis_and_floor: SS7_Axis_and_Floor
+    lefts: dict[tuple[str, str], list[int]]
+    rights: dict[tuple[str, str], list[int]]
+    reaches: dict[tuple[str, str], list[int]]
+    positions: dict[tuple[str, str], list[int]]
+    members: dict[tuple[str, str], list[T]]
+
+    def __init__(self, members: Iterable[T], axis_and_floor: SS7_Axis_and_Floor) -> None:
+        """
+        Args:
+            - members: floor, frame, l_axis, r_axisを持つ部材
+            - axis_and_floor: 軸の順序を与えるSS7_Axis_and_Floor
+        """
+        self.axis_and_floor = axis_and_floor
+        spans: dict[tuple[str, str], list[tuple[int, int, int, T]]] = {}
+        for position, member in enumerate(members):
+            spans.setdefault((member.floor, member.frame), []).append((
+                axis_and_floor.get_axis_index(member.l_axis),
+                axis_and_floor.get_axis_index(member.r_axis),
+                position,
+                member,
+            ))
+        self.lefts = {}
+        self.rights = {}
+        self.reaches = {}
+        self.positions = {}
+        self.members = {}
+        for key, span in spans.items():
+            span.sort(key=lambda s: (s[0], s[2]))
+            self.lefts[key] = [s[0] for s in span]
+            self.rights[key] = [s[1] for s in span]
+            self.positions[key] = [s[2] for s in span]
+            self.members[key] = [s[3] for s in span]
+            # reaches[i]: 0~i番目の部材の右軸の最大値。containingで遡る範囲を打ち切るために使う
+            reach: int = -1
+            self.reaches[key] = []
+            for right in self.rights[key]:
+                reach = max(reach, right)
+                self.reaches[key].append(reach)
+
+    def span_of(self, member) -> tuple[tuple[str, str], int, int]:
+        return (
+            (member.floor, member.frame),
+            self.axis_and_floor.get_axis_index(member.l_axis),
+            self.axis_and_floor.get_axis_index(member.r_axis),
+        )
+
+    def inside(self, member) -> list[T]:
+        """memberのスパンの中に納まる部材を返す"""
+        key: tuple[str, str]
+        left: int
+        right: int
+        key, left, right = self.span_of(member)
+        if key not in self.lefts:
+            return []
+        lefts: list[int] = self.lefts[key]
+        found: list[int] = [
+            i for i in range(bisect_left(lefts, left), bisect_right(lefts, right))
+            if self.rights[key][i] <= right
+        ]
+        return [self.members[key][i] for i in sorted(found, key=lambda i: self.positions[key][i])]
+
+    def containing(self, member) -> list[T]:
+        """memberのスパンを含む部材を返す"""
+        key: tuple[str, str]
+        left: int
+        right: int
+        key, left, right = self.span_of(member)
+        if key not in self.lefts:
+            return []
+        found: list[int] = []
+        i: int = bisect_right(self.lefts[key], left) - 1
+        while i >= 0 and self.reaches[key][i] >= right:
+            if self.rights[key][i] >= right:
+                found.append(i)
+            i -= 1
+        return [self.members[key][i] for i in sorted(found, key=lambda i: self.positions[key][i])]
@@ -1,2 +1,7 @@
 from .tool import *
 from .text import *
+from .store import *
+from .profile import *
+from .load_case import *
+from .category import *
+from .dependency import *
@@ -0,0 +1,52 @@
+class Categories:
+    """階名・軸名と小さな整数(コード)の対応表
+
+    - 1つのモデル(入力・出力ファイルの組)で1つを共有する
+    - 表の結合や索引には、階・軸のコードを並べたタプル(pack)を使う
+    - 同じ名前の文字列は1つのオブジェクトを共有し(intern)、表示にだけ使う
+
+    Example:
+        >>> categories = Categories({"floor": ["2", "1"], "axis": ["A", "B", "1", "2"]})
+        >>> categories.pack("1", "A", "1", "2")
+        (1, 0, 2, 3)
+        >>> categories.unpack((1, 0, 2, 3))
+        ('1', 'A', '1', '2')
+    """
+    KINDS: list[str] = ["floor", "axis"]
+
+    codes: dict[str, dict[str, int]]
+    names: dict[str, list[str]]
+
+    def __init__(self, names: dict[str, list[str]] | None = None) -> None:
+        """
+        Args:
+            - names: {"floor": 階名の配列, "axis": 軸名の配列}。この順のコードを割り当てる
+        """
+        self.codes = {kind: {} for kind in self.KINDS}
+        self.names = {kind: [] for kind in self.KINDS}
+        for kind, values in (names or {}).items():
+            for value in values:
+                self.code(kind, value)
+
+    def code(self, kind: str, name: str) -> int:
+        """nameのコードを返す。初めての名前には新しいコードを割り当てる"""
+        codes: dict[str, int] = self.codes[kind]
+        if name not in codes:
+            codes[name] = len(self.names[kind])
+            self.names[kind].append(name)
+        return codes[name]
+
+    def name(self, kind: str, code: int) -> str:
+        return self.names[kind][code]
+
+    def intern(self, kind: str, name: str) -> str:
+        """nameと等しい、共有の文字列を返す"""
+        return self.names[kind][self.code(kind, name)]
+
+    def pack(self, floor: str, *axes: str) -> tuple[int, ...]:
+        """(階, フレーム・軸, ...)をコードのタプルにする"""
+        return (self.code("floor", floor),) + tuple([self.code("axis", axis) for axis in axes])
+
+    def unpack(self, key: tuple[int, ...]) -> tuple[str, ...]:
+        """packの逆。表示用の名前のタプルを返す"""
+        return (self.name("floor", key[0]),) + tuple([self.name("axis", code) for code in key[1:]])
@@ -0,0 +1,117 @@
+import functools
+import threading
+import weakref
+from typing import Any, Callable
+
+
+class Dependency_Graph:
+    """部材どうしの依存関係と、部材の派生量(derivedで修飾したメソッドの戻り値)のキャッシュ
+
+    - 派生量は部材ごとに(メソッド名, 引数)をキーとして覚える。載荷ケースは引数で渡す
+    - 派生量の計算中に他の部材の派生量を読むと、その部材に依存すると記録する
+    - 計算を経ずに読む関連(壁の開口・柱、連スパン壁の壁)は、dependで明示する
+    - 部材の属性を変えると(SS7_Member_Base.__setattr__)、その部材と、依存する部材のキャッシュを消す
+
+    無効(enabled = False)のときは派生量を覚えず、毎回計算する。
+
+    Example:
+        >>> ss7_tool.dependencies.enabled = True
+        >>> strengths = [w.over_loads(w.jinsei_ultimate_strength) for w in walls]
+        >>> walls[0].update_openings([1000, 1000, 500, 500, 1])    # walls[0]と、それを含む連スパン壁のキャッシュだけを消す
+        >>> ss7_tool.dependencies.stale
+    """
+    enabled: bool
+    values: weakref.WeakKeyDictionary
+    dependents: weakref.WeakKeyDictionary
+    stale: weakref.WeakSet
+    local: threading.local
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.values = weakref.WeakKeyDictionary()
+        self.dependents = weakref.WeakKeyDictionary()
+        self.stale = weakref.WeakSet()
+        self.local = threading.local()
+
+    def stack(self) -> list:
+        """このスレッドで計算中の部材"""
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        return self.local.stack
+
+    def depend(self, member: Any, *others: Any) -> None:
+        """memberがothersに依存すると記録する"""
+        for other in others:
+            if other is not member:
+                if other not in self.dependents:
+                    self.dependents[other] = weakref.WeakSet()
+                self.dependents[other].add(member)
+
+    def affected(self, member: Any) -> list:
+        """memberと、memberに(間接的に)依存する部材"""
+        found: dict[int, Any] = {id(member): member}
+        stack: list = [member]
+        while len(stack) > 0:
+            for dependent in self.dependents.get(stack.pop(), []):
+                if id(dependent) not in found:
+                    found[id(dependent)] = dependent
+                    stack.append(dependent)
+        return list(found.values())
+
+    def invalidate(self, member: Any) -> list:
+        """memberと、依存する部材のキャッシュを消し、キャッシュを消した部材を返す
+
+        消した部材はstaleにも加える。再計算したらstaleから除く。
+        """
+        if len(self.values) == 0:
+            return []
+        invalidated: list = []
+        for affected in self.affected(member):
+            if self.values.pop(affected, None) is not None:
+                invalidated.append(affected)
+                self.stale.add(affected)
+        return invalidated
+
+    def clear(self) -> None:
+        self.values.clear()
+        self.stale.clear()
+
+    def cached(self, member: Any, key: tuple, func: Callable[[], Any]) -> Any:
+        """memberのkeyの派生量を返す。なければfunc()で計算して覚える"""
+        stack: list = self.stack()
+        if len(stack) > 0:
+            self.depend(stack[-1], member)
+        if member not in self.values:
+            self.values[member] = {}
+        values: dict[tuple, Any] = self.values[member]
+        if key in values:
+            return values[key]
+        stack.append(member)
+        try:
+            value: Any = func()
+        finally:
+            stack.pop()
+        values[key] = value
+        self.stale.discard(member)
+        return value
+
+
+dependencies: Dependency_Graph = Dependency_Graph()
+
+
+def derived(func: Callable) -> Callable:
+    """部材のメソッドの戻り値を、dependenciesが有効なときに覚えるデコレータ
+
+    キャッシュのキーは(メソッド名, 引数)で、引数はハッシュ可能でなければならない。
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs) -> Any:
+        if not dependencies.enabled:
+            return func(self, *args, **kwargs)
+        key: tuple = (
+            func.__name__,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        return dependencies.cached(self, key, lambda: func(self, *args, **kwargs))
+    return wrapper
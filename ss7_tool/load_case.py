@@ -0,0 +1,85 @@
+import re
+
+
+class LoadCase:
+    """載荷ケース(G+P, EX+, DSX-, QUY+低減等)と整数の添字の対応表
+
+    添字は登録した順で、一度登録した載荷ケースの添字は変わらない。
+    各部材の応力は、この添字を軸とする配列として扱える。
+
+    Example:
+        >>> LoadCase.index("DSX-")
+        6
+        >>> LoadCase.key(6)
+        'dsxm'
+        >>> LoadCase.design(direction="y", towards="+")
+        7
+    """
+    names: list[str] = []
+    keys: list[str] = []
+    indices: dict[str, int] = {}
+
+    @classmethod
+    def register(cls, name: str) -> int:
+        """nameを登録して添字を返す。登録済みなら既存の添字を返す"""
+        if name not in cls.indices:
+            cls.indices[name] = len(cls.names)
+            cls.indices[load_key(name)] = len(cls.names)
+            cls.names.append(name)
+            cls.keys.append(load_key(name))
+        return cls.indices[name]
+
+    @classmethod
+    def register_all(cls, names: list[str]) -> list[int]:
+        return [cls.register(name) for name in names]
+
+    @classmethod
+    def index(cls, load: str | int) -> int:
+        """載荷ケース名(DSX+)もしくはキー(dsxp)の添字を返す。未登録の載荷ケース名は登録する"""
+        if type(load) is int:
+            return load
+        if load not in cls.indices:
+            if not re.fullmatch("G\\+P|[A-Z]+[+-](低減)?", load):
+                raise KeyError(load)
+            return cls.register(load)
+        return cls.indices[load]
+
+    @classmethod
+    def name(cls, index: int) -> str:
+        return cls.names[index]
+
+    @classmethod
+    def key(cls, load: str | int) -> str:
+        """載荷ケースの、フィールド名に使うキー(dsxp等)を返す"""
+        return cls.keys[cls.index(load)]
+
+    @classmethod
+    def size(cls) -> int:
+        return len(cls.names)
+
+    @classmethod
+    def design(cls, direction: str, towards: str) -> int:
+        """方向("x", "y")と向き("+", "-")に対応する二次設計用の載荷ケース(DSX+等)の添字を返す"""
+        if direction not in ["x", "y"] or towards not in ["+", "-"]:
+            raise ValueError(f"load_key: {direction}{towards}")
+        return cls.index(f"DS{direction.upper()}{towards}")
+
+
+def load_key(load: str) -> str:
+    """載荷ケース名をフィールド名に使うキーに変換する
+
+        - G+P   -> gpp
+        - DSX-  -> dsxm
+        - QUX+低減 -> quxp_reduced
+    """
+    return load.replace("+", "p").replace("-", "m").replace("低減", "_reduced").lower()
+
+
+LOAD_CASES: list[str] = [
+    "G+P",
+    "EX+", "EX-", "EY+", "EY-",
+    "DSX+", "DSX-", "DSY+", "DSY-",
+    "QUX+", "QUX-", "QUY+", "QUY-",
+    "QUX+低減", "QUX-低減", "QUY+低減", "QUY-低減",
+]
+LoadCase.register_all(LOAD_CASES)
@@ -0,0 +1,100 @@
+import os
+import json
+import time
+import functools
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+
+class Profiler:
+    """処理の段階ごとの所要時間・呼び出し回数・件数を集計する
+
+    環境変数SS7_PROFILEが空でなければ最初から有効。無効のときは何も記録しない。
+    """
+    enabled: bool
+    records: dict[str, dict[str, float]]
+
+    def __init__(self) -> None:
+        self.enabled = os.environ.get("SS7_PROFILE", "") not in ["", "0"]
+        self.records = {}
+
+    def record(self, name: str) -> dict[str, float]:
+        if name not in self.records:
+            self.records[name] = {"calls": 0, "seconds": 0.0}
+        return self.records[name]
+
+    def add(self, name: str, key: str, value: float = 1) -> None:
+        record: dict[str, float] = self.record(name)
+        record[key] = record.get(key, 0) + value
+
+    def reset(self) -> None:
+        self.records = {}
+
+
+profiler: Profiler = Profiler()
+
+
+def stage(name: str) -> Callable:
+    """関数の所要時間と呼び出し回数をnameの段階として記録するデコレータ
+
+    戻り値が配列なら、その要素数を"rows"に加える。
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            start: float = time.perf_counter()
+            result: Any = func(*args, **kwargs)
+            record: dict[str, float] = profiler.record(name)
+            record["seconds"] += time.perf_counter() - start
+            record["calls"] += 1
+            if isinstance(result, list):
+                record["rows"] = record.get("rows", 0) + len(result)
+            return result
+        return wrapper
+    return decorator
+
+
+def count(name: str, key: str, value: float = 1) -> None:
+    """nameの段階のkey(キャッシュのhits, misses, 読んだsections等)にvalueを加える"""
+    if profiler.enabled:
+        profiler.add(name, key, value)
+
+
+@contextmanager
+def profiling(reset: bool = True) -> Iterator[Profiler]:
+    """with文の中だけ計測を有効にする
+
+    Example:
+        >>> with ss7_tool.profiling():
+        ...     io = ss7_io.SS7_IO("input.csv", "output.csv")
+        ...     walls = io.walls()
+        >>> ss7_tool.dump_stats("stats.json")
+    """
+    enabled: bool = profiler.enabled
+    if reset:
+        profiler.reset()
+    profiler.enabled = True
+    try:
+        yield profiler
+    finally:
+        profiler.enabled = enabled
+
+
+def stats() -> dict[str, dict[str, float]]:
+    """段階ごとの集計を、所要時間の長い順に返す"""
+    return {
+        name: dict(record) for name, record in sorted(
+            profiler.records.items(), key=lambda item: -item[1]["seconds"]
+        )
+    }
+
+
+def dump_stats(filename: str | None = None) -> str:
+    """stats()をJSONの文字列で返す。filenameを与えるとファイルにも書き出す"""
+    text: str = json.dumps(stats(), ensure_ascii=False, indent=2)
+    if filename is not None:
+        with open(filename, "w", encoding="utf-8") as fp:
+            fp.write(text)
+    return text
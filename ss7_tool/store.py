@@ -0,0 +1,276 @@
+import numpy as np
+from typing import Any, Callable
+from .profile import stage
+from .load_case import LoadCase
+
+
+class Store_Row:
+    """Member_Storeの1行を辞書のように読むためのオブジェクト
+    """
+    store: "Member_Store"
+    index: int
+
+    def __init__(self, store: "Member_Store", index: int) -> None:
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, key: str) -> Any:
+        if not self.store.has(key, self.index):
+            raise KeyError(key)
+        return self.store.get(key, self.index)
+
+    def __contains__(self, key: str) -> bool:
+        return self.store.has(key, self.index)
+
+    def keys(self) -> list[str]:
+        self.store.resolve_all()
+        return [key for key in self.store.columns if self.store.has(key, self.index)]
+
+
+class Lazy_Source:
+    """Member_Storeに後から結合する表。最初にいずれかのフィールドを読むときにloader()で読む
+    """
+    fields: list[str]
+    loader: Callable[[], list[dict]]
+
+    def __init__(self, fields: list[str], loader: Callable[[], list[dict]]) -> None:
+        self.fields = fields
+        self.loader = loader
+
+
+class Member_Store:
+    """同じ型の部材のフィールドを、フィールドごとに1つのnp.ndarrayで持つストア
+
+    - 全て数値のフィールドはint64もしくはfloat64の配列、それ以外はobjectの配列で持つ
+    - 一部の部材にしかないフィールドは、有無をbool配列(present)で持つ
+    - 数値の列に数値でない値を代入した行は、列を変えずに{フィールド: {行番号: 値}}(overrides)に持つ
+    - members()で作る部材は行番号だけを持つ代理オブジェクトで、フィールドの読み書きはストアの配列に対して行う
+    - 部材クラスのSHAREDの属性(軸・階の情報等)は、全ての部材に共通の値としてストアに1つだけ持つ(shared)
+    - lazyで登録した表は、そのフィールドを最初に読むときに行のキーで結合する(merge_list_of_dictと同じく左結合)
+
+    Example:
+        >>> store = Member_Store(output.read("柱部材断面情報"), lambda d: (d["floor"], d["x_axis"], d["y_axis"]))
+        >>> store.lazy(["dsxp_n_c_top", "dsxp_n_c_bottom"], lambda: output.read("柱応力表(危険断面位置) DSX+"))
+        >>> store.members(SS7_RC_Column, axis_and_floor)[0].dsxp_n_c_bottom    # ここで初めて読む
+    """
+    size: int
+    columns: dict[str, np.ndarray]
+    present: dict[str, np.ndarray]
+    overrides: dict[str, dict[int, Any]]
+    proxy_classes: dict[type, type]
+    shared: dict[str, Any]
+    load_cache: dict[str, np.ndarray]
+    key_lambda: Callable | None
+    row_keys: list
+    sources: dict[str, Lazy_Source]
+    pending: list[Lazy_Source]
+
+    def __init__(self, list_of_dict: list[dict], key_lambda: Callable | None = None) -> None:
+        """
+        Args:
+            - list_of_dict: 各行のフィールド
+            - key_lambda: 行のキー。lazyで表を結合する場合に与える
+        """
+        self.size = len(list_of_dict)
+        self.columns = {}
+        self.present = {}
+        self.overrides = {}
+        self.proxy_classes = {}
+        self.shared = {}
+        self.load_cache = {}
+        self.key_lambda = key_lambda
+        self.row_keys = [key_lambda(d) for d in list_of_dict] if key_lambda is not None else []
+        self.sources = {}
+        self.pending = []
+        self.add_columns(list_of_dict)
+
+    def add_columns(self, list_of_dict: list[dict]) -> None:
+        """行ごとのフィールドを列にして加える。既にあるフィールドは変えない"""
+        keys: list[str] = list(dict.fromkeys(key for d in list_of_dict for key in d if key not in self.columns))
+        for key in keys:
+            values: list = [d[key] if key in d else None for d in list_of_dict]
+            if any([key not in d for d in list_of_dict]):
+                self.present[key] = np.array([key in d for d in list_of_dict], dtype=bool)
+            self.columns[key] = column_of(values)
+
+    def lazy(self, fields: list[str], loader: Callable[[], list[dict]]) -> None:
+        """loader()の表を、fieldsのいずれかを最初に読むときに結合するよう登録する
+
+        既にあるフィールドは登録しない。表のfields以外のフィールドも、結合したときに加える。
+        """
+        if self.key_lambda is None:
+            raise ValueError("Member_Store.lazy: key_lambdaがありません")
+        fields = [field for field in fields if field not in self.columns and field not in self.sources]
+        if len(fields) == 0:
+            return
+        source: Lazy_Source = Lazy_Source(fields, loader)
+        self.pending.append(source)
+        for field in fields:
+            self.sources[field] = source
+        self.load_cache.clear()
+
+    @stage("Member_Store.resolve")
+    def resolve(self, key: str) -> bool:
+        """keyが未結合の表のフィールドなら、その表を結合する。結合したらTrue"""
+        source: Lazy_Source | None = self.sources.get(key)
+        if source is None:
+            return False
+        for field in source.fields:
+            del self.sources[field]
+        self.pending.remove(source)
+        index: dict = {}
+        table: list[dict] = source.loader()
+        for d in table:
+            index.setdefault(self.key_lambda(d), d)
+        self.add_columns([index.get(row_key, {}) for row_key in self.row_keys])
+        self.load_cache.clear()
+        return True
+
+    def resolve_all(self) -> None:
+        """未結合の表を全て結合する"""
+        while len(self.pending) > 0:
+            self.resolve(self.pending[0].fields[0])
+
+    def has(self, key: str, index: int) -> bool:
+        if key in self.sources:
+            self.resolve(key)
+        return key in self.columns and (key not in self.present or bool(self.present[key][index]))
+
+    def get(self, key: str, index: int) -> Any:
+        if key in self.overrides and index in self.overrides[key]:
+            return self.overrides[key][index]
+        column: np.ndarray = self.columns[key]
+        return column[index] if column.dtype == object else column[index].item()
+
+    def set(self, key: str, index: int, value: Any) -> None:
+        """keyの列のindex行にvalueを代入する。数値の列に数値でない値を代入した場合は、列をobjectにせずoverridesに持つ"""
+        if key not in self.columns:
+            self.columns[key] = np.full(self.size, None, dtype=object)
+            self.present[key] = np.zeros(self.size, dtype=bool)
+        column: np.ndarray = self.columns[key]
+        if column.dtype != object and type(value) not in [int, float, np.int64, np.float64]:
+            self.overrides.setdefault(key, {})[index] = value
+            column[index] = np.nan if column.dtype.kind == "f" else 0
+        else:
+            if key in self.overrides:
+                self.overrides[key].pop(index, None)
+            if column.dtype.kind == "i" and type(value) in [float, np.float64]:
+                column = self.columns[key] = column.astype(np.float64)
+            column[index] = value
+        if key in self.present:
+            self.present[key][index] = True
+        self.load_cache.clear()
+
+    def load_columns(self, component: str) -> np.ndarray:
+        """<載荷ケースのキー>_<component>のフィールドを、(部材, LoadCaseの添字)のfloat64配列にまとめて返す
+
+        ない載荷ケース・数値でない値(overridesの値を含む)はnanとする。
+        """
+        if component not in self.load_cache or self.load_cache[component].shape[1] != LoadCase.size():
+            for key in LoadCase.keys:
+                if f"{key}_{component}" in self.sources:
+                    self.resolve(f"{key}_{component}")
+            result: np.ndarray = np.full((self.size, LoadCase.size()), np.nan)
+            for i, key in enumerate(LoadCase.keys):
+                column: np.ndarray | None = self.columns.get(f"{key}_{component}")
+                if column is not None and column.dtype != object:
+                    result[:, i] = column
+                    if f"{key}_{component}" in self.present:
+                        result[~self.present[f"{key}_{component}"], i] = np.nan
+                    result[list(self.overrides.get(f"{key}_{component}", {})), i] = np.nan
+            self.load_cache[component] = result
+        return self.load_cache[component]
+
+    def row(self, index: int) -> Store_Row:
+        return Store_Row(self, index)
+
+    def proxy_class(self, member_class: type) -> type:
+        """member_classの各フィールドをストアの配列に読み書きするプロパティに置き換えた派生クラスを返す
+
+        ストアにない行のフィールドは、member_classのクラス属性にフォールバックする。
+        lazyで登録したフィールドもプロパティにし、最初に読むときに表を結合する。
+        member_class.SHAREDの属性は、sharedに読み書きするプロパティにする。
+        """
+        if member_class in self.proxy_classes:
+            return self.proxy_classes[member_class]
+
+        def field(key: str) -> property:
+            def getter(member: Store_Proxy) -> Any:
+                if member._store.has(key, member._index):
+                    return member._store.get(key, member._index)
+                return getattr(super(proxy, member), key)
+
+            def setter(member: Store_Proxy, value: Any) -> None:
+                member._store.set(key, member._index, value)
+            return property(getter, setter)
+
+        def shared(key: str) -> property:
+            def getter(member: Store_Proxy) -> Any:
+                if key in member._store.shared:
+                    return member._store.shared[key]
+                return getattr(super(proxy, member), key)
+
+            def setter(member: Store_Proxy, value: Any) -> None:
+                member._store.shared[key] = value
+            return property(getter, setter)
+
+        proxy: type = type(member_class.__name__, (Store_Proxy, member_class), {
+            "__slots__": (),
+            "__qualname__": member_class.__qualname__,
+            "__module__": member_class.__module__,
+            "_store": self,
+            "_member_class": member_class,
+        } | {key: field(key) for key in list(self.columns) + list(self.sources)} | {
+            key: shared(key) for key in getattr(member_class, "SHARED", [])
+        })
+        self.proxy_classes[member_class] = proxy
+        return proxy
+
+    @stage("Member_Store.members")
+    def members(self, member_class: type, *args) -> list:
+        """各行をmember_class(row, *args)で部材にした配列を返す"""
+        proxy: type = self.proxy_class(member_class)
+        return [proxy(self.row(i), *args) for i in range(self.size)]
+
+
+class Store_Proxy:
+    """Member_Storeの1行を指す部材の代理オブジェクトの基底クラス
+
+    インスタンスは行番号(_index)のみを持ち、ストアにない部材ごとの属性(柱や開口との関連など)は__dict__に持つ。
+    """
+    __slots__ = ("_index",)
+    _store: Member_Store
+    _member_class: type
+
+    def __getattr__(self, name: str) -> Any:
+        # プロパティにないフィールド(プロキシを作った後に登録した表等)。nameをfieldsに持つ表だけを結合する
+        # 見つからなくても他の表は結合しない(hasattrやforceの失敗で全ての表を読まない)
+        store: Member_Store = type(self)._store
+        if not name.startswith("_") and store.has(name, self._index):
+            return store.get(name, self._index)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __reduce__(self) -> tuple:
+        state: dict = {key: self._store.get(key, self._index) for key in self._store.row(self._index).keys()}
+        return (unstore, (self._member_class, state | self._store.shared | self.__dict__))
+
+
+def unstore(member_class: type, state: dict) -> Any:
+    """ストアから切り離した、通常の属性を持つmember_classのインスタンスを作る"""
+    member: Any = member_class.__new__(member_class)
+    member.__dict__.update(state)
+    return member
+
+
+def column_of(values: list) -> np.ndarray:
+    """値の配列を、数値ならint64もしくはfloat64、それ以外はobjectの配列に直す"""
+    found: list = [v for v in values if v is not None]
+    types: set[type] = set([type(v) for v in found])
+    if len(found) > 0 and types <= {int}:
+        return np.array([0 if v is None else v for v in values], dtype=np.int64)
+    elif len(found) > 0 and types <= {int, float}:
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    column: np.ndarray = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        column[i] = v
+    return column
@@ -1,6 +1,11 @@
 import io
+import os
 import csv
+import codecs
+import time
 import numpy as np
+from typing import Iterator
+from .profile import count
 
 
 def replace(text: str, patterns: list[tuple[str, str]]) -> str:
@@ -181,3 +186,76 @@ def read_text(filename: str, encoding: str = "cp932") -> "String":
     """
     with open(filename, "r", encoding=encoding) as fp:
         return String(fp.read())
+
+
+def read_sections(
+    filename: str,
+    delimiter: str = "name=",
+    replacements: list[tuple[str, str]] = [("－", "-"), ("靱", "靭")],
+    encoding: str = "cp932",
+    chunk_size: int = 1 << 20,
+) -> Iterator[tuple["String", int, int]]:
+    """<filename>をchunk_sizeバイトずつ復号し、<delimiter>で区切った文字列を順に返す。
+
+    read_text(filename).multiple_replace(...).stripsplit(delimiter)と同じ文字列を、
+    ファイル全体を読み込むことなく1区切りずつ返す。
+
+    Args:
+        filename (str): ファイルのパス
+        delimiter (str): 区切り文字列
+        replacements (list[tuple[str, str]]): 復号したチャンクごとに行う置換(1文字同士に限る)
+        encoding (str): 文字コード
+        chunk_size (int): 1度に読むバイト数
+
+    Yields:
+        (区切った文字列, 読んだバイト数, ファイルのバイト数)
+
+    ファイルの読み込みと復号・置換の時間は"read_text"の段階として記録する(区切った文字列の処理の時間は含めない)。
+    """
+    total: int = os.path.getsize(filename)
+    decoder: io.IncrementalNewlineDecoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(), translate=True
+    )
+    # 区切りの見つかっていない文字列はチャンクごとに配列に溜め、区切りを見つけたときに1度だけ結合する
+    pending: list[str] = []
+    # 溜めた文字列の末尾(区切りの長さ-1文字)。チャンクをまたぐ区切りを探すのに使う
+    keep: int = len(delimiter) - 1
+    tail: str = ""
+    buffer: str = ""
+    first: bool = True
+    position: int = 0
+    count("read_text", "calls")
+    with open(filename, "rb") as fp:
+        while True:
+            decode_start: float = time.perf_counter()
+            chunk: bytes = fp.read(chunk_size)
+            position += len(chunk)
+            text: str = replace(decoder.decode(chunk, final=len(chunk) == 0), replacements)
+            count("read_text", "seconds", time.perf_counter() - decode_start)
+            count("read_text", "bytes", len(chunk))
+            probe: str = tail + text
+            if probe.find(delimiter) < 0:
+                pending.append(text)
+                tail = probe[max(0, len(probe) - keep):]
+                if len(chunk) == 0:
+                    break
+                continue
+            # 前のチャンクまでに区切りがないことは分かっているので、新たに読んだ部分の近くから探す
+            pending.append(text)
+            buffer = "".join(pending)
+            begin: int = 0
+            end: int = buffer.find(delimiter, len(buffer) - len(probe))
+            while end >= 0:
+                if not (first and end == 0):
+                    yield (String(buffer[begin:end]), position, total)
+                first = False
+                begin = end + len(delimiter)
+                end = buffer.find(delimiter, begin)
+            buffer = buffer[begin:]
+            pending = [buffer]
+            tail = buffer[max(0, len(buffer) - keep):]
+            if len(chunk) == 0:
+                break
+    buffer = "".join(pending)
+    if buffer != "" or first:
+        yield (String(buffer), position, total)
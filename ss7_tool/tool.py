@@ -1,10 +1,16 @@
 import numpy as np
 import matplotlib_fontja    # NOQA
 from typing import Callable, Iterable
+from .store import Store_Row
+from .profile import stage
 
 
 class BaseClass:
     def __init__(self, dictionary: dict) -> None:
+        if isinstance(dictionary, Store_Row):
+            # Member_Storeの代理オブジェクトは行番号のみを持ち、フィールドはストアから読む
+            self._index = dictionary.index
+            return
         for key in dictionary:
             setattr(self, key, dictionary[key])
 
@@ -63,15 +69,19 @@ class Dict(dict):
 
 class List_of_Dict(list[Dict]):
     key_lambda: Callable
+    positions: dict
 
     def __init__(self, content: list[dict], key_lambda: Callable) -> None:
         super().__init__([Dict(d, key_lambda) for d in content])
         self.key_lambda = key_lambda
-
-    def get(self, key: str) -> Dict:
-        for d in self:
-            if d.key() == key:
-                return d
+        # key -> 最初にそのkeyを持つ要素の位置。getを線形探索にしないため
+        self.positions = {}
+        for i, d in enumerate(self):
+            self.positions.setdefault(d.key(), i)
+
+    def get(self, key: str | tuple) -> Dict:
+        if key in self.positions:
+            return self[self.positions[key]]
         return {}
 
     def keys(self) -> list[str]:
@@ -85,8 +95,49 @@ class List_of_Dict(list[Dict]):
         )
 
 
+@stage("merge_list_of_dict")
 def merge_list_of_dict(list_of_list_of_dict: list[list[dict]], key_lambda: Callable) -> List_of_Dict:
     result: List_of_Dict = List_of_Dict(list_of_list_of_dict[0], key_lambda)
     for other in list_of_list_of_dict[1:]:
         result.merge(other)
     return result
+
+
+def flatten_dict(dictionary: dict) -> dict:
+    """タプル・リストの値を<key>_0, <key>_1, ...の値に展開した辞書を返す"""
+    result: dict = {}
+    for key, value in dictionary.items():
+        if type(value) in [tuple, list]:
+            for i, v in enumerate(value):
+                result[f"{key}_{i}"] = v
+        else:
+            result[key] = value
+    return result
+
+
+def to_columns(list_of_dict: list[dict]) -> dict[str, np.ndarray]:
+    """辞書の配列を、型付きの列(np.ndarray)の辞書に直す
+
+    - 全て真偽値の列はbool
+    - 全て整数の列はint64(欠損があればfloat64)
+    - 全て数値の列はfloat64(欠損はnan)
+    - それ以外は文字列(欠損は空文字列)
+    """
+    rows: list[dict] = [flatten_dict(d) for d in list_of_dict]
+    keys: list[str] = list(dict.fromkeys(key for d in rows for key in d))
+    columns: dict[str, np.ndarray] = {}
+    for key in keys:
+        values: list = [d.get(key) for d in rows]
+        found: list = [v for v in values if v is not None]
+        types: set[type] = set([type(v) for v in found])
+        if len(found) > 0 and types <= {bool, np.bool_}:
+            columns[key] = np.array(values, dtype=bool) if len(found) == len(values) else np.array(
+                [np.nan if v is None else float(v) for v in values], dtype=np.float64
+            )
+        elif len(found) > 0 and len(found) == len(values) and types <= {int, np.int64}:
+            columns[key] = np.array(values, dtype=np.int64)
+        elif len(found) > 0 and types <= {int, float, np.int64, np.float64}:
+            columns[key] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        else:
+            columns[key] = np.array(["" if v is None else str(v) for v in values], dtype=str)
+    return columns